@@ -0,0 +1,177 @@
+"""
+ASGI load: arender_component() against wrapping render_component() in sync_to_async by hand.
+
+Drives Django's ASGIHandler directly with many concurrent requests. Each view renders one component
+with three slow async data sources (e.g. cached API calls); the hand-written view awaits them one
+after another, as views typically do, while arender_component resolves them concurrently.
+
+The "blocking" scenario also passes a callable that blocks while the template renders, like a lazy
+queryset evaluated in the template, to compare the default render thread with a bounded
+COTTON_ASYNC_RENDER_WORKERS pool.
+
+    python -m benchmarks.bench_async
+"""
+
+import asyncio
+import time
+from statistics import mean, median
+
+from benchmarks.utils import configure_django
+
+SLOW_SOURCE_SECONDS = 0.005
+BLOCKING_LOOKUP_SECONDS = 0.01
+
+
+async def slow_source(value):
+    await asyncio.sleep(SLOW_SOURCE_SECONDS)
+    return value
+
+
+def blocking_lookup():
+    time.sleep(BLOCKING_LOOKUP_SECONDS)
+    return "active"
+
+
+def row_attrs(request):
+    return {"status": blocking_lookup} if "blocking" in request.GET else {}
+
+
+async def sync_helper_view(request):
+    from asgiref.sync import sync_to_async
+    from django.http import HttpResponse
+
+    from django_cotton import render_component
+
+    name = await slow_source("User")
+    email = await slow_source("user@example.com")
+    team = await slow_source("Core")
+    html = await sync_to_async(render_component)(
+        request,
+        "benchmarks.row",
+        {"name": name, "email": email, "team": team, **row_attrs(request)},
+    )
+    return HttpResponse(html)
+
+
+async def async_helper_view(request):
+    from django.http import HttpResponse
+
+    from django_cotton import arender_component
+
+    html = await arender_component(
+        request,
+        "benchmarks.row",
+        {
+            "name": slow_source("User"),
+            "email": slow_source("user@example.com"),
+            "team": slow_source("Core"),
+            **row_attrs(request),
+        },
+    )
+    return HttpResponse(html)
+
+
+def get_urlpatterns():
+    from django.urls import path
+
+    return [
+        path("sync/", sync_helper_view),
+        path("async/", async_helper_view),
+    ]
+
+
+async def call(app, path, query_string):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+    status = None
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    assert status == 200, status
+
+
+async def run_load(app, path, query_string, concurrency, total):
+    """Return (total wall time, per-request latencies) in seconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            request_start = time.perf_counter()
+            await call(app, path, query_string)
+            latencies.append(time.perf_counter() - request_start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return time.perf_counter() - start, latencies
+
+
+def main(concurrency=10, total=500, runs=3):
+    configure_django(
+        ROOT_URLCONF="benchmarks.bench_async",
+        ALLOWED_HOSTS=["testserver"],
+        MIDDLEWARE=[],
+    )
+
+    from django.core.handlers.asgi import ASGIHandler
+    from django.test import override_settings
+
+    from django_cotton import utils
+
+    app = ASGIHandler()
+
+    def bench(label, path, query_string):
+        asyncio.run(run_load(app, path, query_string, concurrency, 20))  # warm up
+        results = [
+            asyncio.run(run_load(app, path, query_string, concurrency, total)) for _ in range(runs)
+        ]
+        duration = mean(wall for wall, _ in results)
+        latency = median(latency for _, latencies in results for latency in latencies)
+        print(
+            f"{label:<40} {total / duration:>8.0f} req/s   median latency {latency * 1000:>7.1f} ms"
+        )
+
+    print(
+        f"{total} requests, {concurrency} concurrent, 3 slow sources of "
+        f"{SLOW_SOURCE_SECONDS * 1000:.0f} ms each, {runs} runs"
+    )
+    for scenario, query_string in (("cpu-bound render", b""), ("blocking render", b"blocking=1")):
+        print(f"--- {scenario}")
+        bench("sync_to_async(render_component)", "/sync/", query_string)
+        bench("arender_component", "/async/", query_string)
+        with override_settings(COTTON_ASYNC_RENDER_WORKERS=8):
+            utils._render_executor = None
+            bench("arender_component, 8 render workers", "/async/", query_string)
+        utils._render_executor = None
+
+
+urlpatterns = get_urlpatterns() if __name__ != "__main__" else []
+
+if __name__ == "__main__":
+    main()
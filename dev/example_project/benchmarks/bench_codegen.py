@@ -0,0 +1,67 @@
+"""
+Component-heavy templates rendered with and without COTTON_CODEGEN for all components.
+
+The two modes are measured in alternating rounds, reloading the templates in between, to even out
+drift.
+
+    python -m benchmarks.bench_codegen
+"""
+
+from benchmarks.utils import configure_django, measure, report
+
+TEMPLATES = [
+    ("simple_cotton.html", {"data": list(range(200))}),
+    ("cotton/benchmarks/cotton_compiled.html", {}),
+    (
+        "benchmarks/codegen_table.html",
+        {
+            "users": [
+                {
+                    "name": f"User {n}",
+                    "email": f"user{n}@example.com",
+                    "role": "admin" if n % 5 else "member",
+                    "tags": ["a", "b", "c"],
+                }
+                for n in range(200)
+            ]
+        },
+    ),
+]
+
+
+def reset_template_cache():
+    from django.template import engines
+
+    for engine in engines.all():
+        for loader in engine.engine.template_loaders:
+            loader.reset()
+
+
+def main(iterations=50, runs=3, rounds=3):
+    configure_django()
+
+    from django.template.loader import render_to_string
+    from django.test.utils import override_settings
+
+    results = {(mode, name): [] for mode in ("nodes", "codegen") for name, _ in TEMPLATES}
+    outputs = {}
+    for _ in range(rounds):
+        for mode in ("nodes", "codegen"):
+            reset_template_cache()
+            with override_settings(COTTON_CODEGEN=mode == "codegen"):
+                for name, context in TEMPLATES:
+                    output = render_to_string(name, context)
+                    assert outputs.setdefault(name, output) == output
+                    results[mode, name] += measure(
+                        lambda: render_to_string(name, context), iterations, runs
+                    )
+
+    print(f"{iterations} iterations, {runs} runs, {rounds} rounds")
+    print("---")
+    for name, _ in TEMPLATES:
+        for mode in ("nodes", "codegen"):
+            report(f"{mode:<8}{name}", results[mode, name])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Cold-compile cost of each stage cotton adds to a template, on synthetic templates of controlled
+size.
+
+    python -m benchmarks.bench_compiler                     # every dimension
+    python -m benchmarks.bench_compiler --dimension attrs   # only vary the number of attributes
+
+Starting from a baseline template, each dimension is varied on its own: the number of components,
+attributes per component, attribute value length, nested quotes in attribute values, the share of
+attribute values that are {{ }} expressions and the number of {% verbatim %} blocks. For each
+template the stages are timed separately:
+
+    compile   CottonCompiler.process, <c-*> html to {% cotton %} tags
+    tokenize  smart_tokenize on the compiled template
+    parse     parse_component_tag and parse_vars_tag on every cotton tag of the template
+    prepare   _prepare_attrs on the attributes of every component tag
+    total     compile + Template(), with the parsed tag cache cleared, i.e. what a fresh worker pays
+
+Times are per template. Every call works on the same input, so the figures only include the caches
+kept within a stage, not the ones shared between templates.
+"""
+
+import argparse
+
+from benchmarks.utils import configure_django, report, sample
+
+BASELINE = {
+    "components": 20,
+    "attrs": 5,
+    "attr_length": 20,
+    "nested_quotes": False,
+    "expression_ratio": 0.0,
+    "verbatim_blocks": 0,
+}
+
+DIMENSIONS = {
+    "components": (1, 20, 100),
+    "attrs": (1, 5, 20),
+    "attr_length": (20, 200, 2_000),
+    "nested_quotes": (False, True),
+    "expression_ratio": (0.0, 0.5, 1.0),
+    "verbatim_blocks": (0, 10, 50),
+}
+
+
+def attribute_value(length, nested_quotes, expression):
+    """A value of roughly `length` characters, quoted for use in an attribute."""
+    if expression:
+        core = "{{ item.label|default:'none' }}" if nested_quotes else "{{ item.label }}"
+    elif nested_quotes:
+        core = '{ open: false, label: "x" }'
+    else:
+        core = "value"
+    filler = "-x" * max((length - len(core)) // 2, 0)
+    value = core + filler
+    # Values with double quotes inside are wrapped in single quotes, like Alpine.js x-data blobs
+    return f"'{value}'" if '"' in value else f'"{value}"'
+
+
+def generate_template(
+    components=20,
+    attrs=5,
+    attr_length=20,
+    nested_quotes=False,
+    expression_ratio=0.0,
+    verbatim_blocks=0,
+):
+    """Build a cotton template with the given number of components, attributes per component etc.
+
+    `expression_ratio` of the attribute values are {{ }} expressions, spread evenly over the
+    template. A <c-vars> tag with `attrs` defaults comes first, and every other component has a
+    named slot.
+    """
+    counter = 0
+
+    def attributes(prefix):
+        nonlocal counter
+        parts = []
+        for index in range(attrs):
+            # Whether this is an expression, such that the share of them tends to expression_ratio
+            expression = int((counter + 1) * expression_ratio) > int(counter * expression_ratio)
+            counter += 1
+            if index % 3 == 0 and not expression:
+                # One in three of the other attributes is a :dynamic one
+                parts.append(f':{prefix}-{index}="item.value"')
+            else:
+                parts.append(
+                    f"{prefix}-{index}={attribute_value(attr_length, nested_quotes, expression)}"
+                )
+        return " ".join(parts)
+
+    lines = [f"<c-vars {attributes('default')} />"]
+    for index in range(components):
+        if index % 2:
+            lines.append(
+                f"<c-bench.card {attributes('attr')}>"
+                f'<c-slot name="header">Header {{{{ item.label }}}}</c-slot>'
+                f"<p>Body {index}</p></c-bench.card>"
+            )
+        else:
+            lines.append(f"<c-bench.button {attributes('attr')} />")
+
+    # Spread the verbatim blocks evenly between the components
+    for index in range(verbatim_blocks):
+        position = (index + 1) * len(lines) // (verbatim_blocks + 1)
+        lines.insert(position, '{% verbatim %}<c-skipped x-text="{{ raw }}" />{% endverbatim %}')
+    return "\n".join(lines)
+
+
+def describe(options):
+    changed = [f"{key}={value}" for key, value in options.items() if value != BASELINE[key]]
+    return ", ".join(changed) or "baseline"
+
+
+def benchmark(options, min_samples, min_time):
+    from django.template import Engine, Origin, Template
+    from django.template.base import Parser, TokenType
+
+    from django_cotton.compiler_regex import CottonCompiler
+    from django_cotton.nested_tag_support import CottonLexer
+    from django_cotton.tag_parser import parse_component_tag, parse_vars_tag
+    from django_cotton.templatetags import snapshot_parser_library
+    from django_cotton.templatetags._component import _parse_component_tag_cached, _prepare_attrs
+
+    engine = Engine.get_default()
+    compiler = CottonCompiler()
+    source = generate_template(**options)
+
+    # Each stage's input is the previous stage's output
+    compiled = compiler.process(source)
+    tokens = CottonLexer(compiled).tokenize()
+    component_tags = [
+        token.contents
+        for token in tokens
+        if token.token_type == TokenType.BLOCK and token.contents.startswith("cotton ")
+    ]
+    vars_tags = [
+        token.contents
+        for token in tokens
+        if token.token_type == TokenType.BLOCK and token.contents.startswith("cotton:vars")
+    ]
+    component_attrs = [parse_component_tag(contents).attrs for contents in component_tags]
+    library = snapshot_parser_library(Parser([], builtins=engine.template_builtins))
+
+    origin = Origin("bench_compiler.html")
+    origin.has_cotton_tags = True
+
+    def parse():
+        for contents in component_tags:
+            parse_component_tag(contents)
+        for contents in vars_tags:
+            parse_vars_tag(contents)
+
+    def prepare():
+        for attrs in component_attrs:
+            _prepare_attrs(attrs, library)
+
+    def total():
+        _parse_component_tag_cached.cache_clear()
+        Template(compiler.process(source), origin, engine=engine)
+
+    stages = (
+        ("compile", lambda: compiler.process(source)),
+        ("tokenize", lambda: CottonLexer(compiled).tokenize()),
+        ("parse", parse),
+        ("prepare", prepare),
+        ("total", total),
+    )
+
+    print(f"{describe(options)} ({len(source):,} chars, {len(component_tags)} component tags)")
+    for name, func in stages:
+        report(f"  {name}", sample(func, min_samples, min_time))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0], prog="python -m benchmarks.bench_compiler"
+    )
+    parser.add_argument(
+        "--dimension", action="append", choices=sorted(DIMENSIONS), help="only vary this dimension"
+    )
+    parser.add_argument(
+        "--samples", type=int, default=20, help="minimum calls per stage (default: 20)"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimum seconds per stage (default: 0.2)"
+    )
+    args = parser.parse_args(argv)
+
+    configure_django()
+
+    print("Time per template for each stage")
+    print("---")
+    seen = set()
+    for dimension in args.dimension or DIMENSIONS:
+        for value in DIMENSIONS[dimension]:
+            options = {**BASELINE, dimension: value}
+            key = tuple(options.items())
+            if key in seen:
+                continue  # The baseline is part of most dimensions
+            seen.add(key)
+            benchmark(options, args.samples, args.min_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+<c-for> against {% for %} around the same component, and against the same markup without a
+component.
+
+    python -m benchmarks.bench_for_loop
+"""
+
+from benchmarks.utils import configure_django, measure, report
+
+
+def main(rows=1000, runs=5):
+    configure_django()
+
+    from django.template import Context, Template
+    from django.template.loader import get_template
+
+    from django_cotton.compiler_regex import CottonCompiler
+
+    compiler = CottonCompiler()
+    native = Template(
+        """{% for user in users %}<tr class="row">{{ user.name }} (active)</tr>{% endfor %}"""
+    )
+    for_loop = Template(
+        compiler.process(
+            """{% for user in users %}"""
+            """<c-benchmarks.row class="row" :name="user.name" />"""
+            """{% endfor %}"""
+        )
+    )
+    c_for = Template(
+        compiler.process(
+            """<c-for each="users" as="user">"""
+            """<c-benchmarks.row class="row" :name="user.name" />"""
+            """</c-for>"""
+        )
+    )
+    get_template("cotton/benchmarks/row.html")
+    context = {"users": [{"name": f"User {n}"} for n in range(rows)]}
+
+    assert for_loop.render(Context(context)) == c_for.render(Context(context))
+
+    print(f"Rendering {rows} rows, {runs} runs")
+    print("---")
+    for label, template in (
+        ("native markup in {% for %} (per row)", native),
+        ("component in {% for %} (per row)", for_loop),
+        ("component in <c-for> (per row)", c_for),
+    ):
+        results = measure(lambda: template.render(Context(context)), 1, runs)
+        report(label, [r / rows for r in results])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+A page of static components compiled with and without COTTON_INLINE_COMPONENTS.
+
+    python -m benchmarks.bench_inline
+"""
+
+from benchmarks.utils import configure_django, measure, report
+
+
+def main(components=200, iterations=50, runs=5):
+    configure_django()
+
+    from django.template import Context, Template
+    from django.test.utils import override_settings
+
+    from django_cotton.compiler_regex import CottonCompiler
+
+    source = CottonCompiler().process(
+        """<c-benchmarks.row class="row" name="Static" status="done" />\n""" * components
+    )
+    regular = Template(source)
+    with override_settings(COTTON_INLINE_COMPONENTS=True):
+        inlined = Template(source)
+
+    assert regular.render(Context()) == inlined.render(Context())
+
+    print(f"Rendering {components} static components, {iterations} iterations, {runs} runs")
+    print("---")
+    report(
+        "regular (per component)",
+        [r / components for r in measure(lambda: regular.render(Context()), iterations, runs)],
+    )
+    report(
+        "inlined (per component)",
+        [r / components for r in measure(lambda: inlined.render(Context()), iterations, runs)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+The same component tree rendered by the Django engine and by Jinja2 with
+django_cotton.jinja2.CottonExtension.
+
+The templates are written in the subset of syntax both engines share, and the outputs are checked to
+be equal before timing.
+
+    python -m benchmarks.bench_jinja
+"""
+
+from benchmarks.utils import configure_django, measure, report
+
+TEMPLATES = [
+    (
+        "benchmarks/codegen_table.html",
+        {
+            "users": [
+                {
+                    "name": f"User {n}",
+                    "email": f"user{n}@example.com",
+                    "role": "admin" if n % 5 else "member",
+                    "tags": ["a", "b", "c"],
+                }
+                for n in range(200)
+            ]
+        },
+    ),
+    (
+        "benchmarks/jinja_rows.html",
+        {
+            "rows": [
+                {"name": f"Row {n}", "status": "active" if n % 2 else "inactive"}
+                for n in range(200)
+            ]
+        },
+    ),
+]
+
+
+def main(iterations=50, runs=5):
+    from django.conf import settings as django_settings
+
+    configure_django()
+    django_settings.TEMPLATES.append(
+        {
+            "NAME": "jinja2",
+            "BACKEND": "django.template.backends.jinja2.Jinja2",
+            "DIRS": ["example_project/templates"],
+            "OPTIONS": {
+                "extensions": ["django_cotton.jinja2.CottonExtension"],
+                # Match the Django engine, which keeps the newline at the end of a template
+                "keep_trailing_newline": True,
+            },
+        }
+    )
+
+    from django.template.loader import render_to_string
+
+    print(f"{iterations} iterations, {runs} runs")
+    print("---")
+    for name, context in TEMPLATES:
+        django_output = render_to_string(name, context, using="django")
+        jinja_output = render_to_string(name, context, using="jinja2")
+        assert django_output == jinja_output, f"{name} renders differently with Jinja2"
+
+        for engine in ("django", "jinja2"):
+            results = measure(
+                lambda: render_to_string(name, context, using=engine), iterations, runs
+            )
+            report(f"{engine:<8}{name}", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""
+Memory held by compiled cotton templates and allocated per render, measured with tracemalloc.
+
+    python -m benchmarks.bench_memory                      # 200 component templates and call sites
+    python -m benchmarks.bench_memory --components 1000
+    python -m benchmarks.bench_memory --save memory.json   # store the results as a baseline
+    python -m benchmarks.bench_memory --compare memory.json --threshold 10
+
+Generates N component templates and pages with N call sites between them, loads them all through
+the cached template loader and reports:
+
+  - the memory retained by the loaded templates, per component template and call site, and the
+    files that allocated it
+  - the size of each object cotton keeps per call site: CottonComponentNode (without its attributes
+    and children), PreparedAttr (the tuple, without its value), PreparedValue (without an
+    InlineTemplate), InlineTemplate, and the tag library snapshot taken at parse points. Each is
+    measured by building copies of the loaded objects under tracemalloc, and multiplied by the
+    number of them in the loaded templates.
+  - for a representative page of 20 components with slots and a nested component, the peak memory
+    allocated while rendering it and the memory still held after rendering it.
+
+With --compare, a figure more than --threshold percent above the baseline is a regression, and the
+run exits with status 1.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+
+from benchmarks.utils import configure_django
+
+PAGE_SIZE = 20
+RENDERS = 5
+
+
+def templates(components):
+    """The templates to load, by path relative to the template directory."""
+    result = {"cotton/mem/icon.html": """<i class="icon-{{ name }}"></i>"""}
+    for index in range(components):
+        result[f"cotton/mem/widget{index}.html"] = (
+            """<c-vars size="md" :active="False" title="{{ size }} widget" />"""
+            """<div {{ attrs }} class="widget-{{ size }}">{{ title }}{{ slot }}{{ footer }}"""
+            """<c-mem.icon :name="size" /></div>"""
+        )
+    for page, start in enumerate(range(0, components, PAGE_SIZE)):
+        result[f"mem/page{page}.html"] = "\n".join(
+            f"""<c-mem.widget{index} label="Item {index}" :count="count" """
+            f"""title="{{{{ user }}}} #{index}" disabled>"""
+            f"""{{{{ body }}}}<c-slot name="footer">Footer {index}</c-slot></c-mem.widget{index}>"""
+            for index in range(start, min(start + PAGE_SIZE, components))
+        )
+    return result
+
+
+# Loaded and rendered before tracing starts, so that the modules imported and the caches filled on
+# the first cotton render aren't counted as memory held by the templates
+WARM_UP_TEMPLATES = {
+    "cotton/warmup/badge.html": (
+        """<c-vars tone="plain" :active="False" title="{{ tone }} badge" />"""
+        """<b {{ attrs }}>{{ title }}{{ slot }}{{ footer }}</b>"""
+    ),
+    "warmup.html": (
+        """<c-warmup.badge label="x" :count="count" title="{{ user }}" disabled>"""
+        """{{ body }}<c-slot name="footer">F</c-slot></c-warmup.badge>"""
+    ),
+}
+
+
+def traced_bytes(build, count):
+    """Bytes allocated per object by build(), which returns a list of `count` objects."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(objects)
+    return allocated / count
+
+
+def load(paths):
+    """Load the templates under tracemalloc. Returns the templates and the bytes they retain."""
+    from django.template.loader import get_template
+
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    loaded = [get_template(path).template for path in paths]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+
+    snapshot = tracemalloc.take_snapshot()
+    print("Largest allocations by file:")
+    for statistic in snapshot.statistics("filename")[:8]:
+        frame = statistic.traceback[0]
+        print(f"  {frame.filename:<70} {statistic.size / 1024:>10,.1f} KiB")
+    print()
+    return loaded, retained
+
+
+def object_sizes(loaded):
+    """{name: (count in the loaded templates, bytes each)} for the objects kept per call site."""
+    from django.template import NodeList
+
+    from django_cotton.templatetags import InlineTemplate, _build_library, compile_inline_template
+    from django_cotton.templatetags._component import (
+        CottonComponentNode,
+        PreparedAttr,
+        PreparedValue,
+    )
+    from django_cotton.templatetags._vars import CottonVarsNode
+
+    nodes = [
+        node
+        for template in loaded
+        for node in template.nodelist.get_nodes_by_type(CottonComponentNode)
+    ]
+    vars_nodes = [
+        node for template in loaded for node in template.nodelist.get_nodes_by_type(CottonVarsNode)
+    ]
+
+    # (prepared attr or var, the library of its parse point)
+    prepared = [(attr, node.active_library) for node in nodes for attr in node._prepared_attrs]
+    prepared += [(var, node.active_library) for node in vars_nodes for var in node._prepared_vars]
+    values = [
+        (item.compiled, library)
+        for item, library in prepared
+        if isinstance(item.compiled, PreparedValue)
+    ]
+    inline = [
+        (item.compiled, library)
+        for item, library in prepared
+        if isinstance(item.compiled, InlineTemplate)
+    ]
+    inline += [
+        (value._template, library) for value, library in values if value._template is not None
+    ]
+    plain_values = [(value, library) for value, library in values if value._template is None]
+    libraries = list(
+        {id(node.active_library): node.active_library for node in nodes + vars_nodes}.values()
+    )
+
+    attrs = [
+        attr for attr, _ in prepared if isinstance(attr, PreparedAttr)
+    ]  # vars are PreparedVar tuples
+    # A single copy of each library snapshot is too small to measure reliably
+    library_copies = libraries * 20
+
+    measurements = (
+        (
+            "CottonComponentNode",
+            nodes,
+            lambda: [
+                CottonComponentNode(
+                    node.component_name,
+                    NodeList(),
+                    node.attrs,
+                    node.only,
+                    node.active_library,
+                    node._prepared_attrs,
+                )
+                for node in nodes
+            ],
+        ),
+        ("PreparedAttr", attrs, lambda: [PreparedAttr(*attr) for attr in attrs]),
+        (
+            "PreparedValue",
+            plain_values,
+            lambda: [
+                PreparedValue(value.raw, active_library=library) for value, library in plain_values
+            ],
+        ),
+        (
+            "InlineTemplate",
+            inline,
+            lambda: [
+                compile_inline_template(template.source, library) for template, library in inline
+            ],
+        ),
+        (
+            "library snapshot",
+            libraries,
+            lambda: [_build_library(library.tags, library.filters) for library in library_copies],
+        ),
+    )
+
+    sizes = {}
+    for name, objects, build in measurements:
+        copies = len(library_copies) if name == "library snapshot" else len(objects)
+        sizes[name] = (len(objects), traced_bytes(build, copies) if copies else 0.0)
+    return sizes
+
+
+def render_allocations(template, context):
+    """Median (peak bytes, retained bytes) of rendering the template, after a warm-up render."""
+    template.render(context)
+
+    peaks, retained = [], []
+    for _ in range(RENDERS):
+        gc.collect()
+        # The peak has to only cover this render
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        else:
+            # Python 3.8: restarting also drops the traces of the loaded templates, so this runs
+            # after they've been measured
+            tracemalloc.stop()
+            tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        output = template.render(context)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        del output
+        gc.collect()
+        # Memory freed by the render, e.g. state replaced in the reused context, counts as nothing
+        # retained
+        retained.append(max(tracemalloc.get_traced_memory()[0] - before, 0))
+    tracemalloc.stop()
+    return median(peaks), median(retained)
+
+
+def compare(results, baseline, threshold):
+    """Print the change of each figure against the baseline. Returns the names of regressions."""
+    regressions = []
+    print()
+    print(f"Compared with the baseline (regression threshold {threshold}%)")
+    for name, value in results.items():
+        base = baseline["results"].get(name)
+        if not base:
+            print(f"  {name:<36}{value:>14,.0f}")
+            continue
+        change = (value - base) / base * 100
+        print(f"  {name:<36}{value:>14,.0f}{change:>+9.1f}%")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0], prog="python -m benchmarks.bench_memory"
+    )
+    parser.add_argument(
+        "--components",
+        type=int,
+        default=200,
+        help="component templates and call sites (default: 200)",
+    )
+    parser.add_argument("--save", metavar="PATH", help="write the results to a JSON baseline")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="compare the results with a JSON baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="increase in percent that fails --compare (default: 10)",
+    )
+    args = parser.parse_args(argv)
+
+    configure_django()
+
+    from django.conf import settings
+    from django.template import Context
+    from django.template.loader import render_to_string
+
+    template_dir = Path(tempfile.mkdtemp(prefix="cotton-bench-"))
+    try:
+        sources = templates(args.components)
+        for path, source in {**sources, **WARM_UP_TEMPLATES}.items():
+            (template_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (template_dir / path).write_text(source)
+        settings.TEMPLATES[0]["DIRS"].append(str(template_dir))
+
+        context = {"count": 3, "user": "ada", "body": "Body"}
+        render_to_string("warmup.html", context)
+
+        tracemalloc.start()
+        loaded, retained = load(sources)
+        pages = len(sources) - args.components - 1
+        print(f"Loaded {args.components} component templates and call sites on {pages} pages")
+        print(f"  retained                {retained / 1024:>12,.1f} KiB")
+        print(f"  per component template and call site {retained / args.components:>10,.0f} bytes")
+        print()
+
+        sizes = object_sizes(loaded)
+        print(f"{'object':<24}{'count':>8}{'bytes each':>12}{'total KiB':>12}{'of retained':>13}")
+        for name, (count, size) in sizes.items():
+            print(
+                f"{name:<24}{count:>8}{size:>12,.0f}{count * size / 1024:>12,.1f}"
+                f"{count * size / retained * 100:>12.1f}%"
+            )
+        print()
+
+        page = loaded[args.components + 1]  # mem/page0.html, after the icon and the widgets
+        peak, held = render_allocations(page, Context(context))
+        print(f"Rendering mem/page0.html ({PAGE_SIZE} components), median of {RENDERS} renders")
+        print(f"  peak allocated          {peak / 1024:>12,.1f} KiB")
+        print(f"  retained after render   {held:>12,} bytes")
+    finally:
+        shutil.rmtree(template_dir, ignore_errors=True)
+
+    results = {
+        "retained_bytes_per_component": retained / args.components,
+        **{f"bytes_per_{name.replace(' ', '_')}": size for name, (_, size) in sizes.items()},
+        "render_peak_bytes": peak,
+        "render_retained_bytes": held,
+    }
+
+    if args.save:
+        import django
+
+        baseline = {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "components": args.components,
+            "results": results,
+        }
+        Path(args.save).write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions over {args.threshold}%: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+render_components() against calling render_component() in a loop, for N rows of the same component.
+
+    python -m benchmarks.bench_render_components
+"""
+
+from benchmarks.utils import configure_django, measure, report
+
+
+def main(rows=1000, runs=5):
+    configure_django()
+
+    from django.test import RequestFactory
+
+    from django_cotton import render_component, render_components
+
+    request = RequestFactory().get("/")
+    contexts = [{"name": f"User {n}", "class": "row"} for n in range(rows)]
+
+    def per_call():
+        return [render_component(request, "benchmarks.row", context) for context in contexts]
+
+    def batch():
+        return render_components(request, "benchmarks.row", contexts)
+
+    assert per_call() == batch()
+
+    print(f"Rendering {rows} rows, {runs} runs")
+    print("---")
+    report("render_component() in a loop (per row)", [r / rows for r in measure(per_call, 1, runs)])
+    report("render_components() (per row)", [r / rows for r in measure(batch, 1, runs)])
+
+
+if __name__ == "__main__":
+    main()
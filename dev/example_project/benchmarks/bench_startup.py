@@ -0,0 +1,182 @@
+"""
+Cold start: time from a fresh interpreter to the first rendered cotton page.
+
+    python -m benchmarks.bench_startup                     # 10 trials, a page of 50 components
+    python -m benchmarks.bench_startup --trials 20 --components 200
+
+Each trial runs in a new Python process, so nothing is imported, compiled or cached beforehand. The
+process times each phase with perf_counter:
+
+    import         import django and django_cotton, including its app config module
+    setup          settings.configure() and django.setup(), which runs LoaderAppConfig.ready:
+                   enable_nested_tag_support() and wrap_loaders() are also reported on their own
+    first render   render_to_string() of the page, which loads, compiles and parses every component
+    second render  the same page again, from the cached templates
+
+"process" is the wall time of the whole subprocess as seen by the parent, interpreter start and exit
+included. The app is installed as "django_cotton" with APP_DIRS, as in a default project, so
+wrap_loaders() sets up the loaders.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+
+PHASES = (
+    "import",
+    "setup",
+    "enable_nested_tag_support",
+    "wrap_loaders",
+    "first render",
+    "second render",
+)
+
+
+def templates(components):
+    """The page and the components it renders, by path relative to the template directory."""
+    result = {"cotton/startup/icon.html": """<i class="icon-{{ name }}"></i>"""}
+    for index in range(components):
+        result[f"cotton/startup/widget{index}.html"] = (
+            """<c-vars size="md" title="{{ size }} widget" />"""
+            """<div {{ attrs }} class="widget-{{ size }}">{{ title }}{{ slot }}"""
+            """<c-startup.icon :name="size" /></div>"""
+        )
+    result["startup/page.html"] = "\n".join(
+        f"""<c-startup.widget{index} label="Item {index}" :count="count">"""
+        f"""Body {{{{ user }}}}</c-startup.widget{index}>"""
+        for index in range(components)
+    )
+    return result
+
+
+def timed(timings, name, func):
+    """Wrap func so that the time spent in it is recorded under name."""
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+    return wrapper
+
+
+def child(template_dir):
+    """One trial, in a fresh process. Prints the phase timings in seconds as JSON."""
+    timings = {}
+
+    start = time.perf_counter()
+    import django
+    from django.conf import settings
+
+    import django_cotton  # noqa: F401
+    import django_cotton.apps
+    import django_cotton.nested_tag_support
+
+    timings["import"] = time.perf_counter() - start
+
+    # ready() looks both up when it runs
+    nested_tag_support = django_cotton.nested_tag_support
+    nested_tag_support.enable_nested_tag_support = timed(
+        timings, "enable_nested_tag_support", nested_tag_support.enable_nested_tag_support
+    )
+    django_cotton.apps.wrap_loaders = timed(
+        timings, "wrap_loaders", django_cotton.apps.wrap_loaders
+    )
+
+    start = time.perf_counter()
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.admin",
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "django.contrib.sessions",
+            "django.contrib.messages",
+            "django.contrib.staticfiles",
+            "django_cotton",
+        ],
+        TEMPLATES=[
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "DIRS": [template_dir],
+                "APP_DIRS": True,
+            },
+        ],
+        DEBUG=False,
+    )
+    django.setup()
+    timings["setup"] = time.perf_counter() - start
+
+    from django.template.loader import render_to_string
+
+    context = {"count": 3, "user": "ada"}
+    for phase in ("first render", "second render"):
+        start = time.perf_counter()
+        render_to_string("startup/page.html", context)
+        timings[phase] = time.perf_counter() - start
+
+    print(json.dumps(timings))
+
+
+def trial(template_dir):
+    """Run one trial in a subprocess. Returns its phase timings and wall time, in seconds."""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child", template_dir],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=os.environ,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(completed.stdout.splitlines()[-1])
+    timings["process"] = time.perf_counter() - start
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0], prog="python -m benchmarks.bench_startup"
+    )
+    parser.add_argument("--trials", type=int, default=10, help="processes to start (default: 10)")
+    parser.add_argument(
+        "--components", type=int, default=50, help="distinct components on the page (default: 50)"
+    )
+    parser.add_argument("--child", metavar="TEMPLATE_DIR", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(args.child)
+        return
+
+    template_dir = tempfile.mkdtemp(prefix="cotton-bench-")
+    try:
+        for path, source in templates(args.components).items():
+            (Path(template_dir) / path).parent.mkdir(parents=True, exist_ok=True)
+            (Path(template_dir) / path).write_text(source)
+
+        print(
+            f"Cold start to a page of {args.components} components, "
+            f"{args.trials} trials in fresh processes"
+        )
+        print("---")
+        results = [trial(template_dir) for _ in range(args.trials)]
+    finally:
+        shutil.rmtree(template_dir, ignore_errors=True)
+
+    print(f"{'phase':<30}{'median ms':>12}{'min ms':>12}{'max ms':>12}")
+    for phase in PHASES + ("process",):
+        values = [result.get(phase, 0.0) * 1000 for result in results]
+        print(f"{phase:<30}{median(values):>12,.2f}{min(values):>12,.2f}{max(values):>12,.2f}")
+
+
+if __name__ == "__main__":
+    main()
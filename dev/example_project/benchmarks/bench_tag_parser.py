@@ -0,0 +1,51 @@
+"""
+Parse time of {% cotton %} tags with long attribute values, e.g. Alpine.js x-data blobs.
+
+    python -m benchmarks.bench_tag_parser
+"""
+
+from benchmarks.utils import configure_django, measure, report
+
+
+def build_x_data(value_length):
+    """An x-data object of about value_length characters, with single quotes and {{ }} inside."""
+    entry = "item: '{{ item.name|default:\"none\" }}', open: false, "
+    return "{ " + entry * max(value_length // len(entry), 1) + "}"
+
+
+def build_tag(x_data):
+    """A component tag with a few short attrs plus the x-data value, in double quotes."""
+    return (
+        'cotton dropdown class="w-full" :items="items" '
+        f'x-data="{x_data}" '
+        '@click="open = !open" label="{% trans "Menu" %}" disabled'
+    )
+
+
+def main(iterations=2000, runs=5):
+    configure_django()
+
+    from django_cotton.tag_parser import parse_component_tag
+
+    print(f"Parsing component tags, {runs} runs of {iterations} iterations")
+    print("---")
+
+    for value_length in (100, 1_000, 5_000, 20_000):
+        x_data = build_x_data(value_length)
+        tag = build_tag(x_data)
+
+        # Make sure the long value is parsed as one attribute
+        attrs = parse_component_tag(tag).attrs
+        assert list(attrs) == ["class", ":items", "x-data", "@click", "label", "disabled"], list(
+            attrs
+        )
+        assert attrs["x-data"] == f'"{x_data}"', attrs["x-data"][:100]
+
+        report(
+            f"x-data of {len(x_data)} chars",
+            measure(lambda: parse_component_tag(tag), iterations, runs),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compile-time cost of cotton's nested tag support on non-cotton templates.
+
+Compiles Django admin's change_list.html (no cotton tags) and a cotton template under three modes:
+Django's untouched lexer, the default process-wide patch and COTTON_SCOPED_TOKENIZER. Every variant
+is warmed up before any is timed, and the runs alternate between the variants.
+
+    python -m benchmarks.bench_tokenizer
+"""
+
+import os
+from contextlib import contextmanager
+
+from benchmarks.utils import configure_django, measure, report
+
+WARM_UP = 50
+
+
+def main(iterations=500, runs=5):
+    configure_django()
+
+    import django.contrib.admin
+    from django.template import Engine, Origin, Template
+    from django.template import base as template_base
+    from django.test import override_settings
+
+    from django_cotton import nested_tag_support
+    from django_cotton.nested_tag_support import enable_nested_tag_support
+
+    engine = Engine.get_default()
+
+    admin_path = os.path.join(
+        os.path.dirname(django.contrib.admin.__file__), "templates", "admin", "change_list.html"
+    )
+    with open(admin_path, encoding="utf-8") as f:
+        admin_source = f.read()
+    admin_origin = Origin(admin_path)
+
+    cotton_source = (
+        '{% cotton button label="{% if True %}Save{% endif %}" :count="3" %}'
+        "{% cotton:slot icon %}<i></i>{% endcotton:slot %}{% endcotton %}"
+    ) * 20
+    cotton_origin = Origin("cotton_bench.html")
+    cotton_origin.has_cotton_tags = True
+
+    def compile_admin():
+        Template(admin_source, admin_origin, engine=engine)
+
+    def compile_cotton():
+        Template(cotton_source, cotton_origin, engine=engine)
+
+    @contextmanager
+    def tokenizer(mode):
+        if mode == "unpatched":
+            # Django's lexer without any cotton patching
+            template_base.Lexer.tokenize = nested_tag_support._original_lexer_tokenize
+            template_base.DebugLexer.tokenize = nested_tag_support._original_debug_lexer_tokenize
+            template_base.Template.compile_nodelist = nested_tag_support._original_compile_nodelist
+            yield
+            return
+        with override_settings(COTTON_SCOPED_TOKENIZER=mode == "scoped"):
+            enable_nested_tag_support()
+            yield
+
+    variants = (
+        ("admin/change_list.html", "unpatched", compile_admin),
+        ("admin/change_list.html", "global", compile_admin),
+        ("cotton template", "global", compile_cotton),
+        ("admin/change_list.html", "scoped", compile_admin),
+        ("cotton template", "scoped", compile_cotton),
+    )
+
+    # Warm up every variant before timing any, so that the first one measured doesn't pay for cold
+    # caches
+    for _, mode, func in variants:
+        with tokenizer(mode):
+            for _ in range(WARM_UP):
+                func()
+
+    print(f"Compiling templates, {runs} runs of {iterations} iterations")
+    print("---")
+
+    results = {variant: [] for variant in variants}
+    for run in range(runs):
+        # Alternate the order between runs, so that no variant always runs first
+        for variant in variants if run % 2 == 0 else reversed(variants):
+            with tokenizer(variant[1]):
+                results[variant] += measure(variant[2], iterations, runs=1)
+
+    labels = {
+        "unpatched": "unpatched Django",
+        "global": "global tokenizer",
+        "scoped": "scoped tokenizer",
+    }
+    for variant in variants:
+        report(f"{variant[0]}, {labels[variant[1]]}", results[variant])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Render benchmark suite: component pages across nesting depth, fan-out, attribute kinds, slots,
+<c-vars>, dynamic components and context isolation modes, plus the loop/include/extends comparisons
+with native Django templates.
+
+    python -m benchmarks.suite                        # every scenario
+    python -m benchmarks.suite -k fanout -k nesting   # scenarios whose name contains one of these
+    python -m benchmarks.suite --save baseline.json   # store the results as a baseline
+    python -m benchmarks.suite --compare baseline.json --threshold 10
+
+Each scenario renders one page repeatedly, timing every render with perf_counter, until it has at
+least --samples renders taking --min-time seconds. The report gives percentiles of the time per
+render. With --compare, a scenario whose median is more than --threshold percent slower than in the
+baseline is a regression, and the run exits with status 1.
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import warnings
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+from benchmarks.utils import configure_django, sample, summarize
+
+NESTING_DEPTHS = (1, 10, 25, 50)
+FANOUT_SIZES = (1, 100, 1_000, 10_000)
+LOOP_SIZE = 100
+
+
+class Scenario(NamedTuple):
+    name: str
+    template: str
+    context: dict
+    settings: dict = {}
+
+
+def loop(body):
+    return "{% for i in items %}" + body + "{% endfor %}"
+
+
+def component_templates():
+    """The templates the scenarios render, by path relative to the template directory."""
+    templates = {
+        "cotton/suite/leaf.html": """<span {{ attrs }}>{{ label }}</span>""",
+        "cotton/suite/panel.html": (
+            """<section><header>{{ header }}</header>{{ slot }}"""
+            """<footer>{{ footer }}</footer></section>"""
+        ),
+        "cotton/suite/defaults.html": (
+            """<c-vars size="md" tone="plain" variant="solid" rounded="lg" icon="none" />"""
+            """<b {{ attrs }} class="{{ size }} {{ tone }} {{ variant }} {{ rounded }} """
+            """{{ icon }}">{{ slot }}</b>"""
+        ),
+        "suite/nesting.html": """<c-suite.nest1 :depth="depth" />""",
+        "suite/fanout.html": loop("""<c-suite.leaf :label="i" />"""),
+        "suite/attrs_static.html": loop(
+            """<c-suite.leaf label="x" class="a b" id="y" data-one="1" data-two="2" />"""
+        ),
+        "suite/attrs_dynamic.html": loop(
+            """<c-suite.leaf :label="i" :class="cls" :id="ident" """
+            """:data-one="one" :data-two="two" />"""
+        ),
+        "suite/attrs_spread.html": loop("""<c-suite.leaf :label="i" :attrs="bag" />"""),
+        "suite/slots.html": loop(
+            """<c-suite.panel><c-slot name="header">H {{ i }}</c-slot>Body {{ i }}"""
+            """<c-slot name="footer">F</c-slot></c-suite.panel>"""
+        ),
+        "suite/cvars.html": loop("""<c-suite.defaults tone="loud">{{ i }}</c-suite.defaults>"""),
+        "suite/dynamic_is.html": loop("""<c-component :is="name" :label="i" />"""),
+        "suite/isolation.html": loop("""<c-suite.leaf :label="i" />"""),
+        "suite/isolation_only.html": loop("""<c-suite.leaf :label="i" only />"""),
+    }
+    deepest = max(NESTING_DEPTHS)
+    for level in range(1, deepest + 1):
+        templates[f"cotton/suite/nest{level}.html"] = (
+            f"""<div class="level-{level}">"""
+            f"""{{% if depth > {level} %}}<c-suite.nest{level + 1} :depth="depth" />"""
+            f"""{{% endif %}}</div>"""
+        )
+    return templates
+
+
+def scenarios():
+    items = range(LOOP_SIZE)
+    attrs = {"cls": "a b", "ident": "y", "one": 1, "two": 2}
+    bag = {"class": "a b", "id": "y", "data-one": 1, "data-two": 2}
+
+    for depth in NESTING_DEPTHS:
+        yield Scenario(f"nesting-{depth}", "suite/nesting.html", {"depth": depth})
+    for size in FANOUT_SIZES:
+        yield Scenario(f"fanout-{size}", "suite/fanout.html", {"items": range(size)})
+
+    yield Scenario("attrs-static", "suite/attrs_static.html", {"items": items})
+    yield Scenario("attrs-dynamic", "suite/attrs_dynamic.html", {"items": items, **attrs})
+    yield Scenario("attrs-spread", "suite/attrs_spread.html", {"items": items, "bag": bag})
+    yield Scenario("slots-named", "suite/slots.html", {"items": items})
+    yield Scenario("cvars-defaults", "suite/cvars.html", {"items": items})
+    yield Scenario("dynamic-is", "suite/dynamic_is.html", {"items": items, "name": "suite.leaf"})
+
+    page = {"items": items, "unrelated": "x" * 100}
+    yield Scenario("isolation-none", "suite/isolation.html", page)
+    yield Scenario("isolation-only", "suite/isolation_only.html", page)
+    yield Scenario(
+        "isolation-by-default", "suite/isolation.html", page, {"COTTON_ISOLATE_BY_DEFAULT": True}
+    )
+    yield Scenario(
+        "isolation-legacy", "suite/isolation.html", page, {"COTTON_ENABLE_CONTEXT_ISOLATION": True}
+    )
+
+    # Cotton compared with the native Django equivalents
+    data = {"data": list(range(1, 200))}
+    yield Scenario("native-loop", "simple_native.html", data)
+    yield Scenario("cotton-loop", "simple_cotton.html", data)
+    yield Scenario("native-include", "benchmarks/native_include.html", {})
+    yield Scenario("cotton-include", "cotton/benchmarks/cotton_include.html", {})
+    yield Scenario("native-extends", "benchmarks/native_extends.html", {})
+    yield Scenario("cotton-compiled", "cotton/benchmarks/cotton_compiled.html", {})
+    yield Scenario("cotton-extends", "cotton/benchmarks/cotton_extends_equivalent.html", {})
+
+
+def run(selected, min_samples, min_time):
+    from django.template.loader import render_to_string
+    from django.test.utils import override_settings
+
+    results = {}
+    for scenario in selected:
+        # Only override when needed: reading settings is slower through override_settings
+        overrides = override_settings(**scenario.settings) if scenario.settings else nullcontext()
+        with overrides, warnings.catch_warnings():
+            # COTTON_ENABLE_CONTEXT_ISOLATION is deprecated
+            warnings.simplefilter("ignore", DeprecationWarning)
+            samples = sample(
+                lambda: render_to_string(scenario.template, scenario.context), min_samples, min_time
+            )
+        results[scenario.name] = summarize(samples)
+        print_row(scenario.name, results[scenario.name])
+    return results
+
+
+def print_header(with_change=False):
+    columns = f"{'scenario':<24}{'renders':>9}" + "".join(
+        f"{name:>12}" for name in ("p50 µs", "p90 µs", "p99 µs", "mean µs")
+    )
+    print(columns + (f"{'vs base':>10}" if with_change else ""))
+
+
+def print_row(name, result, change=None):
+    row = (
+        f"{name:<24}{result['samples']:>9}{result['p50_us']:>12,.1f}{result['p90_us']:>12,.1f}"
+        f"{result['p99_us']:>12,.1f}{result['mean_us']:>12,.1f}"
+    )
+    if change is not None:
+        row += f"{change:>+9.1f}%"
+    print(row)
+
+
+def compare(results, baseline, threshold):
+    """Print the median change of each scenario against the baseline. Returns the regressions."""
+    regressions = []
+    print()
+    print(f"Compared with the baseline (regression threshold {threshold}%)")
+    print_header(with_change=True)
+    for name, result in results.items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print_row(name, result)
+            continue
+        change = (result["p50_us"] - base["p50_us"]) / base["p50_us"] * 100
+        print_row(name, result, change)
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0], prog="python -m benchmarks.suite"
+    )
+    parser.add_argument(
+        "-k", dest="filters", action="append", help="only run scenarios containing this text"
+    )
+    parser.add_argument(
+        "--samples", type=int, default=30, help="minimum renders per scenario (default: 30)"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.5, help="minimum seconds per scenario (default: 0.5)"
+    )
+    parser.add_argument("--save", metavar="PATH", help="write the results to a JSON baseline")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="compare the results with a JSON baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="median slowdown in percent that fails --compare (default: 10)",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [
+        scenario
+        for scenario in scenarios()
+        if not args.filters or any(text in scenario.name for text in args.filters)
+    ]
+    if not selected:
+        parser.error("no scenario matches the -k filters")
+
+    configure_django()
+
+    from django.conf import settings
+
+    template_dir = Path(tempfile.mkdtemp(prefix="cotton-bench-"))
+    try:
+        for path, source in component_templates().items():
+            (template_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (template_dir / path).write_text(source)
+        settings.TEMPLATES[0]["DIRS"].append(str(template_dir))
+
+        print_header()
+        results = run(selected, args.samples, args.min_time)
+    finally:
+        shutil.rmtree(template_dir, ignore_errors=True)
+
+    if args.save:
+        import django
+
+        baseline = {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "results": results,
+        }
+        Path(args.save).write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions over {args.threshold}%: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
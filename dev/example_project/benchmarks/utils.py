@@ -0,0 +1,112 @@
+"""
+Shared helpers for the benchmark scripts in this package.
+
+Run any benchmark from dev/example_project, e.g. `python -m benchmarks.bench_tokenizer`.
+"""
+
+import time
+from statistics import mean, median
+
+
+def configure_django(**overrides):
+    from django.conf import settings
+
+    options = dict(
+        INSTALLED_APPS=[
+            "django.contrib.admin",
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "django.contrib.sessions",
+            "django.contrib.messages",
+            "django.contrib.staticfiles",
+            "django_cotton.apps.SimpleAppConfig",
+        ],
+        TEMPLATES=[
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "DIRS": ["example_project/templates"],
+                "OPTIONS": {
+                    "loaders": [
+                        (
+                            "django.template.loaders.cached.Loader",
+                            [
+                                "django_cotton.cotton_loader.Loader",
+                                "django.template.loaders.filesystem.Loader",
+                                "django.template.loaders.app_directories.Loader",
+                            ],
+                        ),
+                    ],
+                    "builtins": [
+                        "django_cotton.templatetags.cotton",
+                    ],
+                    "context_processors": [
+                        "django.template.context_processors.debug",
+                        "django.template.context_processors.request",
+                        "django.contrib.auth.context_processors.auth",
+                        "django.contrib.messages.context_processors.messages",
+                    ],
+                },
+            },
+        ],
+        DEBUG=False,
+    )
+    options.update(overrides)
+    settings.configure(**options)
+
+    import django
+
+    django.setup()
+
+
+def measure(func, iterations=1000, runs=5):
+    """Call func() `iterations` times per run. Returns the time per call of each run, in µs."""
+    func()  # warm up
+
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        results.append((time.perf_counter() - start) / iterations * 1_000_000)
+    return results
+
+
+def report(label, results):
+    print(f"{label:<50} mean {mean(results):>10.2f} µs   median {median(results):>10.2f} µs")
+
+
+def sample(func, min_samples=30, min_time=0.5):
+    """Time individual calls of func() with perf_counter, until there are min_samples of them taking
+    at least min_time seconds in total. Returns the durations in microseconds."""
+    func()  # warm up
+
+    samples = []
+    total = 0.0
+    while len(samples) < min_samples or total < min_time:
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+        total += duration
+        samples.append(duration * 1_000_000)
+    return samples
+
+
+def percentile(values, percent):
+    """The percent-th percentile of values, interpolating between the closest ranks."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples):
+    """Percentiles, mean and min of a list of durations, keyed for JSON baselines."""
+    return {
+        "samples": len(samples),
+        "p50_us": percentile(samples, 50),
+        "p90_us": percentile(samples, 90),
+        "p99_us": percentile(samples, 99),
+        "mean_us": mean(samples),
+        "min_us": min(samples),
+    }
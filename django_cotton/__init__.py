@@ -1,3 +1,17 @@
-from django_cotton.utils import render_component
+from django_cotton.cache_stats import stats
+from django_cotton.utils import (
+    arender_component,
+    render_component,
+    render_component_iter,
+    render_components,
+    render_components_iter,
+)
 
-__all__ = ["render_component"]
+__all__ = [
+    "arender_component",
+    "render_component",
+    "render_component_iter",
+    "render_components",
+    "render_components_iter",
+    "stats",
+]
@@ -64,11 +64,15 @@ class LoaderAppConfig(AppConfig):
     default = True
 
     def ready(self):
+        from django_cotton import profiling
         from django_cotton.nested_tag_support import enable_nested_tag_support
 
         # Enable nested template tags in {% cotton %} and {% cotton:vars %} attributes
         enable_nested_tag_support()
 
+        # Slow render logging
+        profiling.configure()
+
         wrap_loaders("django")
 
 
@@ -81,7 +85,11 @@ class SimpleAppConfig(AppConfig):
     name = "django_cotton"
 
     def ready(self):
+        from django_cotton import profiling
         from django_cotton.nested_tag_support import enable_nested_tag_support
 
         # Enable nested template tags in {% cotton %} and {% cotton:vars %} attributes
         enable_nested_tag_support()
+
+        # Slow render logging
+        profiling.configure()
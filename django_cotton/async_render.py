@@ -0,0 +1,69 @@
+"""
+Async rendering of templates whose components take awaitable attribute values. The awaitables are
+collected from the template and awaited concurrently before it is rendered.
+"""
+
+import asyncio
+import inspect
+
+from django.template import Context
+from django.template.loader import get_template
+
+from django_cotton.templatetags._component import AttrKind, CottonComponentNode
+from django_cotton.utils import render_in_thread
+
+_MISSING = object()
+
+
+async def arender_to_string(template_name, context=None, request=None, using=None):
+    """Async render_to_string() that resolves the awaitables passed to components concurrently."""
+    context = dict(context or {})
+
+    def collect():
+        template = get_template(template_name, using=using)
+        return template, collect_awaitables(template.template, Context(context))
+
+    template, awaitables = await render_in_thread(collect)()
+    results = await asyncio.gather(*awaitables)
+
+    context["cotton_data"] = {
+        "stack": [],
+        "vars": {},
+        "awaited": {id(aw): (aw, result) for aw, result in zip(awaitables, results)},
+    }
+    return await render_in_thread(template.render)(context, request)
+
+
+def collect_awaitables(template, context):
+    """Return the distinct awaitables bound to dynamic attributes of the template's components."""
+    awaitables = {}
+    for node in template.nodelist.get_nodes_by_type(CottonComponentNode):
+        for attr in node._prepared_attrs:
+            if attr.kind not in (AttrKind.DYNAMIC, AttrKind.UNQUOTED):
+                continue
+            variable = attr.compiled._variable
+            if variable is None or variable.lookups is None:
+                continue
+            value = _lookup(variable.lookups, context)
+            if value is not _MISSING and inspect.isawaitable(value):
+                awaitables.setdefault(id(value), value)
+    return list(awaitables.values())
+
+
+def _lookup(lookups, context):
+    """Follow a variable's lookups like Variable.resolve() does, without calling callables."""
+    current = context
+    for bit in lookups:
+        try:
+            current = current[bit]
+        except (TypeError, AttributeError, KeyError, ValueError, IndexError):
+            try:
+                current = getattr(current, bit)
+            except AttributeError:
+                try:
+                    current = current[int(bit)]
+                except (IndexError, ValueError, KeyError, TypeError):
+                    return _MISSING
+        if callable(current):
+            return _MISSING
+    return current
@@ -0,0 +1,128 @@
+"""
+Statistics for the caches cotton keeps in process memory: size, hits, misses, evictions and an
+estimate of the memory held by each.
+"""
+
+import gc
+import sys
+import types
+
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+)
+
+
+def stats():
+    """Return {cache name: {"size", "maxsize", "hits", "misses", "evictions", "memory_bytes"}}."""
+    from django_cotton.codegen import _codegen_template_paths
+    from django_cotton.component_paths import component_paths
+    from django_cotton.cotton_loader import Loader
+    from django_cotton.dataloader import _import_loader_class
+    from django_cotton.templatetags import library_from_fingerprint
+    from django_cotton.templatetags._component import (
+        CottonComponentNode,
+        _parse_component_tag_cached,
+    )
+    from django_cotton.templatetags.cotton import _merge_to_html_cached, parse_merge_spec
+    from django_cotton.utils import _get_component_wrapper_template
+
+    component_path_stats, known_component_path_stats = component_paths.stats()
+    result = {
+        "compiled_templates": _compiled_templates_stats(),
+        "vars_nodes": _vars_nodes_stats(CottonComponentNode),
+        "component_paths": component_path_stats,
+        "known_component_paths": known_component_path_stats,
+        "loader_dirs": _lru_stats(Loader.get_dirs),
+        "parsed_tags": _lru_stats(_parse_component_tag_cached),
+        "tag_libraries": _lru_stats(library_from_fingerprint),
+        "merge_specs": _lru_stats(parse_merge_spec),
+        "merged_attrs": _lru_stats(_merge_to_html_cached),
+        "component_wrappers": _lru_stats(_get_component_wrapper_template),
+        "codegen_paths": _lru_stats(_codegen_template_paths),
+        "data_loader_classes": _lru_stats(_import_loader_class),
+    }
+
+    # Only when the Jinja2 integration is in use, without importing jinja2 otherwise
+    jinja_module = sys.modules.get("django_cotton.jinja2")
+    if jinja_module is not None:
+        result["jinja_attr_templates"] = _lru_stats(jinja_module._compile_attr_template)
+
+    return result
+
+
+def _lru_stats(cached_function):
+    info = cached_function.cache_info()
+    memory = 0
+    if info.currsize:
+        # The C implementation exposes its keys and results to the garbage collector
+        memory = estimate_size(
+            [
+                obj
+                for obj in gc.get_referents(cached_function)
+                if obj is not cached_function.__dict__
+            ]
+        )
+    return {
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        # An lru_cache only drops entries when full (or when cleared, which also resets the counts)
+        "evictions": 0 if info.maxsize is None or info.currsize < info.maxsize else None,
+        "memory_bytes": memory,
+    }
+
+
+def _compiled_templates_stats():
+    from django_cotton.cotton_loader import cotton_loaders
+
+    handlers = [loader.cache_handler for loader in cotton_loaders()]
+    size = sum(len(handler.template_cache) for handler in handlers)
+    return {
+        "size": size,
+        "maxsize": None,
+        "hits": sum(handler.hits for handler in handlers),
+        "misses": sum(handler.misses for handler in handlers),
+        "evictions": 0,
+        "memory_bytes": estimate_size([handler.template_cache for handler in handlers]),
+    }
+
+
+def _vars_nodes_stats(node_class):
+    cache = node_class._vars_node_cache
+    size = len(cache)
+    return {
+        "size": size,
+        "maxsize": None,
+        "hits": node_class._vars_node_cache_hits,
+        "misses": node_class._vars_node_cache_misses,
+        # Entries leave with their template, on reload or garbage collection, which isn't counted
+        "evictions": None,
+        # The keys are weak references to templates owned by the template loaders
+        "memory_bytes": estimate_size(list(cache.values())),
+    }
+
+
+def estimate_size(objects):
+    """Approximate bytes used by objects and everything they reference that isn't shared."""
+    from django.template import Engine, Library
+    from django.template.loaders.base import Loader
+
+    shared = _SHARED_TYPES + (Engine, Library, Loader)
+    seen = set()
+    total = 0
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, shared):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
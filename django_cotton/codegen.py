@@ -0,0 +1,205 @@
+"""
+Experimental: compile component templates to Python functions (COTTON_CODEGEN). Text, simple
+variables, {% if %} and {% for %} become straight-line code; any other node falls back to its own
+render, so the output is unchanged.
+"""
+
+import functools
+import itertools
+import logging
+
+from django.conf import settings
+from django.template.base import NodeList, TextNode, VariableDoesNotExist, VariableNode
+from django.template.defaulttags import ForNode, IfNode
+from django.utils.html import escape
+from django.utils.safestring import SafeString
+
+from django_cotton.templatetags._component import iter_loop, loop_values
+from django_cotton.templatetags._vars import CottonVarsNode
+
+logger = logging.getLogger("django_cotton.codegen")
+
+
+class CodegenNodeList(NodeList):
+    """A template's top-level NodeList, rendered by a generated function instead of node by node."""
+
+    render_function = None
+    source = ""
+    verify = False
+
+    def render(self, context):
+        if self.render_function is None:
+            return super().render(context)
+        if not self.verify:
+            return self.render_function(context)
+
+        output = self.render_function(context)
+        # Render the reference in a fresh render_context scope, so stateful tags like {% cycle %}
+        # start from the same state as the generated render did
+        with context.render_context.push():
+            expected = super().render(context)
+        if output != expected:
+            logger.warning(
+                "Generated code for %s rendered different output, "
+                "falling back to the node renderer",
+                self.origin_name,
+            )
+            self.render_function = None
+        return expected
+
+
+@functools.lru_cache(maxsize=None)
+def _codegen_template_paths(names):
+    from django_cotton.templatetags._component import CottonComponentNode
+
+    return frozenset(
+        CottonComponentNode._generate_component_template_path(name, None) for name in names
+    )
+
+
+def codegen_enabled_for(template_path):
+    """Whether COTTON_CODEGEN lists the component rendered from template_path."""
+    names = getattr(settings, "COTTON_CODEGEN", None)
+    if not names:
+        return False
+    if names is True:
+        return True
+    return template_path in _codegen_template_paths(tuple(names))
+
+
+def apply_codegen(template):
+    """Replace a template's nodelist with a CodegenNodeList, once per Template object."""
+    if isinstance(template.nodelist, CodegenNodeList):
+        return
+    nodelist = CodegenNodeList(template.nodelist)
+    nodelist.contains_nontext = template.nodelist.contains_nontext
+    nodelist.origin_name = template.origin.name
+    nodelist.verify = getattr(settings, "COTTON_CODEGEN_VERIFY", False)
+    nodelist.render_function, nodelist.source = generate_render_function(
+        template.nodelist, template.origin.name
+    )
+    template.nodelist = nodelist
+
+
+def generate_render_function(nodelist, name="<template>"):
+    """Return (function, source) for a function(context) that renders nodelist."""
+    generator = _Generator()
+    generator.emit("def render(context):")
+    generator.indent += 1
+    generator.emit("parts = []")
+    generator.emit("append = parts.append")
+    generator.nodelist(nodelist)
+    generator.emit("return SafeString(''.join(parts))")
+
+    source = "\n".join(generator.lines)
+    namespace = {
+        "SafeString": SafeString,
+        "escape": escape,
+        "_if_match": _if_match,
+        "_loop_values": loop_values,
+        "_iter_loop": iter_loop,
+        **generator.constants,
+    }
+    exec(compile(source, f"<cotton codegen {name}>", "exec"), namespace)
+    return namespace["render"], source
+
+
+class _Generator:
+    def __init__(self):
+        self.lines = []
+        self.indent = 0
+        self.constants = {}
+        self._counter = itertools.count()
+
+    def emit(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def constant(self, value, prefix="c"):
+        name = f"_{prefix}{next(self._counter)}"
+        self.constants[name] = value
+        return name
+
+    def nodelist(self, nodelist):
+        for node in nodelist:
+            node_type = type(node)
+            if node_type is TextNode:
+                if node.s:
+                    self.emit(f"append({node.s!r})")
+            elif node_type is VariableNode:
+                self.variable(node)
+            elif node_type is IfNode:
+                self.if_node(node)
+            elif node_type is ForNode:
+                self.for_node(node)
+            elif node_type is CottonVarsNode:
+                continue
+            else:
+                self.emit(f"append({self.constant(node, 'n')}.render_annotated(context))")
+
+    def variable(self, node):
+        node_name = self.constant(node, "n")
+        expression = node.filter_expression
+        lookups = getattr(expression.var, "lookups", None)
+        if expression.filters or lookups is None or len(lookups) != 1 or expression.var.translate:
+            self.emit(f"append({node_name}.render_annotated(context))")
+            return
+
+        # Context.__getitem__ is the first step of Variable._resolve_lookup. str and SafeString
+        # values render as themselves (escaped if needed); anything else goes through the node for
+        # callables, localization, string_if_invalid and so on.
+        value = f"v{next(self._counter)}"
+        self.emit("try:")
+        self.emit(f"    {value} = context[{lookups[0]!r}]")
+        self.emit("except KeyError:")
+        self.emit(f"    append({node_name}.render_annotated(context))")
+        self.emit("else:")
+        self.indent += 1
+        self.emit(f"if type({value}) is SafeString:")
+        self.emit(f"    append({value})")
+        self.emit(f"elif type({value}) is str:")
+        self.emit(f"    append(escape({value}) if context.autoescape else {value})")
+        self.emit("else:")
+        self.emit(f"    append({node_name}.render_annotated(context))")
+        self.indent -= 1
+
+    def if_node(self, node):
+        keyword = "if"
+        for condition, nodelist in node.conditions_nodelists:
+            if condition is None:
+                self.emit("else:")
+            else:
+                self.emit(f"{keyword} _if_match({self.constant(condition)}, context):")
+            keyword = "elif"
+            self.indent += 1
+            self.emit("pass")
+            self.nodelist(nodelist)
+            self.indent -= 1
+
+    def for_node(self, node):
+        n = next(self._counter)
+        node_name = self.constant(node, "n")
+        self.emit("with context.push():")
+        self.indent += 1
+        self.emit(f"values{n} = _loop_values({node_name}.sequence, context)")
+        self.emit(f"if len(values{n}) < 1:")
+        self.indent += 1
+        self.emit("pass")
+        self.nodelist(node.nodelist_empty)
+        self.indent -= 1
+        self.emit("else:")
+        self.indent += 1
+        self.emit(
+            f"for _ in _iter_loop(context, {node_name}.loopvars, values{n}, "
+            f"{node_name}.is_reversed):"
+        )
+        self.indent += 1
+        self.emit("pass")
+        self.nodelist(node.nodelist_loop)
+        self.indent -= 3
+
+
+def _if_match(condition, context):
+    try:
+        return condition.eval(context)
+    except VariableDoesNotExist:
+        return None
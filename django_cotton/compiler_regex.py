@@ -22,6 +22,8 @@ class Tag:
             return ""  # c-vars tags will be handled separately
         elif self.tag_name == "c-slot":
             return self._process_slot()
+        elif self.tag_name == "c-for":
+            return self._process_for()
         elif self.tag_name.startswith("c-"):
             return self._process_component()
         else:
@@ -37,6 +39,26 @@ class Tag:
         slot_name = name_match.group(2)
         return f"{{% cotton:slot {slot_name} %}}"
 
+    end_for_tag = "{% endcotton:for %}"
+
+    def _process_for(self) -> str:
+        """Convert a c-for tag to a Django template cotton:for tag"""
+        if self.is_closing:
+            return self.end_for_tag
+        attrs = {}
+        for match in self.attr_pattern.finditer(self.attrs):
+            key, _, value, unquoted_value = match.groups()
+            attrs[key.lstrip(":")] = value if value is not None else unquoted_value
+        if not attrs.get("each") or not attrs.get("as"):
+            raise ValueError(f"c-for tag must have 'each' and 'as' attributes: {self.html}")
+        opening_tag = self._for_tag(attrs["as"], attrs["each"])
+        if self.is_self_closing:
+            return f"{opening_tag}{self.end_for_tag}"
+        return opening_tag
+
+    def _for_tag(self, loopvar: str, sequence: str) -> str:
+        return f"{{% cotton:for {loopvar} in {sequence} %}}"
+
     def _process_component(self) -> str:
         """Convert a c- component tag to a Django template component tag"""
         component_name = self.tag_name[2:]
@@ -110,10 +132,13 @@ class CottonCompiler:
             html = html.replace(placeholder, content)
         return html
 
+    def make_tag(self, match: re.Match) -> Tag:
+        return Tag(match)
+
     def get_replacements(self, html: str) -> List[Tuple[str, str]]:
         replacements = []
         for match in Tag.tag_pattern.finditer(html):
-            tag = Tag(match)
+            tag = self.make_tag(match)
             try:
                 template_tag = tag.get_template_tag()
                 if template_tag != tag.html:
@@ -0,0 +1,143 @@
+"""
+Component name -> template path lookups. Components that exist as files are found by a scan of the
+cotton directories; other names are kept in an LRU cache of COTTON_COMPONENT_PATH_CACHE_SIZE
+entries.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.signals import setting_changed
+
+
+def template_path_for(component_name):
+    """Generate the path to the template for the given component name."""
+    component_tpl_path = component_name.replace(".", "/")
+
+    # Cotton by default will look for snake_case version of comp names. This can be configured to
+    # allow hyphenated names.
+    snaked_cased_named = getattr(settings, "COTTON_SNAKE_CASED_NAMES", True)
+    if snaked_cased_named:
+        component_tpl_path = component_tpl_path.replace("-", "_")
+
+    cotton_dir = getattr(settings, "COTTON_DIR", "cotton")
+    return f"{cotton_dir}/{component_tpl_path}.html"
+
+
+class ComponentPathCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # Both are set up on first use, when the settings and template engines are ready
+            self._known = None
+            self.maxsize = None
+            self._recent = OrderedDict()
+            self.known_hits = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get(self, component_name):
+        known = self._known
+        if known is None:
+            self.maxsize = getattr(settings, "COTTON_COMPONENT_PATH_CACHE_SIZE", 400)
+            known = self._known = self.scan()
+        path = known.get(component_name)
+        if path is not None:
+            self.known_hits += 1
+            return path
+
+        with self._lock:
+            path = self._recent.get(component_name)
+            if path is not None:
+                self.hits += 1
+                self._recent.move_to_end(component_name)
+                return path
+
+            self.misses += 1
+            path = template_path_for(component_name)
+            if self.maxsize is None or self.maxsize > 0:
+                self._recent[component_name] = path
+                if self.maxsize is not None and len(self._recent) > self.maxsize:
+                    self._recent.popitem(last=False)
+                    self.evictions += 1
+        return path
+
+    def scan(self):
+        """Return {component name: template path} for the components in the template directories."""
+        cotton_dir = getattr(settings, "COTTON_DIR", "cotton")
+        names = set()
+        for directory in template_dirs():
+            root = os.path.join(directory, cotton_dir)
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if not filename.endswith(".html"):
+                        continue
+                    parts = os.path.relpath(os.path.join(dirpath, filename[:-5]), root).split(
+                        os.sep
+                    )
+                    names.add(".".join(parts))
+                    # ui/card/index.html is the ui.card component
+                    if len(parts) > 1 and parts[-1] == "index":
+                        names.add(".".join(parts[:-1]))
+
+        # Names can be written with hyphens or underscores, and resolve to the same template
+        names |= {name.replace("_", "-") for name in names} | {
+            name.replace("-", "_") for name in names
+        }
+        return {name: template_path_for(name) for name in names}
+
+    def stats(self):
+        """(LRU cache, scanned mapping) statistics for django_cotton.stats()."""
+        from django_cotton.cache_stats import estimate_size
+
+        known = self._known or {}
+        recent_stats = {
+            "size": len(self._recent),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory_bytes": estimate_size([self._recent]) if self._recent else 0,
+        }
+        known_stats = {
+            "size": len(known),
+            "maxsize": None,
+            "hits": self.known_hits,
+            "misses": 0,
+            "evictions": 0,
+            "memory_bytes": estimate_size([known]) if known else 0,
+        }
+        return recent_stats, known_stats
+
+
+def template_dirs():
+    """The directories the template loaders look for component templates in."""
+    from django.template import engines
+
+    from django_cotton.cotton_loader import cotton_loaders
+
+    dirs = []
+    for loader in cotton_loaders():
+        dirs.extend(loader.get_dirs())
+    for backend in engines.all():
+        engine = getattr(backend, "engine", None)
+        if engine is not None:
+            dirs.extend(engine.dirs)
+    return list(dict.fromkeys(str(directory) for directory in dirs))
+
+
+component_paths = ComponentPathCache()
+
+
+def _setting_changed(setting, **kwargs):
+    if setting in ("COTTON_DIR", "COTTON_SNAKE_CASED_NAMES", "COTTON_COMPONENT_PATH_CACHE_SIZE"):
+        component_paths.reset()
+
+
+setting_changed.connect(_setting_changed)
@@ -10,7 +10,9 @@ from django.utils._os import safe_join
 from django.template import Template
 from django.apps import apps
 
+from django_cotton import profiling
 from django_cotton.compiler_regex import CottonCompiler
+from django_cotton.nested_tag_support import has_cotton_tags
 
 
 class Loader(BaseLoader):
@@ -24,17 +26,24 @@ class Loader(BaseLoader):
         cache_key = self.cache_handler.get_cache_key(origin)
         cached_content = self.cache_handler.get_cached_template(cache_key)
 
-        if cached_content is not None:
-            return cached_content
+        if cached_content is None:
+            template_string = self._get_template_string(origin.name)
 
-        template_string = self._get_template_string(origin.name)
+            if "<c-" not in template_string and "{% cotton:verbatim" not in template_string:
+                compiled = template_string
+            elif profiling.trace_hook is None:
+                compiled = self.cotton_compiler.process(template_string)
+            else:
+                with profiling.trace("cotton.compile", template=origin.name):
+                    compiled = self.cotton_compiler.process(template_string)
 
-        if "<c-" not in template_string and "{% cotton:verbatim" not in template_string:
-            compiled = template_string
+            self.cache_handler.cache_template(cache_key, compiled)
         else:
-            compiled = self.cotton_compiler.process(template_string)
+            compiled = cached_content
 
-        self.cache_handler.cache_template(cache_key, compiled)
+        # Tag the origin so that, with COTTON_SCOPED_TOKENIZER, only templates containing cotton
+        # tags are tokenized by the cotton-aware lexer
+        origin.has_cotton_tags = has_cotton_tags(compiled)
 
         return compiled
 
@@ -104,9 +113,17 @@ class CottonTemplateCacheHandler:
 
     def __init__(self):
         self.template_cache = {}
+        # Reported by django_cotton.stats()
+        self.hits = 0
+        self.misses = 0
 
     def get_cached_template(self, cache_key):
-        return self.template_cache.get(cache_key)
+        compiled = self.template_cache.get(cache_key)
+        if compiled is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return compiled
 
     def cache_template(self, cache_key, compiled_template):
         self.template_cache[cache_key] = compiled_template
@@ -124,3 +141,21 @@ class CottonTemplateCacheHandler:
 
     def reset(self):
         self.template_cache.clear()
+
+
+def cotton_loaders():
+    """The cotton template loaders of the configured Django template engines."""
+    from django.template import engines
+
+    found = []
+    for backend in engines.all():
+        engine = getattr(backend, "engine", None)
+        if engine is None:
+            continue
+        stack = list(engine.template_loaders)
+        while stack:
+            loader = stack.pop()
+            if isinstance(loader, Loader):
+                found.append(loader)
+            stack.extend(getattr(loader, "loaders", ()))
+    return found
@@ -0,0 +1,91 @@
+"""
+Batched data loading for components rendered many times on a page, via {% cotton:load %} and
+{% cotton:batch %} with the loaders declared in COTTON_DATA_LOADERS.
+"""
+
+import functools
+from collections.abc import Mapping
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from django_cotton.utils import get_cotton_data
+
+
+class DataLoader:
+    """Collects keys and loads them in batches. Subclasses implement batch_load()."""
+
+    def __init__(self):
+        self._cache = {}
+        self._pending = {}
+
+    def batch_load(self, keys):
+        """Return the values for keys, as a mapping of key to value or a sequence in keys' order."""
+        raise NotImplementedError("DataLoader subclasses must implement batch_load()")
+
+    def prime(self, key):
+        """Register key to be loaded by the next dispatch()."""
+        if key not in self._cache:
+            self._pending[key] = None
+
+    def is_loaded(self, key):
+        return key in self._cache
+
+    def load(self, key):
+        """Return the value for key, dispatching the pending keys with it if it isn't loaded yet."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            self._pending[key] = None
+            self.dispatch()
+            return self._cache[key]
+
+    def dispatch(self):
+        """Load all pending keys with a single call to batch_load()."""
+        if not self._pending:
+            return
+        keys = list(self._pending)
+        self._pending.clear()
+        results = self.batch_load(keys)
+        if not isinstance(results, Mapping):
+            results = dict(zip(keys, results))
+        for key in keys:
+            self._cache[key] = results.get(key)
+
+    @property
+    def has_pending(self):
+        return bool(self._pending)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_loader_class(path):
+    return import_string(path)
+
+
+def get_loader(context, name):
+    """Return the render's loader for a name from COTTON_DATA_LOADERS, creating it on first use."""
+    loaders = get_cotton_data(context).setdefault("loaders", {})
+    try:
+        return loaders[name]
+    except KeyError:
+        pass
+
+    try:
+        loader_class = getattr(settings, "COTTON_DATA_LOADERS", {})[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"No data loader named '{name}' in COTTON_DATA_LOADERS"
+        ) from None
+    if isinstance(loader_class, str):
+        loader_class = _import_loader_class(loader_class)
+
+    loader = loaders[name] = loader_class()
+    return loader
+
+
+def dispatch_loaders(context):
+    """Run one batch for every loader of the render that has pending keys."""
+    for loader in get_cotton_data(context).get("loaders", {}).values():
+        if loader.has_pending:
+            loader.dispatch()
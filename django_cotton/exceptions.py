@@ -1,2 +1,6 @@
 class CottonIncompleteDynamicComponentError(Exception):
     pass
+
+
+class CottonUncollectedAwaitableError(Exception):
+    pass
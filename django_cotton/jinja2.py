@@ -0,0 +1,230 @@
+"""
+Cotton components for Jinja2 templates, via the CottonExtension. Templates are compiled by
+CottonCompiler, with the <c-*> tags translated to Jinja calls, filters and sets instead of Django
+tags.
+"""
+
+import ast
+import functools
+import re
+from collections.abc import Mapping
+
+from jinja2 import pass_context
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from django_cotton.compiler_regex import CottonCompiler, Tag
+from django_cotton.templatetags import Attrs
+
+EXPRESSION_RE = re.compile(r"{{(.*?)}}", re.DOTALL)
+VARIABLE_RE = re.compile(r"^[A-Za-z_][\w.]*$")
+
+
+class JinjaTag(Tag):
+    """A <c-*> tag translated to Jinja, e.g. <c-button :count="n">Save</c-button> to
+    {% call(_cotton_slots) cotton_component('button', (('count', (n)),), False) %}Save{% endcall %}.
+    """
+
+    def __init__(self, match, restore):
+        super().__init__(match)
+        self._restore = restore
+
+    def _process_slot(self) -> str:
+        if self.is_closing:
+            return "{% endfilter %}"
+        name_match = re.search(r'name=(["\'])(.*?)\1', self.attrs, re.DOTALL)
+        if not name_match:
+            raise ValueError(f"c-slot tag must have a name attribute: {self.html}")
+        return f"{{% filter cotton_slot(_cotton_slots, {name_match.group(2)!r}) %}}"
+
+    end_for_tag = "{% endfor %}"
+
+    def _for_tag(self, loopvar, sequence):
+        return f"{{% for {loopvar} in {self._restore(sequence)} %}}"
+
+    def _process_component(self) -> str:
+        if self.is_closing:
+            return "{% endcall %}"
+        only = False
+        items = []
+        for key, expression in attrs_to_jinja(self.attrs, self._restore):
+            if key == "only" and expression is None:
+                only = True
+            else:
+                items.append(f"({key!r}, {'True' if expression is None else expression})")
+        pairs = ", ".join(items) + ("," if len(items) == 1 else "")
+        call = f"cotton_component({self.tag_name[2:]!r}, ({pairs}), {only})"
+        if self.is_self_closing:
+            return f"{{{{ {call} }}}}"
+        return f"{{% call(_cotton_slots) {call} %}}"
+
+
+def attrs_to_jinja(attrs, restore=lambda value: value):
+    """Yield (key, jinja_expression) for each attribute of a <c-*> tag, following cotton's rules.
+
+    The expression is None for attributes without a value.
+    """
+    for match in Tag.attr_pattern.finditer(attrs):
+        key, _, value, unquoted_value = match.groups()
+        if value is None and unquoted_value is None:
+            yield key, None
+        elif key.startswith("::"):
+            # Escaped colon (e.g. Alpine's :class), static
+            yield key[1:], repr(restore(value if value is not None else unquoted_value))
+        elif key.startswith(":"):
+            yield key[1:], f"({restore(value if value is not None else unquoted_value)})"
+        elif value is not None:
+            yield key, _quoted_value(restore(value))
+        else:
+            yield key, _unquoted_value(restore(unquoted_value))
+
+
+def _quoted_value(value):
+    if "{%" in value:
+        return f"cotton_render_attr({value!r})"
+    if "{{" not in value:
+        return repr(value)
+
+    # Literal text is marked safe and expression output is escaped, like a rendered Django template
+    parts = []
+    position = 0
+    for match in EXPRESSION_RE.finditer(value):
+        if match.start() > position:
+            parts.append(f"({value[position:match.start()]!r}|safe)")
+        parts.append(f"({match.group(1).strip()})")
+        position = match.end()
+    if position < len(value):
+        parts.append(f"({value[position:]!r}|safe)")
+    return "(" + " ~ ".join(parts) + ")" if len(parts) > 1 else f"(('' | safe) ~ {parts[0]})"
+
+
+def _unquoted_value(value):
+    try:
+        ast.literal_eval(value)
+        return f"({value})"
+    except (ValueError, SyntaxError):
+        pass
+    if VARIABLE_RE.match(value):
+        # A variable, falling back to the literal string when it's undefined
+        return f"({value} if {value} is defined else {value!r})"
+    # e.g. arrow-left or /home, which Django renders as literal strings too
+    return repr(value)
+
+
+class JinjaCottonCompiler(CottonCompiler):
+    """CottonCompiler producing Jinja syntax."""
+
+    def __init__(self):
+        super().__init__()
+        self.ignore_pattern = re.compile(
+            r"({%\s*raw\s*%}.*?{%\s*endraw\s*%}|" + self.ignore_pattern.pattern[1:], re.DOTALL
+        )
+        self._ignorables = []
+
+    def exclude_ignorables(self, html):
+        html, ignorables = super().exclude_ignorables(html)
+        self._ignorables = ignorables
+        return html, ignorables
+
+    def _restore(self, value):
+        if "__COTTON_IGNORE_" not in value:
+            return value
+        return self.restore_ignorables(value, self._ignorables)
+
+    def make_tag(self, match):
+        return JinjaTag(match, self._restore)
+
+    def process_c_vars(self, html):
+        matches = list(self.c_vars_pattern.finditer(html))
+        if len(matches) > 1:
+            raise ValueError(
+                "Multiple c-vars tags found in component template. "
+                "Only one c-vars tag is allowed per template."
+            )
+        if not matches:
+            return "", html
+
+        keys = []
+        defaults = []
+        for key, expression in attrs_to_jinja(matches[0].group(1), self._restore):
+            keys.append(key)
+            if expression is None:
+                # Declared without a default, only excluded from {{ attrs }}
+                continue
+            name = key.replace("-", "_")
+            provided = f"_cotton_provided[{name!r}] if {name!r} in _cotton_provided"
+            defaults.append(f"{{% set {name} = {provided} else {expression} %}}")
+
+        vars_content = f"{{% set attrs = cotton_exclude(attrs, {tuple(keys)!r}) %}}" + "".join(
+            defaults
+        )
+        return vars_content, self.c_vars_pattern.sub("", html)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_attr_template(environment, source):
+    return environment.from_string(source)
+
+
+@pass_context
+def cotton_render_attr(context, source):
+    """Render a quoted attribute value containing {% %} tags against the caller's variables."""
+    return Markup(_compile_attr_template(context.environment, source).render(context.get_all()))
+
+
+def cotton_exclude(attrs, keys):
+    for key in keys:
+        attrs.exclude_from_string_output(key)
+    return attrs
+
+
+def cotton_slot(content, slots, name):
+    slots[name] = Markup(content)
+    return ""
+
+
+@pass_context
+def cotton_component(context, name, items, only=False, caller=None):
+    from django_cotton.templatetags._component import CottonComponentNode
+
+    attrs = Attrs({})
+    for key, value in items:
+        if key == "attrs" and isinstance(value, Mapping):
+            attrs.dict.update(value)
+        else:
+            attrs[key] = value
+
+    template_path = CottonComponentNode._generate_component_template_path(name, attrs.get("is"))
+    template = context.environment.select_template(
+        [template_path, template_path.rsplit(".html", 1)[0] + "/index.html"]
+    )
+    attrs.exclude_from_string_output("is")
+
+    slots = {}
+    default_slot = Markup(caller(slots)) if caller is not None else Markup("")
+    provided = {**slots, **attrs.make_attrs_accessible()}
+
+    variables = {} if only else dict(context.get_all())
+    variables.update(provided)
+    variables["attrs"] = attrs
+    variables["slot"] = default_slot
+    variables["_cotton_provided"] = provided
+    return Markup(template.render(variables))
+
+
+class CottonExtension(Extension):
+    """Jinja2 extension compiling <c-*> component syntax."""
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.globals.update(
+            cotton_component=cotton_component,
+            cotton_exclude=cotton_exclude,
+            cotton_render_attr=cotton_render_attr,
+        )
+        environment.filters["cotton_slot"] = cotton_slot
+
+    def preprocess(self, source, name, filename=None):
+        if "<c-" not in source:
+            return source
+        return JinjaCottonCompiler().process(source)
@@ -0,0 +1,86 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+
+from django_cotton.cache_stats import stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Report size and estimated memory of cotton's caches. The caches belong to this fresh "
+        "process, so their hits, misses and evictions are near zero: they are only reported with "
+        "--load-templates, as the counts from compiling every template. Use django_cotton.stats() "
+        "in a running process for live counts."
+    )
+
+    COUNTERS = ("hits", "misses", "evictions")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--load-templates",
+            action="store_true",
+            help="Load every .html template of the Django template engines first, and report cache "
+            "hits, misses and evictions.",
+        )
+        parser.add_argument("--json", action="store_true", help="Output JSON.")
+
+    def handle(self, *args, **options):
+        if options["load_templates"]:
+            loaded, failed = self.load_templates()
+            if not options["json"]:
+                self.stdout.write(f"Loaded {loaded} templates ({failed} failed)\n")
+
+        result = stats()
+        columns = ("size", "maxsize", "hits", "misses", "evictions", "memory_bytes")
+        if not options["load_templates"]:
+            columns = tuple(column for column in columns if column not in self.COUNTERS)
+            result = {
+                name: {column: values[column] for column in columns}
+                for name, values in result.items()
+            }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(result, indent=2))
+            return
+
+        self.stdout.write(f"{'cache':<24}" + "".join(f"{column:>14}" for column in columns))
+        for name, values in result.items():
+            cells = "".join(
+                f"{'-' if values[column] is None else values[column]:>14}" for column in columns
+            )
+            self.stdout.write(f"{name:<24}{cells}")
+
+    def load_templates(self):
+        loaded = failed = 0
+        for backend in engines.all():
+            engine = getattr(backend, "engine", None)
+            if engine is None:
+                continue
+            for directory in self.template_dirs(engine):
+                for root, _, files in os.walk(directory):
+                    for filename in files:
+                        if not filename.endswith(".html"):
+                            continue
+                        name = os.path.relpath(os.path.join(root, filename), directory).replace(
+                            os.sep, "/"
+                        )
+                        try:
+                            engine.get_template(name)
+                            loaded += 1
+                        except (TemplateDoesNotExist, TemplateSyntaxError, UnicodeDecodeError):
+                            failed += 1
+        return loaded, failed
+
+    @staticmethod
+    def template_dirs(engine):
+        dirs = []
+        stack = list(engine.template_loaders)
+        while stack:
+            loader = stack.pop()
+            stack.extend(getattr(loader, "loaders", ()))
+            get_dirs = getattr(loader, "get_dirs", None)
+            if get_dirs is not None:
+                dirs.extend(str(directory) for directory in get_dirs())
+        return list(dict.fromkeys(dirs))
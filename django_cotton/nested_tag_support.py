@@ -6,9 +6,37 @@ This allows template tags inside quoted attributes of {% cotton %}, {% cotton:va
 For example:
 <c-my-component label="{% trans 'Loading' %}" />
 <c-vars default_text="{% blocktrans %}Hello, {{ user }}!{% endblocktrans %}" />
+
+By default Django's Lexer and DebugLexer are patched process-wide. With COTTON_SCOPED_TOKENIZER =
+True, only templates that the cotton loader has tagged as containing cotton tags are tokenized with
+the cotton-aware lexer; every other template (admin, emails, third-party apps) goes through Django's
+untouched lexer.
 """
+
+from django.conf import settings
 from django.template import base as template_base
 
+# Django's own implementations, captured before any patching happens
+_original_lexer_tokenize = template_base.Lexer.tokenize
+_original_debug_lexer_tokenize = template_base.DebugLexer.tokenize
+_original_compile_nodelist = template_base.Template.compile_nodelist
+
+COTTON_TAG_OPENINGS = (
+    "{% cotton ",
+    "{%cotton ",
+    "{% cotton:vars ",
+    "{%cotton:vars ",
+    "{% cotton:slot ",
+    "{%cotton:slot ",
+)
+
+
+def has_cotton_tags(template_string):
+    """Return True if the template string contains a {% cotton %}, vars or slot tag."""
+    # "{% cotton:vars " and "{% cotton:slot " both start with "{% cotton", so two searches cover all
+    # six openings
+    return "{% cotton" in template_string or "{%cotton" in template_string
+
 
 def _create_smart_tokenize(original_lexer_tokenize, original_debug_lexer_tokenize):
     """Create a smart tokenizer that handles {% cotton %} and {% cotton:vars %} tags specially."""
@@ -29,11 +57,7 @@ def _create_smart_tokenize(original_lexer_tokenize, original_debug_lexer_tokeniz
         template_string = self.template_string
 
         # Check if there are any Cotton tags at all
-        has_cotton_tags = "{% cotton " in template_string or "{%cotton " in template_string
-        has_cotton_vars_tags = "{% cotton:vars " in template_string or "{%cotton:vars " in template_string
-        has_cotton_slot_tags = "{% cotton:slot " in template_string or "{%cotton:slot " in template_string
-
-        if not has_cotton_tags and not has_cotton_vars_tags and not has_cotton_slot_tags:
+        if not has_cotton_tags(template_string):
             # No Cotton tags - use Django's original tokenizer
             # Use DebugLexer tokenize if this is a DebugLexer instance (respects engine.debug)
             if isinstance(self, template_base.DebugLexer):
@@ -47,15 +71,11 @@ def _create_smart_tokenize(original_lexer_tokenize, original_debug_lexer_tokeniz
 
         while position < len(template_string):
             # Look for the next Cotton tag ({% cotton %}, {% cotton:vars %}, or {% cotton:slot %})
-            next_cotton_tag = template_string.find("{% cotton ", position)
-            next_cotton_no_space = template_string.find("{%cotton ", position)
-            next_cotton_vars = template_string.find("{% cotton:vars ", position)
-            next_cotton_vars_no_space = template_string.find("{%cotton:vars ", position)
-            next_cotton_slot = template_string.find("{% cotton:slot ", position)
-            next_cotton_slot_no_space = template_string.find("{%cotton:slot ", position)
+            candidates = [
+                template_string.find(opening, position) for opening in COTTON_TAG_OPENINGS
+            ]
 
             # Find the earliest Cotton tag
-            candidates = [next_cotton_tag, next_cotton_no_space, next_cotton_vars, next_cotton_vars_no_space, next_cotton_slot, next_cotton_slot_no_space]
             valid_candidates = [c for c in candidates if c != -1]
 
             if not valid_candidates:
@@ -192,18 +212,69 @@ def _create_smart_tokenize(original_lexer_tokenize, original_debug_lexer_tokeniz
     return smart_tokenize
 
 
+class CottonLexer(template_base.Lexer):
+    """Lexer with nested tag support, used for cotton templates when the tokenizer is scoped."""
+
+    tokenize = _create_smart_tokenize(_original_lexer_tokenize, _original_debug_lexer_tokenize)
+
+
+class CottonDebugLexer(template_base.DebugLexer):
+    """DebugLexer with nested tag support, for cotton templates when the tokenizer is scoped."""
+
+    tokenize = _create_smart_tokenize(_original_lexer_tokenize, _original_debug_lexer_tokenize)
+
+
+def _cotton_compile_nodelist(template):
+    """Mirror of Template.compile_nodelist() that tokenizes with the cotton-aware lexer."""
+    if template.engine.debug:
+        lexer = CottonDebugLexer(template.source)
+    else:
+        lexer = CottonLexer(template.source)
+
+    parser = template_base.Parser(
+        lexer.tokenize(),
+        template.engine.template_libraries,
+        template.engine.template_builtins,
+        template.origin,
+    )
+
+    try:
+        nodelist = parser.parse()
+        # Parser.extra_data only exists on newer Django versions
+        if hasattr(parser, "extra_data"):
+            template.extra_data = parser.extra_data
+        return nodelist
+    except Exception as e:
+        if template.engine.debug:
+            e.template_debug = template.get_exception_info(e, e.token)
+        raise
+
+
+def _scoped_compile_nodelist(self):
+    """Only templates tagged by the cotton loader are tokenized with the cotton-aware lexer."""
+    if getattr(self.origin, "has_cotton_tags", False):
+        return _cotton_compile_nodelist(self)
+    return _original_compile_nodelist(self)
+
+
 def enable_nested_tag_support():
     """
     Enable nested tag support for Django's template lexer.
 
     Called during Django initialization in AppConfig.ready().
-    Patches both Lexer and DebugLexer to handle nested tags in Cotton component attributes.
+    Patches both Lexer and DebugLexer to handle nested tags in Cotton component attributes, or,
+    when COTTON_SCOPED_TOKENIZER is enabled, only Template.compile_nodelist so that templates the
+    cotton loader has not tagged use Django's original lexer. Calling it again re-applies the mode
+    for the current settings.
     """
-    # Capture originals before patching
-    original_lexer_tokenize = template_base.Lexer.tokenize
-    original_debug_lexer_tokenize = template_base.DebugLexer.tokenize
-
-    # Create and apply the smart tokenizer to both Lexer and DebugLexer
-    smart_tokenize = _create_smart_tokenize(original_lexer_tokenize, original_debug_lexer_tokenize)
-    template_base.Lexer.tokenize = smart_tokenize
-    template_base.DebugLexer.tokenize = smart_tokenize
+    if getattr(settings, "COTTON_SCOPED_TOKENIZER", False):
+        template_base.Lexer.tokenize = _original_lexer_tokenize
+        template_base.DebugLexer.tokenize = _original_debug_lexer_tokenize
+        template_base.Template.compile_nodelist = _scoped_compile_nodelist
+    else:
+        smart_tokenize = _create_smart_tokenize(
+            _original_lexer_tokenize, _original_debug_lexer_tokenize
+        )
+        template_base.Lexer.tokenize = smart_tokenize
+        template_base.DebugLexer.tokenize = smart_tokenize
+        template_base.Template.compile_nodelist = _original_compile_nodelist
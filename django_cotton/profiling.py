@@ -0,0 +1,438 @@
+"""
+Per-component render timing: profiles of a render as a tree of components, sampled latency
+histograms, slow render warnings (COTTON_SLOW_RENDER_MS) and tracing hooks (COTTON_TRACE_HOOK).
+"""
+
+import contextvars
+import json
+import logging
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.core.signals import setting_changed
+from django.http import JsonResponse
+from django.utils.module_loading import import_string
+
+PHASES = ("attrs", "slots", "vars", "render")
+
+slow_render_logger = logging.getLogger("django_cotton.slow_render")
+
+# True while slow render logging is on or there's a trace hook. Profiles only apply to their own
+# thread or task, see instrumented().
+active = False
+
+# COTTON_TRACE_HOOK, imported
+trace_hook = None
+
+# (default budget, per-component budgets) in milliseconds, or None when slow render logging is off
+_slow_render_budgets = None
+
+_lock = threading.Lock()
+_current = contextvars.ContextVar("cotton_profile", default=None)
+
+
+class ComponentRender:
+    """One render of a component."""
+
+    __slots__ = (
+        "name",
+        "template",
+        "parent",
+        "children",
+        "start",
+        "wall",
+        "cpu",
+        "phases",
+        "attrs",
+        "nesting",
+    )
+
+    def __init__(self, name, parent, start):
+        self.name = name
+        self.template = None
+        # For slow render logging: the component's attrs and the names of the components it's in
+        self.attrs = {}
+        self.nesting = []
+        self.parent = parent
+        self.children = []
+        self.start = start
+        self.wall = 0.0
+        self.cpu = 0.0
+        # phase -> (wall seconds, cpu seconds)
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            # A phase can be timed in several parts
+            previous_wall, previous_cpu = self.phases.get(name, (0.0, 0.0))
+            self.phases[name] = (
+                previous_wall + time.perf_counter() - wall,
+                previous_cpu + time.thread_time() - cpu,
+            )
+
+    def as_dict(self):
+        """The render and its children as nested dicts, with times in milliseconds."""
+        return {
+            "name": self.name,
+            "template": self.template,
+            "wall_ms": self.wall * 1000,
+            "cpu_ms": self.cpu * 1000,
+            "self_ms": (self.wall - sum(child.wall for child in self.children)) * 1000,
+            "phases": {
+                phase: {"wall_ms": times[0] * 1000, "cpu_ms": times[1] * 1000}
+                for phase, times in self.phases.items()
+            },
+            "children": [child.as_dict() for child in self.children],
+        }
+
+
+class RenderProfile:
+    """The component renders recorded by profile()."""
+
+    def __init__(self):
+        self.roots = []
+        self.start = time.perf_counter()
+        self._open = None
+
+    def enter(self, name):
+        record = ComponentRender(name, self._open, time.perf_counter())
+        if self._open is None:
+            self.roots.append(record)
+        else:
+            self._open.children.append(record)
+        self._open = record
+        return record
+
+    def exit(self, record, wall_start, cpu_start):
+        record.wall = time.perf_counter() - wall_start
+        record.cpu = time.thread_time() - cpu_start
+        self._open = record.parent
+
+    @contextmanager
+    def record(self, name):
+        """Time a component render, nested under the render in progress."""
+        wall, cpu = time.perf_counter(), time.thread_time()
+        record = self.enter(name)
+        try:
+            yield record
+        finally:
+            self.exit(record, wall, cpu)
+
+    def tree(self):
+        """The top-level component renders, as nested dicts."""
+        return [root.as_dict() for root in self.roots]
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.tree(), **kwargs)
+
+    def to_speedscope(self, name="cotton components"):
+        """The profile in speedscope's evented format, as a JSON string."""
+        frames = []
+        frame_index = {}
+        events = []
+
+        def add(record):
+            key = (record.name, record.template)
+            if key not in frame_index:
+                frame_index[key] = len(frames)
+                frames.append({"name": record.name, "file": record.template})
+            frame = frame_index[key]
+            start = (record.start - self.start) * 1000
+            events.append({"type": "O", "frame": frame, "at": start})
+            for child in record.children:
+                add(child)
+            events.append({"type": "C", "frame": frame, "at": start + record.wall * 1000})
+
+        for root in self.roots:
+            add(root)
+
+        return json.dumps(
+            {
+                "$schema": "https://www.speedscope.app/file-format-schema.json",
+                "shared": {"frames": frames},
+                "profiles": [
+                    {
+                        "type": "evented",
+                        "name": name,
+                        "unit": "milliseconds",
+                        "startValue": 0,
+                        "endValue": max((event["at"] for event in events), default=0),
+                        "events": events,
+                    }
+                ],
+            }
+        )
+
+
+def current_profile():
+    """The profile recording in this thread or task, if any."""
+    return _current.get()
+
+
+def instrumented(component_name):
+    """Whether a render of the component has to be timed or traced, rather than take the fast path.
+
+    True when a profile is recording in this thread or task, there's a trace hook, or the component
+    has a slow render budget.
+    """
+    if _current.get() is not None:
+        return True
+    if not active:
+        return False
+    if trace_hook is not None:
+        return True
+    budgets = _slow_render_budgets
+    if budgets is None:
+        return False
+    default, per_component = budgets
+    if component_name == "component":
+        # Dynamic components are budgeted by the name of the component they render, known once
+        # resolved
+        return default is not None or any(budget is not None for budget in per_component.values())
+    return per_component.get(component_name, default) is not None
+
+
+@contextmanager
+def profile():
+    """Record the component renders made inside the block into a RenderProfile."""
+    render_profile = RenderProfile()
+    token = _current.set(render_profile)
+    try:
+        yield render_profile
+    finally:
+        _current.reset(token)
+
+
+def configure():
+    """Read the slow render and tracing settings, when the app is ready and when they change."""
+    global _slow_render_budgets, trace_hook, active
+    default = getattr(settings, "COTTON_SLOW_RENDER_MS", None)
+    per_component = getattr(settings, "COTTON_SLOW_RENDER_MS_PER_COMPONENT", None) or {}
+    hook = getattr(settings, "COTTON_TRACE_HOOK", None)
+    if isinstance(hook, str):
+        hook = import_string(hook)
+    with _lock:
+        _slow_render_budgets = (
+            (default, dict(per_component)) if default is not None or per_component else None
+        )
+        trace_hook = hook
+        active = _slow_render_budgets is not None or trace_hook is not None
+
+
+def _setting_changed(setting, **kwargs):
+    if setting in (
+        "COTTON_SLOW_RENDER_MS",
+        "COTTON_SLOW_RENDER_MS_PER_COMPONENT",
+        "COTTON_TRACE_HOOK",
+    ):
+        configure()
+
+
+@contextmanager
+def record_render(name):
+    """Time a component render into the current profile, then log it if it went over its budget.
+
+    Yields the ComponentRender, on which the caller sets the template, attrs and nesting.
+    """
+    render_profile = _current.get()
+    if render_profile is None:
+        # Timed for slow render logging or tracing only. Nested components decide for themselves.
+        render_profile = RenderProfile()
+
+    with render_profile.record(name) as record:
+        yield record
+
+    budget = slow_render_budget(record)
+    if budget is not None:
+        log_slow_render(record, budget, record.attrs, record.nesting)
+
+
+def trace_render(record, depth):
+    """The trace hook's span for a component render, see trace()."""
+    return trace("cotton.render", component=record.name, depth=depth, template=record.template)
+
+
+def trace(event, **attributes):
+    """Call the trace hook, returning the context manager to run the traced work in."""
+    hook = trace_hook
+    if hook is None:
+        return nullcontext()
+    span = hook(event, **attributes)
+    if span is None or not hasattr(span, "__enter__"):
+        return nullcontext()
+    return span
+
+
+setting_changed.connect(_setting_changed)
+
+
+def slow_render_budget(record):
+    """The budget in milliseconds that a finished render went over, or None."""
+    budgets = _slow_render_budgets
+    if budgets is None:
+        return None
+    default, per_component = budgets
+    budget = per_component.get(record.name, default)
+    if budget is None or record.wall * 1000 <= budget:
+        return None
+    return budget
+
+
+def log_slow_render(record, budget, attrs, nesting):
+    duration = record.wall * 1000
+    slow_render_logger.warning(
+        "Component %s took %.1fms to render, over its %sms budget",
+        record.name,
+        duration,
+        budget,
+        extra={
+            "component": record.name,
+            "template": record.template,
+            "duration_ms": duration,
+            "budget_ms": budget,
+            "attr_keys": list(attrs),
+            "nesting": nesting,
+            "phases_ms": {phase: times[0] * 1000 for phase, times in record.phases.items()},
+        },
+    )
+
+
+# Each bucket's upper bound is 5% above the previous one's, so percentiles are within 5% of the
+# exact value
+_BUCKET_GROWTH = 1.05
+_LOG_BUCKET_GROWTH = math.log(_BUCKET_GROWTH)
+
+
+class LatencyHistogram:
+    """Render durations of one component, counted in logarithmic buckets starting at 1µs."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = {}
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        microseconds = seconds * 1_000_000
+        index = 0 if microseconds <= 1 else math.ceil(math.log(microseconds) / _LOG_BUCKET_GROWTH)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentile(self, percent):
+        """Seconds that percent of the renders took at most, rounded up to a bucket bound."""
+        if not self.count:
+            return 0.0
+        target = self.count * percent / 100
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(_BUCKET_GROWTH**index / 1_000_000, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+_histograms = {}
+_histograms_lock = threading.Lock()
+
+
+def record_latencies(render_profile):
+    """Add the duration of every component render in render_profile to the latency histograms."""
+    records = list(render_profile.roots)
+    with _histograms_lock:
+        while records:
+            record = records.pop()
+            histogram = _histograms.get(record.name)
+            if histogram is None:
+                histogram = _histograms[record.name] = LatencyHistogram()
+            histogram.add(record.wall)
+            records.extend(record.children)
+
+
+def latency_stats():
+    """Call count, mean, p50/p95/p99 and max render time per component, slowest p95 first."""
+    with _histograms_lock:
+        stats = {name: histogram.summary() for name, histogram in _histograms.items()}
+    return dict(sorted(stats.items(), key=lambda item: item[1]["p95_ms"], reverse=True))
+
+
+def reset_latency_stats():
+    with _histograms_lock:
+        _histograms.clear()
+
+
+def get_sample_rate():
+    return getattr(settings, "COTTON_PROFILING_SAMPLE_RATE", 0)
+
+
+@contextmanager
+def sample(rate=None):
+    """Record the block's component renders into the latency histograms, for a fraction of calls.
+
+    rate defaults to COTTON_PROFILING_SAMPLE_RATE. Yields the RenderProfile when the call is
+    sampled, else None.
+    """
+    if rate is None:
+        rate = get_sample_rate()
+    if not rate or random.random() >= rate:
+        yield None
+        return
+    with profile() as render_profile:
+        yield render_profile
+    record_latencies(render_profile)
+
+
+def latency_stats_view(request):
+    """latency_stats() as JSON, for staff users."""
+    user = getattr(request, "user", None)
+    if user is None or not user.is_staff:
+        raise PermissionDenied
+    return JsonResponse(latency_stats())
+
+
+class ProfilingMiddleware:
+    """Record a RenderProfile per request as request.cotton_profile, when COTTON_PROFILING is True.
+
+    Otherwise, with COTTON_PROFILING_SAMPLE_RATE set, record a sample of requests into the latency
+    histograms.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "COTTON_PROFILING", False)
+        self.sample_rate = get_sample_rate()
+
+    def __call__(self, request):
+        if self.enabled:
+            with profile() as render_profile:
+                request.cotton_profile = render_profile
+                response = self.get_response(request)
+            record_latencies(render_profile)
+            return response
+        if self.sample_rate:
+            with sample(self.sample_rate):
+                return self.get_response(request)
+        return self.get_response(request)
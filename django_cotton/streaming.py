@@ -0,0 +1,143 @@
+"""
+Streaming rendering of templates that use cotton components, yielding output at component
+boundaries and {% for %} iterations instead of joining the whole page in memory.
+"""
+
+import sys
+
+from django.template.base import Template, TextNode, VariableDoesNotExist
+from django.template.context import make_context
+from django.template.defaulttags import ForNode, IfNode
+from django.template.loader import get_template
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, BlockContext, BlockNode, ExtendsNode
+
+from django_cotton import profiling
+from django_cotton.templatetags._component import CottonComponentNode, iter_loop, loop_values
+
+
+def stream_template(template_name, context=None, request=None, using=None):
+    """Render a template like render_to_string(), yielding the output in chunks."""
+    backend_template = get_template(template_name, using=using)
+    template = backend_template.template
+    ctx = make_context(context, request, autoescape=template.engine.autoescape)
+    return iter_template(template, ctx)
+
+
+def iter_template(template, context):
+    """Equivalent of Template.render(context), yielding the output in chunks."""
+    # Like Template.render() while the test runner instruments it, for assertTemplateUsed
+    test_utils = sys.modules.get("django.test.utils")
+    if test_utils is not None and Template._render is test_utils.instrumented_test_render:
+        from django.test.signals import template_rendered
+
+        template_rendered.send(sender=template, template=template, context=context)
+
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                context.template_name = template.name
+                yield from iter_nodelist(template.nodelist, context)
+        else:
+            yield from iter_nodelist(template.nodelist, context)
+
+
+def iter_nodelist(nodelist, context):
+    """Equivalent of NodeList.render(context), yielding the output in chunks."""
+    for node in nodelist:
+        node_type = type(node)
+        if node_type is TextNode:
+            yield node.s
+        elif node_type is CottonComponentNode:
+            yield from _iter_component(node, context)
+        elif node_type is ForNode:
+            yield from _iter_for(node, context)
+        elif node_type is IfNode:
+            yield from _iter_if(node, context)
+        elif node_type is ExtendsNode:
+            yield from _iter_extends(node, context)
+        elif node_type is BlockNode:
+            yield from _iter_block(node, context)
+        else:
+            yield node.render_annotated(context)
+
+
+def _iter_component(node, context):
+    if profiling.instrumented(node.component_name):
+        yield node.render_annotated(context)
+        return
+
+    cotton_data, template, component_state = node._prepare(context)
+
+    new_context = node._get_isolated_context(context, component_state)
+    if new_context is not None:
+        yield from iter_template(template, new_context)
+    else:
+        with context.push(component_state):
+            yield from iter_template(template, context)
+
+    cotton_data["stack"].pop()
+
+
+def _iter_for(node, context):
+    with context.push():
+        values = loop_values(node.sequence, context)
+        if len(values) < 1:
+            yield from iter_nodelist(node.nodelist_empty, context)
+            return
+        for _ in iter_loop(context, node.loopvars, values, node.is_reversed):
+            yield from iter_nodelist(node.nodelist_loop, context)
+
+
+def _iter_if(node, context):
+    # Mirrors IfNode.render()
+    for condition, nodelist in node.conditions_nodelists:
+        if condition is not None:  # if / elif clause
+            try:
+                match = condition.eval(context)
+            except VariableDoesNotExist:
+                match = None
+        else:  # else clause
+            match = True
+
+        if match:
+            yield from iter_nodelist(nodelist, context)
+            return
+
+
+def _iter_extends(node, context):
+    # Mirrors ExtendsNode.render()
+    compiled_parent = node.get_parent(context)
+
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(node.blocks)
+
+    for parent_node in compiled_parent.nodelist:
+        if not isinstance(parent_node, TextNode):
+            if not isinstance(parent_node, ExtendsNode):
+                blocks = {n.name: n for n in compiled_parent.nodelist.get_nodes_by_type(BlockNode)}
+                block_context.add_blocks(blocks)
+            break
+
+    with context.render_context.push_state(compiled_parent, isolated_context=False):
+        yield from iter_nodelist(compiled_parent.nodelist, context)
+
+
+def _iter_block(node, context):
+    # Mirrors BlockNode.render()
+    block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
+    with context.push():
+        if block_context is None:
+            context["block"] = node
+            yield from iter_nodelist(node.nodelist, context)
+        else:
+            push = block = block_context.pop(node.name)
+            if block is None:
+                block = node
+            block = type(node)(block.name, block.nodelist)
+            block.context = context
+            context["block"] = block
+            yield from iter_nodelist(block.nodelist, context)
+            if push is not None:
+                block_context.push(node.name, push)
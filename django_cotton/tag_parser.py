@@ -6,13 +6,26 @@ as atomic units, allowing template tags and variables within attribute values.
 
 Based on django-components' approach to handle complex attribute values.
 """
+import re
 from typing import Dict, List, Tuple, Any, NamedTuple
 from django.template.exceptions import TemplateSyntaxError
 
 
 # Parsing delimiters
 WHITESPACE = " \t\n"
-ATTR_KEY_DELIMITERS = "= \t\n"  # Attribute keys stop at '=' or whitespace
+
+# Scanners that jump straight to the next significant position instead of walking character by
+# character
+WHITESPACE_RE = re.compile(r"[ \t\n]*")
+NON_WHITESPACE_RE = re.compile(r"[^ \t\n]*")
+ATTR_KEY_RE = re.compile(r"[^= \t\n]*")  # Attribute keys stop at '=' or whitespace
+
+# Significant tokens inside a quoted value, in priority order: escapes, Django syntax delimiters,
+# the quote itself
+QUOTED_VALUE_TOKEN_RES = {
+    quote_char: re.compile(r"\\.|\{\{|\}\}|\{%|%\}|" + quote_char, re.DOTALL)
+    for quote_char in ('"', "'")
+}
 
 
 class ComponentTagResult(NamedTuple):
@@ -31,30 +44,22 @@ class VarsTagResult(NamedTuple):
 
 
 def _skip_whitespace(tag_content: str, index: int) -> int:
-    while index < len(tag_content) and tag_content[index] in WHITESPACE:
-        index += 1
-    return index
+    return WHITESPACE_RE.match(tag_content, index).end()
 
 
 def _parse_component_name(tag_content: str, index: int) -> Tuple[str, int]:
-    name_start = index
-    while index < len(tag_content) and tag_content[index] not in WHITESPACE:
-        index += 1
-    return tag_content[name_start:index], index
+    end = NON_WHITESPACE_RE.match(tag_content, index).end()
+    return tag_content[index:end], end
 
 
 def _parse_attribute_key(tag_content: str, index: int) -> Tuple[str, int]:
-    key_start = index
-    while index < len(tag_content) and tag_content[index] not in ATTR_KEY_DELIMITERS:
-        index += 1
-    return tag_content[key_start:index], index
+    end = ATTR_KEY_RE.match(tag_content, index).end()
+    return tag_content[index:end], end
 
 
 def _parse_unquoted_value(tag_content: str, index: int) -> Tuple[str, int]:
-    value_start = index
-    while index < len(tag_content) and tag_content[index] not in WHITESPACE:
-        index += 1
-    return tag_content[value_start:index], index
+    end = NON_WHITESPACE_RE.match(tag_content, index).end()
+    return tag_content[index:end], end
 
 
 def _skip_tag_name(tag_content: str, tag_name: str) -> int:
@@ -87,40 +92,32 @@ def _parse_quoted_value(tag_content: str, start_index: int, quote_char: str) ->
 
     Returns: (value_with_quotes, new_index)
     """
-    index = start_index
-    value_start = index
+    value_start = start_index
 
     # Track when we're inside {{ }} or {% %} blocks to ignore quotes within them
     django_var_depth = 0
     django_tag_depth = 0
 
-    while index < len(tag_content):
-        if tag_content[index] == "\\" and index + 1 < len(tag_content):
-            index += 2
-        elif tag_content[index : index + 2] == "{{":
+    # Only escapes, {{ }}, {% %} and the quote char affect parsing, so jump between those
+    for match in QUOTED_VALUE_TOKEN_RES[quote_char].finditer(tag_content, start_index):
+        token = match.group()
+        if token == "{{":
             django_var_depth += 1
-            index += 2
-        elif tag_content[index : index + 2] == "}}":
+        elif token == "}}":
             django_var_depth = max(0, django_var_depth - 1)
-            index += 2
-        elif tag_content[index : index + 2] == "{%":
+        elif token == "{%":
             django_tag_depth += 1
-            index += 2
-        elif tag_content[index : index + 2] == "%}":
+        elif token == "%}":
             django_tag_depth = max(0, django_tag_depth - 1)
-            index += 2
-        elif tag_content[index] == quote_char and django_var_depth == 0 and django_tag_depth == 0:
-            value = tag_content[value_start:index]
+        elif token == quote_char and django_var_depth == 0 and django_tag_depth == 0:
+            value = tag_content[value_start : match.start()]
             value_with_quotes = quote_char + value + quote_char
-            index += 1
-            return value_with_quotes, index
-        else:
-            index += 1
+            return value_with_quotes, match.end()
 
     # Unclosed quote
     value = tag_content[value_start:]
     value_with_quotes = quote_char + value
-    return value_with_quotes, index
+    return value_with_quotes, len(tag_content)
 
 
 def _parse_attributes(
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Mapping
 from typing import Set, Any, Dict, List, Tuple
 
 from django.template import Library
 from django.template.base import (
-    DebugLexer,
-    Lexer,
     Origin,
     Parser,
     UNKNOWN_SOURCE,
@@ -14,6 +13,7 @@ from django.template.base import (
 from django.template.engine import Engine
 from django.utils.safestring import mark_safe
 
+from django_cotton.nested_tag_support import CottonDebugLexer, CottonLexer
 from django_cotton.utils import ensure_quoted
 
 
@@ -52,14 +52,54 @@ def strip_quotes_with_status(value: Any) -> Tuple[Any, bool]:
     return value, False
 
 
-def snapshot_parser_library(parser: Parser) -> Library:
-    """Capture the parser's active tag and filter table at this parse point."""
+def parser_library_fingerprint(parser: Parser) -> Tuple[tuple, tuple] | None:
+    """Return a hashable identity of the parser's active tag and filter table at this parse point.
+
+    Returns None if any registered tag or filter is unhashable, in which case the table can't be
+    shared. The fingerprint is kept on the parser until a {% load %} adds or replaces a tag or
+    filter, so a template's cotton tags don't each rebuild it.
+    """
+    # Compared by identity, so that a library which only overrides existing names is noticed too
+    values = (tuple(parser.tags.values()), tuple(parser.filters.values()))
+    cached = getattr(parser, "_cotton_library_fingerprint", None)
+    if cached is not None and cached[0] == values:
+        return cached[1]
+
+    fingerprint = (tuple(parser.tags.items()), tuple(parser.filters.items()))
+    try:
+        hash(fingerprint)
+    except TypeError:
+        fingerprint = None
+    parser._cotton_library_fingerprint = (values, fingerprint)
+    return fingerprint
+
+
+def _build_library(tags, filters) -> Library:
     active_library = Library()
-    active_library.tags.update(parser.tags)
-    active_library.filters.update(parser.filters)
+    active_library.tags.update(tags)
+    active_library.filters.update(filters)
     return active_library
 
 
+@functools.lru_cache(maxsize=64)
+def library_from_fingerprint(fingerprint: Tuple[tuple, tuple]) -> Library:
+    """Return the shared Library for a fingerprint from parser_library_fingerprint()."""
+    tags, filters = fingerprint
+    return _build_library(tags, filters)
+
+
+def snapshot_parser_library(parser: Parser) -> Library:
+    """Capture the parser's active tag and filter table at this parse point.
+
+    Parse points with the same active table share a single Library instead of each holding their
+    own copy.
+    """
+    fingerprint = parser_library_fingerprint(parser)
+    if fingerprint is None:
+        return _build_library(parser.tags, parser.filters)
+    return library_from_fingerprint(fingerprint)
+
+
 def compile_inline_template(value: str, active_library: Library | None = None) -> InlineTemplate:
     """Compile a template fragment at parse time for later rendering.
 
@@ -72,7 +112,7 @@ def compile_inline_template(value: str, active_library: Library | None = None) -
     if active_library is None:
         nodelist = engine.from_string(value).nodelist
     else:
-        lexer = DebugLexer(value) if engine.debug else Lexer(value)
+        lexer = CottonDebugLexer(value) if engine.debug else CottonLexer(value)
         parser = Parser(
             lexer.tokenize(),
             engine.template_libraries,
@@ -93,15 +133,28 @@ class Attrs(Mapping):
         self._attrs = attrs
         self._exclude_from_str: Set[str] = set()
         self._unprocessable: List[str] = []
+        # key -> (value, fragment) for values whose string output was rendered at parse time
+        self._fragments: Dict[str, Tuple[Any, str]] = {}
 
     def __str__(self):
-        return mark_safe(
-            " ".join(
-                f"{k}" if v is True else f"{k}={ensure_quoted(v)}"
-                for k, v in self._attrs.items()
-                if k not in self._exclude_from_str
-            )
-        )
+        fragments = self._fragments
+        parts = []
+        for k, v in self._attrs.items():
+            if k in self._exclude_from_str:
+                continue
+            fragment = fragments.get(k)
+            # The fragment only applies while the value it was rendered from hasn't been replaced
+            if fragment is not None and fragment[0] is v:
+                parts.append(fragment[1])
+            elif v is True:
+                parts.append(k)
+            else:
+                parts.append(f"{k}={ensure_quoted(v)}")
+        return mark_safe(" ".join(parts))
+
+    def __html__(self):
+        # Lets markupsafe (e.g. Jinja2 autoescaping) treat the output as safe, as Django does
+        return str(self)
 
     def __getitem__(self, key):
         return self._attrs[key]
@@ -124,6 +177,11 @@ class Attrs(Mapping):
     def values(self):
         return self._attrs.values()
 
+    def set_with_fragment(self, key, value, fragment):
+        """Set a value along with its pre-rendered string output, e.g. 'key="value"'."""
+        self._attrs[key] = value
+        self._fragments[key] = (value, fragment)
+
     # Custom methods to allow modifications
     @property
     def dict(self):
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import ast
 import functools
+import inspect
 import warnings
 import weakref
 from enum import IntEnum
-from typing import Any, NamedTuple
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
 from django.conf import settings
 from django.template import Library, TemplateDoesNotExist
@@ -18,13 +20,20 @@ from django.template.base import (
 from django.template.context import Context, RequestContext
 from django.template.loader import get_template
 
-from django_cotton.utils import get_cotton_data
-from django_cotton.exceptions import CottonIncompleteDynamicComponentError
+from django_cotton import profiling
+from django_cotton.component_paths import component_paths
+from django_cotton.utils import ensure_quoted, get_cotton_data
+from django_cotton.exceptions import (
+    CottonIncompleteDynamicComponentError,
+    CottonUncollectedAwaitableError,
+)
 from django_cotton.templatetags import (
     Attrs,
     InlineTemplate,
     UnprocessableDynamicAttr,
     compile_inline_template,
+    library_from_fingerprint,
+    parser_library_fingerprint,
     snapshot_parser_library,
     strip_quotes_with_status,
 )
@@ -54,6 +63,10 @@ def _check_deprecated_isolation_setting():
 
 _MISSING = object()
 
+# Context isolation modes, see CottonComponentNode._get_isolation_mode()
+_ISOLATE_ONLY = "only"
+_ISOLATE_PARTIAL = "partial"
+
 
 class AttrKind(IntEnum):
     BOOLEAN = 0
@@ -68,6 +81,8 @@ class PreparedAttr(NamedTuple):
     kind: AttrKind
     value: Any
     compiled: Any
+    # Pre-rendered string output for BOOLEAN and STATIC attrs, e.g. 'disabled' or 'class="btn"'
+    fragment: str | None = None
 
 
 class PreparedValue:
@@ -168,7 +183,7 @@ def _prepare_attrs(attrs: dict[str, Any], active_library: Library | None) -> lis
         value, was_quoted = strip_quotes_with_status(raw_value)
 
         if value is True:
-            prepared.append(PreparedAttr(key, AttrKind.BOOLEAN, True, None))
+            prepared.append(PreparedAttr(key, AttrKind.BOOLEAN, True, None, key))
 
         elif key.startswith("::"):
             compiled = _try_compile_template(value, active_library)
@@ -184,12 +199,109 @@ def _prepare_attrs(attrs: dict[str, Any], active_library: Library | None) -> lis
 
         else:
             compiled = _try_compile_template(value, active_library)
-            kind = AttrKind.ESCAPED if compiled else AttrKind.STATIC
-            prepared.append(PreparedAttr(key, kind, value, compiled))
+            if compiled:
+                prepared.append(PreparedAttr(key, AttrKind.ESCAPED, value, compiled))
+            else:
+                fragment = f"{key}={ensure_quoted(value)}"
+                prepared.append(PreparedAttr(key, AttrKind.STATIC, value, None, fragment))
 
     return prepared
 
 
+def _substitute_awaited(awaited: dict[int, tuple[Any, Any]], value: Any) -> Any:
+    """Return the awaited result if value is one of the collected awaitables, else value itself."""
+    entry = awaited.get(id(value))
+    if entry is not None and entry[0] is value:
+        return entry[1]
+    if inspect.isawaitable(value):
+        # Not reached by the collection pass, e.g. in a nested component or a loop body
+        if inspect.iscoroutine(value):
+            value.close()
+        raise CottonUncollectedAwaitableError(
+            "Cotton error: an awaitable attribute value was not resolved before rendering. "
+            "arender_to_string() only resolves awaitables passed to the components of the "
+            "rendered template itself."
+        )
+    return value
+
+
+def loop_values(sequence, context):
+    """Resolve the sequence of a loop to sized values, like {% for %} does."""
+    values = sequence.resolve(context, ignore_failures=True)
+    if values is None:
+        return []
+    if not hasattr(values, "__len__"):
+        values = list(values)
+    return values
+
+
+def iter_loop(context, loopvars, values, is_reversed=False):
+    """Bind loopvars to each item of values in turn, with a `forloop` like {% for %} sets.
+
+    Mirrors ForNode.render(), for values from loop_values(). The caller renders the loop body for
+    each item yielded, inside its own context.push().
+    """
+    length = len(values)
+    if is_reversed:
+        values = reversed(values)
+    unpack = len(loopvars) > 1
+    forloop = context["forloop"] = {"parentloop": context.get("forloop", {})}
+    for index, item in enumerate(values):
+        forloop["counter0"] = index
+        forloop["counter"] = index + 1
+        forloop["revcounter"] = length - index
+        forloop["revcounter0"] = length - index - 1
+        forloop["first"] = index == 0
+        forloop["last"] = index == length - 1
+
+        if not unpack:
+            context[loopvars[0]] = item
+            yield item
+            continue
+
+        try:
+            len_item = len(item)
+        except TypeError:  # not an iterable
+            len_item = 1
+        if len(loopvars) != len_item:
+            raise ValueError(
+                "Need {} values to unpack in for loop; got {}. ".format(len(loopvars), len_item),
+            )
+        context.update(dict(zip(loopvars, item)))
+        yield item
+        context.pop()
+
+
+class ParsedComponentTag(NamedTuple):
+    """Parse result of a {% cotton %} tag, shared by nodes with the same contents and library."""
+
+    name: str
+    # Read-only, as it's shared
+    attrs: Mapping[str, Any]
+    only: bool
+    prepared_attrs: tuple[PreparedAttr, ...]
+    active_library: Library | None
+
+
+def _parse_component_tag(contents: str, active_library: Library | None) -> ParsedComponentTag:
+    from django_cotton.tag_parser import parse_component_tag
+
+    result = parse_component_tag(contents)
+    prepared_attrs = tuple(_prepare_attrs(result.attrs, active_library))
+    attrs = MappingProxyType(result.attrs)
+    return ParsedComponentTag(result.name, attrs, result.only, prepared_attrs, active_library)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_component_tag_cached(contents: str, fingerprint: tuple) -> ParsedComponentTag:
+    """Process-wide cache of parsed tags, keyed by token contents and active library fingerprint.
+
+    The same invocation (e.g. {% cotton icon name="check" / %}) often appears hundreds of times
+    across a project's templates; they all share one set of PreparedAttr/PreparedValue objects.
+    """
+    return _parse_component_tag(contents, library_from_fingerprint(fingerprint))
+
+
 class CottonComponentNode(Node):
     # Keyed by the Template object itself (not id(template)). Using id() is unsafe
     # because CPython reuses an address once an object is GC'd, so in development
@@ -198,6 +310,9 @@ class CottonComponentNode(Node):
     # WeakKeyDictionary keys on identity and auto-evicts when the template dies,
     # so production keeps the cache while dev always re-extracts a new template.
     _vars_node_cache: "weakref.WeakKeyDictionary[Any, list[Node]]" = weakref.WeakKeyDictionary()
+    # Reported by django_cotton.stats()
+    _vars_node_cache_hits = 0
+    _vars_node_cache_misses = 0
 
     def __init__(
         self,
@@ -206,17 +321,142 @@ class CottonComponentNode(Node):
         attrs,
         only,
         active_library: Library | None = None,
+        prepared_attrs: tuple[PreparedAttr, ...] | None = None,
     ):
         self.component_name = component_name
         self.nodelist = nodelist
         self.attrs = attrs
         self.only = only
         self.active_library = active_library
-        self._prepared_attrs = _prepare_attrs(attrs, active_library)
+        if prepared_attrs is None:
+            prepared_attrs = tuple(_prepare_attrs(attrs, active_library))
+        self._prepared_attrs = prepared_attrs
 
     def render(self, context):
+        if profiling.instrumented(self.component_name):
+            return self._render_profiled(context)
+
+        cotton_data, template, component_state = self._prepare(context)
+
+        new_context = self._get_isolated_context(context, component_state)
+        if new_context is not None:
+            output = template.render(new_context)
+        else:
+            with context.push(component_state):
+                output = template.render(context)
+
+        cotton_data["stack"].pop()
+
+        return output
+
+    def _render_profiled(self, context):
+        """render(), timing each phase into the current profile, inside the trace hook's span."""
+        cotton_data = get_cotton_data(context)
+        with profiling.record_render(self.component_name) as record:
+            with record.phase("attrs"):
+                component_data = self._resolve_component_data(context, cotton_data)
+            if self.component_name == "component":
+                record.name = component_data["attrs"].get("is", record.name)
+            # The template is loaded before the slots are rendered, so the span can be opened with
+            # its origin
+            with record.phase("vars"):
+                template = self._get_cached_template(context, component_data["attrs"])
+            record.template = template.origin.name
+            record.attrs = component_data["attrs"]
+            record.nesting = [data["key"] for data in cotton_data["stack"]]
+
+            with profiling.trace_render(record, len(cotton_data["stack"]) - 1):
+                with record.phase("slots"):
+                    default_slot = self.nodelist.render(context)
+                with record.phase("vars"):
+                    component_state = self._build_component_state(
+                        context,
+                        cotton_data,
+                        component_data,
+                        default_slot,
+                        self._get_vars_nodes(template),
+                    )
+
+                with record.phase("render"):
+                    new_context = self._get_isolated_context(context, component_state)
+                    if new_context is not None:
+                        output = template.render(new_context)
+                    else:
+                        with context.push(component_state):
+                            output = template.render(context)
+
+        cotton_data["stack"].pop()
+        return output
+
+    def _prepare(self, context):
+        """Resolve attrs, slots and vars, and push this component onto the cotton stack.
+
+        Returns (cotton_data, template, component_state). The caller renders the template and pops
+        the stack.
+        """
+        cotton_data = get_cotton_data(context)
+        component_data = self._resolve_component_data(context, cotton_data)
+
+        # Render the nodelist to process any slot tags and vars
+        default_slot = self.nodelist.render(context)
+
+        # Load the component template first
+        template = self._get_cached_template(context, component_data["attrs"])
+
+        component_state = self._build_component_state(
+            context, cotton_data, component_data, default_slot, self._get_vars_nodes(template)
+        )
+        return cotton_data, template, component_state
+
+    def render_each(self, context, loopvar, values, prefix="", suffix=""):
+        """Render the component once per item of values, bound to loopvar, with prefix and suffix.
+
+        Equivalent to rendering it in a {% for %} loop, but the work that doesn't depend on the item
+        (cotton state, template lookup, vars nodes and the isolation settings) is done once for the
+        whole loop.
+        """
         cotton_data = get_cotton_data(context)
+        stack = cotton_data["stack"]
+        isolation = self._get_isolation_mode()
+        has_nodelist = bool(self.nodelist)
+
+        template = vars_nodes = None
+        if self.component_name != "component":
+            # Only dynamic components pick their template per item, through their 'is' attribute
+            template = self._get_cached_template(context, Attrs({}))
+            vars_nodes = self._get_vars_nodes(template)
+
+        output = []
+        with context.push():
+            for _ in iter_loop(context, (loopvar,), values):
+                component_data = self._resolve_component_data(context, cotton_data)
+                default_slot = self.nodelist.render(context) if has_nodelist else ""
+                item_template = template
+                if item_template is None:
+                    item_template = self._get_cached_template(context, component_data["attrs"])
+                    vars_nodes = self._get_vars_nodes(item_template)
+                component_state = self._build_component_state(
+                    context, cotton_data, component_data, default_slot, vars_nodes
+                )
 
+                if isolation is None:
+                    with context.push(component_state):
+                        rendered = item_template.render(context)
+                elif isolation is _ISOLATE_ONLY:
+                    rendered = item_template.render(Context(component_state))
+                else:
+                    rendered = item_template.render(
+                        self._create_partial_context(context, component_state)
+                    )
+                stack.pop()
+
+                output.append(prefix)
+                output.append(rendered)
+                output.append(suffix)
+        return "".join(output)
+
+    def _resolve_component_data(self, context, cotton_data):
+        """Resolve the tag's attrs and push a new component onto the cotton stack."""
         # Push a new component onto the stack
         component_data = {
             "key": self.component_name,
@@ -225,10 +465,13 @@ class CottonComponentNode(Node):
         }
         cotton_data["stack"].append(component_data)
 
+        # Results of awaitables resolved ahead of the render by django_cotton.async_render
+        awaited = cotton_data.get("awaited")
+
         for attr in self._prepared_attrs:
             # Boolean attribute (no value, e.g. `disabled`)
             if attr.kind == AttrKind.BOOLEAN:
-                component_data["attrs"][attr.key] = True
+                component_data["attrs"].set_with_fragment(attr.key, True, attr.fragment)
 
             # :: prefix (Alpine.js colon escaping) or quoted value with {{ }}/{% %}
             elif attr.kind == AttrKind.ESCAPED:
@@ -240,6 +483,8 @@ class CottonComponentNode(Node):
             elif attr.kind == AttrKind.DYNAMIC:
                 try:
                     resolved = attr.compiled.resolve(context)
+                    if awaited is not None:
+                        resolved = _substitute_awaited(awaited, resolved)
                     if attr.key == "attrs":
                         component_data["attrs"].dict.update(resolved)
                     else:
@@ -250,27 +495,32 @@ class CottonComponentNode(Node):
             # No quotes — treated as dynamic, falls back to string literal
             elif attr.kind == AttrKind.UNQUOTED:
                 try:
-                    component_data["attrs"][attr.key] = attr.compiled.resolve(context)
+                    resolved = attr.compiled.resolve(context)
+                    if awaited is not None:
+                        resolved = _substitute_awaited(awaited, resolved)
+                    component_data["attrs"][attr.key] = resolved
                 except UnprocessableDynamicAttr:
                     component_data["attrs"][attr.key] = attr.value
 
             # Plain static value
             else:
-                component_data["attrs"][attr.key] = attr.value
-
-        # Render the nodelist to process any slot tags and vars
-        default_slot = self.nodelist.render(context)
+                component_data["attrs"].set_with_fragment(attr.key, attr.value, attr.fragment)
 
-        # Load the component template first
-        template = self._get_cached_template(context, component_data["attrs"])
+        return component_data
 
+    def _build_component_state(
+        self, context, cotton_data, component_data, default_slot, vars_nodes
+    ):
+        """Return the context dict the component template is rendered with."""
         # Exclude 'is' from attrs string output - it's only used for dynamic component resolution
         component_data["attrs"].exclude_from_string_output("is")
 
         # Extract vars from the component template
-        vars = self._extract_vars_from_template(
-            template, context, component_data["attrs"], component_data["slots"]
-        )
+        vars = {}
+        for node in vars_nodes:
+            vars.update(
+                node.extract_vars(context, component_data["attrs"], component_data["slots"])
+            )
 
         # Prepare the cotton-specific data
         # Vars go first so component attrs can override them
@@ -282,7 +532,10 @@ class CottonComponentNode(Node):
             "slot": default_slot,
             "cotton_data": cotton_data,
         }
+        return component_state
 
+    def _get_isolation_mode(self):
+        """Return _ISOLATE_ONLY, _ISOLATE_PARTIAL, or None to share the caller's context."""
         _check_deprecated_isolation_setting()
         isolate_by_default = getattr(settings, "COTTON_ISOLATE_BY_DEFAULT", False)
         # Backward-compat: old experimental setting, deprecated in favour of COTTON_ISOLATE_BY_DEFAULT
@@ -290,19 +543,21 @@ class CottonComponentNode(Node):
 
         if self.only:
             # Total Isolation (Traditional behavior): No access to any parent or global context.
-            output = template.render(Context(component_state))
+            return _ISOLATE_ONLY
         elif isolate_by_default or enable_context_isolation:
             # Smart Isolation (New behavior): Isolate from parent template leaks but preserve global context processors
-            new_context = self._create_partial_context(context, component_state)
-            output = template.render(new_context)
-        else:
-            # Legacy/No isolation: Push to existing context stack
-            with context.push(component_state):
-                output = template.render(context)
-
-        cotton_data["stack"].pop()
+            return _ISOLATE_PARTIAL
+        # Legacy/No isolation: Push to existing context stack
+        return None
 
-        return output
+    def _get_isolated_context(self, context, component_state):
+        """Return the Context to render the template with, or None to push onto the caller's."""
+        isolation = self._get_isolation_mode()
+        if isolation is _ISOLATE_ONLY:
+            return Context(component_state)
+        elif isolation is _ISOLATE_PARTIAL:
+            return self._create_partial_context(context, component_state)
+        return None
 
     def _get_cached_template(self, context, attrs):
         cache = context.render_context.get(self)
@@ -319,6 +574,7 @@ class CottonComponentNode(Node):
             template = get_template(template_path)
             if hasattr(template, "template"):
                 template = template.template
+            self._maybe_apply_codegen(template_path, template)
             cache[template_path] = template
             return template
         except TemplateDoesNotExist:
@@ -333,9 +589,18 @@ class CottonComponentNode(Node):
             template = get_template(fallback_path)
             if hasattr(template, "template"):
                 template = template.template
+            self._maybe_apply_codegen(template_path, template)
             cache[fallback_path] = template
             return template
 
+    @staticmethod
+    def _maybe_apply_codegen(template_path, template):
+        if getattr(settings, "COTTON_CODEGEN", None):
+            from django_cotton.codegen import apply_codegen, codegen_enabled_for
+
+            if codegen_enabled_for(template_path):
+                apply_codegen(template)
+
     def _create_partial_context(self, original_context, component_state):
         # Smart Isolation: block parent template scope, but preserve context
         # processor output. We reuse the processor snapshot from the parent
@@ -369,24 +634,20 @@ class CottonComponentNode(Node):
                 return None
         return None
 
-    def _extract_vars_from_template(self, template, context, attrs, slots):
-        """Extract vars from any CottonVarsNode instances in the template."""
+    def _get_vars_nodes(self, template):
+        """Return the CottonVarsNode instances at the top level of a component template."""
         from django_cotton.templatetags._vars import CottonVarsNode
 
         vars_nodes = self._vars_node_cache.get(template)
         if vars_nodes is None:
+            CottonComponentNode._vars_node_cache_misses += 1
             vars_nodes = [n for n in template.nodelist if isinstance(n, CottonVarsNode)]
             self._vars_node_cache[template] = vars_nodes
-
-        vars = {}
-        for node in vars_nodes:
-            node_vars = node.extract_vars(context, attrs, slots)
-            vars.update(node_vars)
-
-        return vars
+        else:
+            CottonComponentNode._vars_node_cache_hits += 1
+        return vars_nodes
 
     @staticmethod
-    @functools.lru_cache(maxsize=400)
     def _generate_component_template_path(component_name: str, is_: str | None) -> str:
         """Generate the path to the template for the given component name."""
         if component_name == "component":
@@ -396,15 +657,7 @@ class CottonComponentNode(Node):
                 )
             component_name = is_
 
-        component_tpl_path = component_name.replace(".", "/")
-
-        # Cotton by default will look for snake_case version of comp names. This can be configured to allow hyphenated names.
-        snaked_cased_named = getattr(settings, "COTTON_SNAKE_CASED_NAMES", True)
-        if snaked_cased_named:
-            component_tpl_path = component_tpl_path.replace("-", "_")
-
-        cotton_dir = getattr(settings, "COTTON_DIR", "cotton")
-        return f"{cotton_dir}/{component_tpl_path}.html"
+        return component_paths.get(component_name)
 
 
 def cotton_component(parser, token):
@@ -414,17 +667,18 @@ def cotton_component(parser, token):
     Uses custom parser to preserve quotes and handle template tags in attributes.
     Supports self-closing syntax: {% cotton name /%} or {% cotton name / %}
     """
-    from django_cotton.tag_parser import parse_component_tag
     from django.template import NodeList
 
     # Check if this is a self-closing tag
     is_self_closing = token.contents.rstrip().endswith('/') or token.contents.rstrip().endswith(' /')
 
-    # Use the custom parser that preserves quotes and handles nested template tags
-    result = parse_component_tag(token.contents)
-
-    # Snapshot the caller template's active tag/filter scope at this parse point.
-    active_library = snapshot_parser_library(parser)
+    # Use the custom parser that preserves quotes and handles nested template tags. Identical tag
+    # contents parsed under the caller template's active tag/filter scope share one cached result.
+    fingerprint = parser_library_fingerprint(parser)
+    if fingerprint is None:
+        result = _parse_component_tag(token.contents, snapshot_parser_library(parser))
+    else:
+        result = _parse_component_tag_cached(token.contents, fingerprint)
 
     if is_self_closing:
         # Self-closing tag has no content
@@ -433,4 +687,17 @@ def cotton_component(parser, token):
         nodelist = parser.parse(("endcotton",))
         parser.delete_first_token()
 
-    return CottonComponentNode(result.name, nodelist, result.attrs, result.only, active_library)
+    node = CottonComponentNode(
+        result.name,
+        nodelist,
+        result.attrs,
+        result.only,
+        result.active_library,
+        result.prepared_attrs,
+    )
+
+    if getattr(settings, "COTTON_INLINE_COMPONENTS", False):
+        from django_cotton.templatetags._inline import inline_component
+
+        return inline_component(node) or node
+    return node
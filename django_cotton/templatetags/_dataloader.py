@@ -0,0 +1,80 @@
+from django.template.base import Node, TemplateSyntaxError, VariableDoesNotExist
+from django.urls import NoReverseMatch
+
+from django_cotton.dataloader import dispatch_loaders, get_loader
+from django_cotton.utils import get_cotton_data
+
+
+def cotton_load(parser, token):
+    bits = token.split_contents()
+    if len(bits) != 5 or bits[3] != "as":
+        raise TemplateSyntaxError(
+            f"'{bits[0]}' tag must be used as {{% {bits[0]} \"loader_name\" key as variable %}}"
+        )
+    return CottonLoadNode(parser.compile_filter(bits[1]), parser.compile_filter(bits[2]), bits[4])
+
+
+def cotton_batch(parser, token):
+    nodelist = parser.parse(("endcotton:batch",))
+    parser.delete_first_token()
+    return CottonBatchNode(nodelist)
+
+
+class CottonLoadNode(Node):
+    def __init__(self, loader_name, key, target_var):
+        self.loader_name = loader_name
+        self.key = key
+        self.target_var = target_var
+
+    def render(self, context):
+        loader = get_loader(context, self.loader_name.resolve(context))
+        key = self.key.resolve(context)
+
+        if get_cotton_data(context).get("collecting") and not loader.is_loaded(key):
+            loader.prime(key)
+            context[self.target_var] = None
+        else:
+            context[self.target_var] = loader.load(key)
+        return ""
+
+
+# What a tag can raise when a loaded variable is still the None placeholder
+PLACEHOLDER_ERRORS = (TypeError, ValueError, AttributeError, NoReverseMatch, VariableDoesNotExist)
+
+
+class CottonBatchNode(Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        cotton_data = get_cotton_data(context)
+        if cotton_data.get("collecting"):
+            # Nested in another batch, which collects for both
+            return self.nodelist.render(context)
+
+        # Collection pass. render_context is pushed so that stateful tags like {% cycle %} start
+        # over for the real pass. Everything in the region other than the loads, queries included,
+        # runs in both passes.
+        stack_depth = len(cotton_data["stack"])
+        cotton_data["collecting"] = True
+        try:
+            with context.render_context.push():
+                output = self.nodelist.render(context)
+        except PLACEHOLDER_ERRORS:
+            # A tag that fails on a None placeholder, e.g. {% url %} with a loaded argument, ends
+            # the collection early. The keys it didn't reach are loaded on their own by the real
+            # pass, which raises real errors. Any other error, such as a DatabaseError that would
+            # leave an atomic block unusable for the real pass, is raised as it is.
+            output = None
+            del cotton_data["stack"][stack_depth:]
+        finally:
+            cotton_data["collecting"] = False
+
+        if output is not None and not any(
+            loader.has_pending for loader in cotton_data.get("loaders", {}).values()
+        ):
+            # Every load was already cached, so the collection pass rendered the real output
+            return output
+
+        dispatch_loaders(context)
+        return self.nodelist.render(context)
@@ -0,0 +1,65 @@
+from django.template.base import Node, NodeList, TemplateSyntaxError, TextNode
+
+from django_cotton import profiling
+from django_cotton.templatetags._component import CottonComponentNode, iter_loop, loop_values
+
+
+def cotton_for(parser, token):
+    bits = token.split_contents()
+    if len(bits) != 4 or bits[2] != "in":
+        raise TemplateSyntaxError(
+            f"'{bits[0]}' tag must be used as {{% {bits[0]} item in items %}}"
+        )
+
+    nodelist = parser.parse(("empty", "endcotton:for"))
+    token = parser.next_token()
+    if token.contents == "empty":
+        nodelist_empty = parser.parse(("endcotton:for",))
+        parser.delete_first_token()
+    else:
+        nodelist_empty = None
+    return CottonForNode(bits[1], parser.compile_filter(bits[3]), nodelist, nodelist_empty)
+
+
+class CottonForNode(Node):
+    """Repeats its content per item of a sequence, like {% for %}, with forloop and {% empty %}.
+
+    When the content is a single component, optionally surrounded by text, the component is rendered
+    through CottonComponentNode.render_each(), which does the per-component setup once for the whole
+    loop.
+    """
+
+    child_nodelists = ("nodelist", "nodelist_empty")
+
+    def __init__(self, loopvar, sequence, nodelist, nodelist_empty=None):
+        self.loopvar = loopvar
+        self.sequence = sequence
+        self.nodelist = nodelist
+        self.nodelist_empty = nodelist_empty or NodeList()
+
+        self.component = None
+        self.prefix = self.suffix = ""
+        components = [node for node in nodelist if not isinstance(node, TextNode)]
+        if len(components) == 1 and type(components[0]) is CottonComponentNode:
+            self.component = components[0]
+            index = nodelist.index(self.component)
+            self.prefix = "".join(node.s for node in nodelist[:index])
+            self.suffix = "".join(node.s for node in nodelist[index + 1 :])
+
+    def render(self, context):
+        values = loop_values(self.sequence, context)
+        if not values:
+            return self.nodelist_empty.render(context)
+
+        # When instrumented, each item renders through CottonComponentNode.render() to be timed
+        # separately
+        if self.component is not None and not profiling.instrumented(self.component.component_name):
+            return self.component.render_each(
+                context, self.loopvar, values, self.prefix, self.suffix
+            )
+
+        output = []
+        with context.push():
+            for _ in iter_loop(context, (self.loopvar,), values):
+                output.append(self.nodelist.render(context))
+        return "".join(output)
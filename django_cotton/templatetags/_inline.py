@@ -0,0 +1,107 @@
+"""
+Compile-time inlining of static components (COTTON_INLINE_COMPONENTS): a component tag whose
+attributes and content are all static is resolved once, and its template's nodes are spliced into
+the calling template.
+"""
+
+from django.template import Context, NodeList, TemplateDoesNotExist
+from django.template.base import Node, TextNode
+from django.template.loader import get_template
+from django.template.loader_tags import ExtendsNode
+from django.utils.safestring import mark_safe
+
+from django_cotton import profiling
+from django_cotton.templatetags._component import AttrKind
+from django_cotton.templatetags._vars import CottonVarsNode
+from django_cotton.utils import get_cotton_data
+
+STATIC_KINDS = (AttrKind.STATIC, AttrKind.BOOLEAN)
+
+# Templates being inlined, so a component that renders itself is left to the regular path
+_inlining = set()
+
+
+def inline_component(node):
+    """Return an InlinedComponentNode equivalent to node, or None if it can't be inlined."""
+    if node.component_name == "component" or node._get_isolation_mode() is not None:
+        return None
+    if any(attr.kind not in STATIC_KINDS for attr in node._prepared_attrs):
+        return None
+    if any(type(child) is not TextNode for child in node.nodelist):
+        return None
+
+    template_path = node._generate_component_template_path(node.component_name, None)
+    if template_path in _inlining:
+        return None
+    _inlining.add(template_path)
+    try:
+        template = _load_template(template_path)
+    finally:
+        _inlining.discard(template_path)
+    if template is None:
+        return None
+
+    vars_nodes = node._get_vars_nodes(template)
+    for vars_node in vars_nodes:
+        if any(var.kind is not AttrKind.STATIC for var in vars_node._prepared_vars):
+            return None
+    if any(isinstance(child, ExtendsNode) for child in template.nodelist):
+        return None
+
+    # Nothing depends on the context, so resolve with an empty one
+    context = Context()
+    cotton_data = {"stack": [], "vars": {}}
+    component_data = node._resolve_component_data(context, cotton_data)
+    default_slot = mark_safe("".join(child.s for child in node.nodelist))
+    state = node._build_component_state(
+        context, cotton_data, component_data, default_slot, vars_nodes
+    )
+    # The render's own cotton_data is already in the caller's context
+    del state["cotton_data"]
+
+    nodelist = NodeList(
+        child for child in template.nodelist if not isinstance(child, CottonVarsNode)
+    )
+    return InlinedComponentNode(node.component_name, template, nodelist, state)
+
+
+def _load_template(template_path):
+    # Same lookup as CottonComponentNode._get_cached_template, without the per-render cache
+    for path in (template_path, template_path.rsplit(".html", 1)[0] + "/index.html"):
+        try:
+            template = get_template(path)
+        except TemplateDoesNotExist:
+            continue
+        return getattr(template, "template", template)
+    return None
+
+
+class InlinedComponentNode(Node):
+    child_nodelists = ("nodelist",)
+
+    def __init__(self, component_name, template, nodelist, state):
+        self.component_name = component_name
+        self.template = template
+        self.nodelist = nodelist
+        self.state = state
+
+    def render(self, context):
+        if profiling.instrumented(self.component_name):
+            return self._render_profiled(context)
+        return self._render(context)
+
+    def _render_profiled(self, context):
+        stack = get_cotton_data(context)["stack"]
+        with profiling.record_render(self.component_name) as record:
+            record.template = self.template.origin.name
+            record.attrs = self.state["attrs"]
+            # Inlined components aren't pushed onto the cotton stack
+            record.nesting = [data["key"] for data in stack] + [self.component_name]
+            with profiling.trace_render(record, len(stack)), record.phase("render"):
+                return self._render(context)
+
+    def _render(self, context):
+        # push_state keeps render_context (e.g. {% cycle %}) separate per component render, like
+        # Template.render
+        with context.render_context.push_state(self.template), context.push(self.state):
+            return self.nodelist.render(context)
@@ -1,27 +1,60 @@
+import functools
+
 from django import template
 from django.utils.html import format_html_join
 
 from django_cotton.templatetags._component import cotton_component
 from django_cotton.templatetags._vars import cotton_cvars
 from django_cotton.templatetags._slot import cotton_slot
+from django_cotton.templatetags._dataloader import cotton_batch, cotton_load
+from django_cotton.templatetags._for import cotton_for
 
 register = template.Library()
 register.tag("cotton", cotton_component)
 register.tag("cotton:slot", cotton_slot)
 register.tag("cotton:vars", cotton_cvars)
+register.tag("cotton:load", cotton_load)
+register.tag("cotton:batch", cotton_batch)
+register.tag("cotton:for", cotton_for)
 
 
-@register.filter
-def merge(attrs, args):
-    # attrs is expected to be a dictionary of existing attributes
-    # args is a string of additional attributes to merge, e.g., "class:extra-class"
+@functools.lru_cache(maxsize=256)
+def parse_merge_spec(args):
+    """Parse a merge argument such as "class:extra-class,id:main" into ((key, value), ...) pairs."""
+    spec = []
     for arg in args.split(","):
         key, value = arg.split(":", 1)
-        if key in attrs:
-            attrs[key] = value + " " + attrs[key]
+        spec.append((key, value))
+    return tuple(spec)
+
+
+def _merge_to_html(items, spec):
+    merged = dict(items)
+    for key, value in spec:
+        if key in merged:
+            merged[key] = value + " " + merged[key]
         else:
-            attrs[key] = value
-    return format_html_join(" ", '{0}="{1}"', attrs.items())
+            merged[key] = value
+    return format_html_join(" ", '{0}="{1}"', merged.items())
+
+
+_merge_to_html_cached = functools.lru_cache(maxsize=1024)(_merge_to_html)
+
+
+@register.filter
+def merge(attrs, args):
+    # attrs is expected to be a dictionary (or Attrs) of existing attributes
+    # args is a string of additional attributes to merge, e.g., "class:extra-class"
+    # The caller's attrs are left untouched, so the same attrs can be merged more than once.
+    spec = parse_merge_spec(args)
+    items = tuple(attrs.items())
+
+    # Components rendered in loops usually merge the same plain string attrs over and over, so their
+    # output is shared. Other values may be unhashable, or compare equal while rendering differently
+    # (1 vs True).
+    if all(type(value) is str for _, value in items):
+        return _merge_to_html_cached(items, spec)
+    return _merge_to_html(items, spec)
 
 
 @register.filter
@@ -0,0 +1,80 @@
+from django.template import Context, Template
+from django.template.loader import get_template
+from django.test import override_settings
+
+from django_cotton.codegen import CodegenNodeList, generate_render_function
+from django_cotton.tests.utils import CottonTestCase, get_compiled, get_rendered
+
+
+class CodegenTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_template(
+            "cotton/codegen_card.html",
+            """<c-vars title="Untitled" tone />"""
+            """<div {{ attrs }}>{{ title }}{% if tone == "warn" %}!{% elif tone %}?{% else %}."""
+            """{% endif %}"""
+            """{% for item in items %}<i>{{ forloop.counter }}{{ item }}{{ item|upper }}</i>"""
+            """{% empty %}none{% endfor %}"""
+            """{% for a, b in pairs reversed %}{{ a }}{{ b }}{% cycle "x" "y" %}"""
+            """{% for c in a %}{{ forloop.parentloop.counter }}{{ forloop.last }}{% endfor %}"""
+            """{% endfor %}"""
+            """{{ slot }}{{ count }}</div>""",
+        )
+        self.source = (
+            """<c-codegen-card title="<b>" :items="items" :pairs="pairs" :count="3">{{ html }}"""
+            """</c-codegen-card>"""
+            """<c-codegen-card tone="warn" class="x" />"""
+        )
+        self.context = {"items": ["a", "<"], "pairs": [("p", 1), ("q", 2)], "html": "<em>"}
+
+    def test_matches_node_render(self):
+        expected = get_rendered(self.source, self.context)
+
+        with self.settings(COTTON_CODEGEN=["codegen-card"], COTTON_CODEGEN_VERIFY=True):
+            with self.assertNoLogs("django_cotton.codegen"):
+                rendered = get_rendered(self.source, self.context)
+                again = get_rendered(self.source, self.context)
+
+        self.assertEqual(rendered, expected)
+        self.assertEqual(again, expected)
+        self.assertIn("&lt;b&gt;.", rendered)
+        self.assertIn("<i>2&lt;&lt;</i>", rendered)
+
+    def test_only_listed_components_are_compiled(self):
+        self.create_template("cotton/codegen_other.html", "{{ slot }}")
+
+        with self.settings(COTTON_CODEGEN=["codegen-card"]):
+            get_rendered("""<c-codegen-card /><c-codegen-other />""")
+
+        self.assertIsInstance(
+            get_template("cotton/codegen_card.html").template.nodelist, CodegenNodeList
+        )
+        self.assertNotIsInstance(
+            get_template("cotton/codegen_other.html").template.nodelist, CodegenNodeList
+        )
+
+    def test_mismatch_falls_back_to_node_render(self):
+        nodelist = Template("{{ name }}").nodelist
+        render_function, source = generate_render_function(nodelist)
+        self.assertIn("context['name']", source)
+
+        codegen_nodelist = CodegenNodeList(nodelist)
+        codegen_nodelist.origin_name = "broken.html"
+        codegen_nodelist.render_function = lambda context: "wrong"
+
+        codegen_nodelist.verify = True
+
+        with self.assertLogs("django_cotton.codegen", "WARNING"):
+            self.assertEqual(codegen_nodelist.render(Context({"name": "right"})), "right")
+        self.assertIsNone(codegen_nodelist.render_function)
+
+    def test_autoescape_off_and_non_string_values(self):
+        nodelist = Template(
+            "{% autoescape off %}{{ name }}{% endautoescape %}{{ name }}{{ number }}"
+        ).nodelist
+        render_function, _ = generate_render_function(nodelist)
+
+        context = {"name": "<b>", "number": 1000}
+        self.assertEqual(render_function(Context(context)), nodelist.render(Context(context)))
+        self.assertEqual(render_function(Context(context, autoescape=False)), "<b><b>1000")
@@ -0,0 +1,103 @@
+from django.template import Context, Template
+from django.test import override_settings
+
+from django_cotton.templatetags._component import CottonComponentNode
+from django_cotton.templatetags._inline import InlinedComponentNode
+from django_cotton.tests.utils import CottonTestCase, get_compiled
+
+
+@override_settings(COTTON_INLINE_COMPONENTS=True)
+class InlineComponentsTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_template(
+            "cotton/inline_button.html",
+            """<c-vars size="md" disabled /><button {{ attrs }} data-size="{{ size }}">"""
+            """{{ slot }}{% cycle "1" "2" %}</button>""",
+        )
+
+    def compile(self, source):
+        return Template(get_compiled(source))
+
+    def assert_same_as_regular(self, source, context=None):
+        inlined = self.compile(source).render(Context(context or {}))
+        with self.settings(COTTON_INLINE_COMPONENTS=False):
+            regular = self.compile(source).render(Context(context or {}))
+        self.assertEqual(inlined, regular)
+        return inlined
+
+    def test_static_component_is_inlined(self):
+        template = self.compile(
+            """<c-inline-button class="btn" size="lg" required>Save</c-inline-button>"""
+        )
+
+        self.assertIsInstance(template.nodelist[0], InlinedComponentNode)
+        self.assertEqual(
+            template.render(Context()),
+            '<button class="btn" required data-size="lg">Save1</button>',
+        )
+
+    def test_output_matches_regular_rendering(self):
+        rendered = self.assert_same_as_regular(
+            """<c-inline-button />|<c-inline-button class="a">Go</c-inline-button>|"""
+            """{% for i in items %}<c-inline-button />{% endfor %}""",
+            {"items": [1, 2], "size": "leaked"},
+        )
+        self.assertIn('<button  data-size="md">1</button>', rendered)
+
+    def test_parent_context_is_still_visible(self):
+        self.create_template("cotton/inline_greeting.html", """Hi {{ user_name }}""")
+
+        self.assertEqual(
+            self.assert_same_as_regular("""<c-inline-greeting />""", {"user_name": "Ann"}), "Hi Ann"
+        )
+
+    def test_dynamic_components_are_not_inlined(self):
+        sources = [
+            """<c-inline-button :size="size" />""",
+            """<c-inline-button label="{{ size }}" />""",
+            """<c-inline-button>{{ size }}</c-inline-button>""",
+            """<c-inline-button only />""",
+            """<c-component is="inline-button" />""",
+        ]
+        for source in sources:
+            with self.subTest(source=source):
+                self.assertIsInstance(self.compile(source).nodelist[0], CottonComponentNode)
+                self.assert_same_as_regular(source, {"size": "sm"})
+
+    def test_components_with_dynamic_vars_are_not_inlined(self):
+        self.create_template(
+            "cotton/inline_dynamic_vars.html", """<c-vars :size="default_size" />{{ size }}"""
+        )
+
+        template = self.compile("""<c-inline-dynamic-vars />""")
+
+        self.assertIsInstance(template.nodelist[0], CottonComponentNode)
+        self.assertEqual(template.render(Context({"default_size": "xl"})), "xl")
+
+    def test_nested_static_components_are_inlined(self):
+        self.create_template(
+            "cotton/inline_toolbar.html", """<nav><c-inline-button>A</c-inline-button></nav>"""
+        )
+
+        template = self.compile("""<c-inline-toolbar />""")
+
+        self.assertIsInstance(template.nodelist[0], InlinedComponentNode)
+        self.assertIsInstance(template.nodelist[0].nodelist[1], InlinedComponentNode)
+        self.assertEqual(
+            template.render(Context()), '<nav><button  data-size="md">A1</button></nav>'
+        )
+
+    def test_recursive_component_is_not_inlined_into_itself(self):
+        self.create_template(
+            "cotton/inline_tree.html",
+            """<c-vars depth="0" />[{% if not stop %}{% with stop=True %}<c-inline-tree />"""
+            """{% endwith %}{% endif %}]""",
+        )
+
+        self.assertEqual(self.assert_same_as_regular("""<c-inline-tree />"""), "[[]]")
+
+    def test_missing_component_keeps_regular_node(self):
+        template = self.compile("""<c-inline-missing />""")
+
+        self.assertIsInstance(template.nodelist[0], CottonComponentNode)
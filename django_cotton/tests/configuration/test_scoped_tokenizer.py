@@ -0,0 +1,61 @@
+from django.template import base as template_base
+from django.template.loader import get_template
+
+from django_cotton import nested_tag_support
+from django_cotton.nested_tag_support import enable_nested_tag_support
+from django_cotton.tests.utils import CottonTestCase
+
+
+class ScopedTokenizerTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scoped_settings = self.settings(COTTON_SCOPED_TOKENIZER=True)
+        self.scoped_settings.enable()
+        enable_nested_tag_support()
+
+    def tearDown(self):
+        self.scoped_settings.disable()
+        # Re-apply the process-wide patch the rest of the suite relies on
+        enable_nested_tag_support()
+        super().tearDown()
+
+    def test_django_lexer_is_left_untouched(self):
+        self.assertIs(template_base.Lexer.tokenize, nested_tag_support._original_lexer_tokenize)
+        self.assertIs(
+            template_base.DebugLexer.tokenize, nested_tag_support._original_debug_lexer_tokenize
+        )
+
+    def test_nested_tags_still_work_in_cotton_templates(self):
+        self.create_template("cotton/scoped_label.html", "<span>{{ label }}</span>")
+        self.create_template(
+            "scoped_view.html",
+            """<c-scoped-label label="{% if True %}Yes{% endif %} and {{ 'more'|upper }}" />""",
+            "view/",
+        )
+
+        with self.settings(ROOT_URLCONF=self.url_conf()):
+            response = self.client.get("/view/")
+            self.assertContains(response, "<span>Yes and MORE</span>")
+
+    def test_only_templates_with_cotton_tags_are_tagged(self):
+        self.create_template("cotton/scoped_child.html", "child")
+        self.create_template("with_cotton.html", "<c-scoped-child />")
+        self.create_template("without_cotton.html", "{% if True %}plain{% endif %}")
+
+        self.assertTrue(get_template("with_cotton.html").template.origin.has_cotton_tags)
+        self.assertFalse(get_template("without_cotton.html").template.origin.has_cotton_tags)
+        self.assertEqual(get_template("without_cotton.html").render(), "plain")
+
+    def test_default_mode_patches_django_lexer(self):
+        self.scoped_settings.disable()
+        enable_nested_tag_support()
+        try:
+            self.assertIsNot(
+                template_base.Lexer.tokenize, nested_tag_support._original_lexer_tokenize
+            )
+            self.assertIs(
+                template_base.Template.compile_nodelist,
+                nested_tag_support._original_compile_nodelist,
+            )
+        finally:
+            self.scoped_settings.enable()
@@ -0,0 +1,73 @@
+from unittest import mock
+
+from django.template.loader import render_to_string
+from django.test import override_settings
+
+from django_cotton import profiling
+from django_cotton.tests.utils import CottonTestCase
+
+
+class SlowRenderLoggingTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_template("cotton/slow_icon.html", """<i>{{ name }}</i>""")
+        self.create_template(
+            "cotton/slow_card.html", """<div>{{ slot }}<c-slow-icon name="x" /></div>"""
+        )
+        self.create_template(
+            "slow_page.html",
+            """<c-slow-card class="card" :size="size"><c-slow-icon name="y" /></c-slow-card>""",
+        )
+
+    def render_logged(self):
+        with self.assertLogs("django_cotton.slow_render", level="WARNING") as logs:
+            output = render_to_string("slow_page.html", {"size": 2})
+        return output, logs.records
+
+    @override_settings(COTTON_SLOW_RENDER_MS=0)
+    def test_renders_over_budget_are_logged(self):
+        output, records = self.render_logged()
+
+        self.assertEqual(output, "<div><i>y</i><i>x</i></div>")
+        self.assertEqual(
+            [record.component for record in records], ["slow-icon", "slow-icon", "slow-card"]
+        )
+
+        card = records[-1]
+        self.assertTrue(card.template.endswith("cotton/slow_card.html"))
+        self.assertEqual(card.attr_keys, ["class", "size"])
+        self.assertEqual(card.nesting, ["slow-card"])
+        self.assertEqual(card.budget_ms, 0)
+        self.assertGreater(card.duration_ms, 0)
+        self.assertEqual(set(card.phases_ms), {"attrs", "slots", "vars", "render"})
+        self.assertEqual(records[0].nesting, ["slow-card", "slow-icon"])
+        self.assertIn("slow-card took", card.getMessage())
+
+    @override_settings(
+        COTTON_SLOW_RENDER_MS=0, COTTON_SLOW_RENDER_MS_PER_COMPONENT={"slow-card": 10_000}
+    )
+    def test_per_component_budget(self):
+        _, records = self.render_logged()
+
+        self.assertEqual([record.component for record in records], ["slow-icon", "slow-icon"])
+
+    @override_settings(COTTON_SLOW_RENDER_MS_PER_COMPONENT={"slow-card": 0, "slow-icon": None})
+    def test_only_components_with_a_budget_are_checked(self):
+        _, records = self.render_logged()
+
+        self.assertEqual([record.component for record in records], ["slow-card"])
+        self.assertTrue(profiling.instrumented("slow-card"))
+        self.assertFalse(profiling.instrumented("slow-icon"))
+
+    def test_disabled_by_default(self):
+        self.assertFalse(profiling.active)
+        with mock.patch.object(profiling.slow_render_logger, "warning") as warning:
+            render_to_string("slow_page.html", {"size": 2})
+        warning.assert_not_called()
+
+    @override_settings(COTTON_SLOW_RENDER_MS=0)
+    def test_recording_profile_is_used(self):
+        with profiling.profile() as render_profile:
+            self.render_logged()
+
+        self.assertEqual(len(render_profile.roots), 1)
@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+
+from django.template.loader import render_to_string
+from django.test import override_settings
+
+from django_cotton import profiling
+from django_cotton.tests.utils import CottonTestCase
+
+
+class InMemoryExporter:
+    """Collects spans as (event, attributes, depth of open spans), like an in-memory exporter."""
+
+    def __init__(self):
+        self.spans = []
+        self.open = 0
+
+    @contextmanager
+    def span(self, event, **attributes):
+        self.spans.append((event, attributes, self.open))
+        self.open += 1
+        try:
+            yield
+        finally:
+            self.open -= 1
+
+
+class TraceHookTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.exporter = InMemoryExporter()
+        self.create_template("cotton/traced_icon.html", """<i>{{ name }}</i>""")
+        self.create_template(
+            "cotton/traced_card.html", """<div>{{ slot }}<c-traced-icon name="x" /></div>"""
+        )
+        self.create_template(
+            "traced_page.html", """<c-traced-card><c-traced-icon name="y" /></c-traced-card>"""
+        )
+
+    def render_spans(self, template_name="traced_page.html"):
+        with override_settings(COTTON_TRACE_HOOK=self.exporter.span):
+            output = render_to_string(template_name)
+        return output, [span for span in self.exporter.spans if span[0] == "cotton.render"]
+
+    def test_spans_around_component_renders(self):
+        output, spans = self.render_spans()
+
+        self.assertEqual(output, "<div><i>y</i><i>x</i></div>")
+        self.assertEqual(
+            [
+                (attributes["component"], attributes["depth"], open_spans)
+                for _, attributes, open_spans in spans
+            ],
+            [("traced-card", 0, 0), ("traced-icon", 1, 1), ("traced-icon", 1, 1)],
+        )
+        self.assertTrue(spans[0][1]["template"].endswith("cotton/traced_card.html"))
+
+    def test_compile_events(self):
+        self.render_spans()
+
+        compiled = [
+            attributes["template"]
+            for event, attributes, _ in self.exporter.spans
+            if event == "cotton.compile"
+        ]
+        self.assertTrue(any(name.endswith("traced_page.html") for name in compiled))
+
+    def test_plain_callable_hook(self):
+        events = []
+        with override_settings(COTTON_TRACE_HOOK=lambda event, **attributes: events.append(event)):
+            render_to_string("traced_page.html")
+
+        self.assertEqual(events.count("cotton.render"), 3)
+
+    def test_dotted_path(self):
+        with override_settings(
+            COTTON_TRACE_HOOK="django_cotton.tests.configuration.test_trace_hook.collect"
+        ):
+            render_to_string("traced_page.html")
+
+        self.assertEqual(collected.count("cotton.render"), 3)
+        collected.clear()
+
+    def test_unset_by_default(self):
+        self.assertIsNone(profiling.trace_hook)
+        self.assertFalse(profiling.active)
+
+
+collected = []
+
+
+def collect(event, **attributes):
+    collected.append(event)
@@ -0,0 +1,118 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.template import Context
+from django.template.loader import get_template, render_to_string
+from django.test import RequestFactory
+
+from django_cotton.async_render import arender_to_string, collect_awaitables
+from django_cotton.exceptions import CottonUncollectedAwaitableError
+from django_cotton.tests.utils import CottonTestCase
+
+
+class AsyncRenderTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = RequestFactory().get("/")
+        self.create_template(
+            "cotton/async_card.html", """<div {{ attrs }}>{{ title }}: {{ data }}</div>"""
+        )
+
+    async def test_sibling_awaitables_are_resolved_concurrently(self):
+        self.create_template(
+            "async_siblings.html",
+            """<c-async-card title="A" :data="a" /><c-async-card title="B" :data="sources.b" />"""
+            """<c-async-card title="C" :data="c" />""",
+        )
+        started = []
+        all_started = asyncio.Event()
+
+        async def source(value):
+            started.append(value)
+            if len(started) == 3:
+                all_started.set()
+            # Awaiting the sources one after another would time out here
+            await asyncio.wait_for(all_started.wait(), timeout=2)
+            return value
+
+        rendered = await arender_to_string(
+            "async_siblings.html",
+            {"a": source(1), "sources": {"b": source(2)}, "c": source(3)},
+            self.request,
+        )
+
+        self.assertEqual(
+            rendered,
+            '<div title="A" data="1">A: 1</div><div title="B" data="2">B: 2</div>'
+            '<div title="C" data="3">C: 3</div>',
+        )
+
+    async def test_shared_awaitable_is_awaited_once(self):
+        self.create_template(
+            "async_shared.html",
+            """{% if show %}<c-async-card title="X" :data="total" />{% endif %}"""
+            """<c-async-card title="Y" :data="total" />""",
+        )
+        calls = []
+
+        async def total():
+            calls.append(1)
+            return 42
+
+        rendered = await arender_to_string("async_shared.html", {"total": total(), "show": True})
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(rendered.count(": 42</div>"), 2)
+
+    async def test_matches_sync_render_without_awaitables(self):
+        self.create_template(
+            "async_plain.html",
+            """{% for n in items %}<c-async-card :title="n" data="static" />{% endfor %}""",
+        )
+        context = {"items": [1, 2]}
+
+        expected = await sync_to_async(render_to_string)("async_plain.html", context)
+
+        self.assertEqual(await arender_to_string("async_plain.html", context), expected)
+
+    def test_collection_does_not_call_callables(self):
+        self.create_template(
+            "async_collect.html",
+            """<c-async-card :data="pending" /><c-async-card :data="make" />{% for i in items %}"""
+            """<c-async-card :data="i" />{% endfor %}""",
+        )
+        called = []
+
+        async def fetch():
+            return 1
+
+        pending = fetch()
+        try:
+            template = get_template("async_collect.html").template
+            awaitables = collect_awaitables(
+                template,
+                Context({"pending": pending, "make": lambda: called.append(1), "items": []}),
+            )
+            self.assertEqual(awaitables, [pending])
+            self.assertEqual(called, [])
+        finally:
+            pending.close()
+
+    async def test_uncollected_awaitable_raises(self):
+        self.create_template(
+            "cotton/async_wrapper.html",
+            """<c-async-card title="Inner" :data="pending" />""",
+        )
+        self.create_template(
+            "async_nested.html",
+            """<c-async-wrapper />"""
+            """{% for item in items %}<c-async-card title="Loop" :data="item" />{% endfor %}""",
+        )
+
+        async def fetch():
+            return 1
+
+        for context in ({"pending": fetch(), "items": []}, {"pending": 1, "items": [fetch()]}):
+            with self.subTest(context=context):
+                with self.assertRaises(CottonUncollectedAwaitableError):
+                    await arender_to_string("async_nested.html", context)
@@ -3,7 +3,7 @@ import copy
 from django.conf import settings
 
 from django_cotton.tests.utils import CottonTestCase
-from django_cotton.tests.utils import get_compiled
+from django_cotton.tests.utils import get_compiled, get_rendered
 
 
 class AttributeHandlingTests(CottonTestCase):
@@ -225,6 +225,21 @@ class AttributeHandlingTests(CottonTestCase):
             response = self.client.get("/view/")
             self.assertContains(response, 'class="form-group another-class-with:colon extra-class"')
 
+    def test_attribute_merging_does_not_mutate_attrs(self):
+        self.create_template(
+            "cotton/merges_twice.html",
+            """<div {{ attrs|merge:'class:one' }}></div><div """
+            """{{ attrs|merge:'class:one,id:two' }}></div>{{ attrs.class }}""",
+        )
+
+        rendered = get_rendered("""<c-merges-twice class="base" :count="3" />""")
+
+        self.assertEqual(
+            rendered,
+            '<div class="one base" count="3"></div><div class="one base" count="3" id="two">'
+            '</div>base',
+        )
+
     def test_attributes_can_contain_django_native_tags(self):
         self.create_template(
             "native_tags_in_attributes_view.html",
@@ -480,6 +495,19 @@ class AttributeHandlingTests(CottonTestCase):
             response = self.client.get("/view/")
             self.assertContains(response, "It's hello")
 
+    def test_static_attrs_overridden_by_attrs_spread_are_output_with_new_value(self):
+        self.create_template("cotton/spread_override.html", "<div {{ attrs }}></div>")
+
+        rendered = get_rendered(
+            """<c-spread-override class="static" disabled :attrs="extra" id="keep" />""",
+            {"extra": {"class": "spread", "disabled": False}},
+        )
+
+        self.assertIn('class="spread"', rendered)
+        self.assertIn('disabled="False"', rendered)
+        self.assertIn('id="keep"', rendered)
+        self.assertNotIn("static", rendered)
+
     def test_attributes_remain_unordered(self):
         compiled = get_compiled(
             """
@@ -0,0 +1,159 @@
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError
+from django.test import override_settings
+from django.urls import path
+
+from django_cotton.dataloader import DataLoader
+from django_cotton.tests.utils import CottonTestCase, get_rendered
+
+
+class UserLoader(DataLoader):
+    def batch_load(self, keys):
+        return User.objects.in_bulk(keys)
+
+
+class UsernameLengthLoader(DataLoader):
+    def batch_load(self, keys):
+        return [len(key) for key in keys]
+
+
+@override_settings(
+    COTTON_DATA_LOADERS={
+        "users": "django_cotton.tests.integration.test_dataloader.UserLoader",
+        "lengths": UsernameLengthLoader,
+    }
+)
+class DataLoaderTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = [User.objects.create(username=f"user{n}") for n in range(5)]
+        self.create_template(
+            "cotton/loader_avatar.html",
+            """<c-vars user_id />{% cotton:load "users" user_id as user %}<b>{{ user.username }}"""
+            """</b>""",
+        )
+
+    def test_batch_loads_all_keys_with_one_query(self):
+        rows = [{"owner_id": user.pk} for user in self.users]
+
+        with self.assertNumQueries(1):
+            rendered = get_rendered(
+                """{% cotton:batch %}{% for row in rows %}"""
+                """<c-loader-avatar :user_id="row.owner_id" />{% endfor %}{% endcotton:batch %}""",
+                {"rows": rows},
+            )
+
+        self.assertEqual(rendered, "".join(f"<b>user{n}</b>" for n in range(5)))
+
+    def test_without_batch_each_load_queries_on_its_own(self):
+        rows = [{"owner_id": user.pk} for user in self.users]
+
+        with self.assertNumQueries(5):
+            rendered = get_rendered(
+                """{% for row in rows %}<c-loader-avatar :user_id="row.owner_id" />{% endfor %}""",
+                {"rows": rows},
+            )
+
+        self.assertEqual(rendered, "".join(f"<b>user{n}</b>" for n in range(5)))
+
+    def test_loaded_values_are_cached_for_the_render(self):
+        user_id = self.users[0].pk
+
+        with self.assertNumQueries(1):
+            rendered = get_rendered(
+                """{% cotton:batch %}<c-loader-avatar :user_id="id" />"""
+                """<c-loader-avatar :user_id="id" />"""
+                """{% endcotton:batch %}<c-loader-avatar :user_id="id" />""",
+                {"id": user_id},
+            )
+
+        self.assertEqual(rendered, "<b>user0</b>" * 3)
+
+    def test_nested_components_and_sequence_results(self):
+        self.create_template(
+            "cotton/loader_row.html",
+            """{% cotton:load "lengths" name as length %}<c-loader-avatar :user_id="user_id" />="""
+            """{{ length }}|""",
+        )
+
+        rendered = get_rendered(
+            """{% cotton:batch %}{% for user in users %}{% cycle "a" "b" %}"""
+            """<c-loader-row :user_id="user.pk" :name="user.username" />{% endfor %}"""
+            """{% endcotton:batch %}""",
+            {"users": self.users[:2]},
+        )
+
+        self.assertEqual(rendered, "a<b>user0</b>=5|b<b>user1</b>=5|")
+
+    def test_missing_keys_load_as_none(self):
+        with self.assertNumQueries(1):
+            rendered = get_rendered(
+                """{% cotton:batch %}<c-loader-avatar :user_id="0" />{% endcotton:batch %}"""
+            )
+
+        self.assertEqual(rendered, "<b></b>")
+
+    def test_unknown_loader(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_rendered("""{% cotton:load "nope" 1 as thing %}""")
+
+    def test_tags_failing_on_the_placeholder_do_not_fail_the_page(self):
+        self.url_module.urlpatterns = [
+            path("users/<str:username>/", self.make_view("x"), name="user-profile")
+        ]
+        self.create_template(
+            "cotton/loader_link.html",
+            """<c-vars user_id />{% cotton:load "users" user_id as user %}"""
+            """<a href="{% url 'user-profile' user.username %}">{{ user.username }}</a>""",
+        )
+
+        with self.settings(ROOT_URLCONF=self.url_conf()):
+            rendered = get_rendered(
+                """{% cotton:batch %}{% for user in users %}<c-loader-link :user_id="user.pk" />"""
+                """{% endfor %}{% endcotton:batch %}""",
+                {"users": self.users[:2]},
+            )
+
+        self.assertEqual(
+            rendered, '<a href="/users/user0/">user0</a><a href="/users/user1/">user1</a>'
+        )
+
+    def test_other_errors_in_the_collection_pass_are_raised(self):
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise DatabaseError("boom")
+
+        with self.assertRaises(DatabaseError):
+            get_rendered(
+                """{% cotton:batch %}<c-loader-avatar :user_id="id" />{{ broken }}"""
+                """{% endcotton:batch %}""",
+                {"id": self.users[0].pk, "broken": broken},
+            )
+        self.assertEqual(len(calls), 1)
+
+    def test_other_queries_in_the_region(self):
+        self.create_template(
+            "cotton/loader_count.html",
+            """{{ users.count }}<c-loader-avatar :user_id="user_id" />""",
+        )
+        template = (
+            """{% cotton:batch %}<c-loader-count :users="users" :user_id="id" />"""
+            """{% endcotton:batch %}"""
+        )
+        context = {"users": User.objects.all(), "id": self.users[0].pk}
+
+        # The count runs in both passes, the loader once
+        with self.assertNumQueries(3):
+            self.assertEqual(get_rendered(template, dict(context)), "5<b>user0</b>")
+
+        # With every key already loaded by an earlier batch, the region renders once
+        with self.assertNumQueries(2):
+            rendered = get_rendered(
+                """{% cotton:batch %}<c-loader-avatar :user_id="id" />{% endcotton:batch %}"""
+                + template,
+                dict(context),
+            )
+        self.assertEqual(rendered, "<b>user0</b>5<b>user0</b>")
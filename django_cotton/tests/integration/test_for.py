@@ -0,0 +1,139 @@
+from django.template import Context, Template
+
+from django_cotton.templatetags._for import CottonForNode
+from django_cotton.tests.utils import CottonTestCase, get_compiled, get_rendered
+
+
+class CottonForTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_template(
+            "cotton/for_row.html",
+            """<c-vars status="open" /><li {{ attrs }}>{{ label }} ({{ status }}){{ slot }}"""
+            """{{ icon }}</li>""",
+        )
+        self.context = {"items": [{"label": "a"}, {"label": "b", "status": "done"}], "page": "p"}
+
+    def assert_matches_for_loop(self, body, context=None):
+        context = self.context if context is None else context
+        rendered = get_rendered(f"""<c-for each="items" as="item">{body}</c-for>""", context)
+        expected = get_rendered(f"""{{% for item in items %}}{body}{{% endfor %}}""", context)
+        self.assertEqual(rendered, expected)
+        return rendered
+
+    def test_single_component_uses_render_each(self):
+        template = Template(
+            get_compiled(
+                """<c-for each="items" as="item"> <c-for-row :label="item.label" /></c-for>"""
+            )
+        )
+        node = template.nodelist[0]
+
+        self.assertIsInstance(node, CottonForNode)
+        self.assertIsNotNone(node.component)
+        self.assertEqual(node.prefix, " ")
+
+    def test_matches_for_loop(self):
+        rendered = self.assert_matches_for_loop(
+            """\n<c-for-row class="row" :label="item.label" :status="item.status" disabled />\n"""
+        )
+        self.assertIn('<li class="row" label="a" disabled>a (open)</li>', rendered)
+        self.assertIn("b (done)", rendered)
+
+    def test_matches_for_loop_with_slots(self):
+        rendered = self.assert_matches_for_loop(
+            """<c-for-row :label="item.label">!{{ page }}<c-slot name="icon">*{{ item.label }}"""
+            """</c-slot></c-for-row>"""
+        )
+        self.assertIn("a (open)!p*a</li>", rendered)
+
+    def test_matches_for_loop_without_fast_path(self):
+        rendered = self.assert_matches_for_loop(
+            """{% if item.status %}<c-for-row :label="item.label" />{% endif %}"""
+            """<c-for-row label="x" />"""
+        )
+        self.assertEqual(rendered.count("<li"), 3)
+
+    def test_matches_for_loop_with_only(self):
+        self.create_template("cotton/for_leak.html", """<i>{{ label }}{{ page }}</i>""")
+        rendered = self.assert_matches_for_loop("""<c-for-leak :label="item.label" only />""")
+        self.assertEqual(rendered, "<i>a</i><i>b</i>")
+
+    def test_matches_for_loop_with_isolate_by_default(self):
+        self.create_template("cotton/for_leak.html", """<i>{{ label }}{{ page }}</i>""")
+        with self.settings(COTTON_ISOLATE_BY_DEFAULT=True):
+            rendered = self.assert_matches_for_loop("""<c-for-leak :label="item.label" />""")
+        self.assertEqual(rendered, "<i>a</i><i>b</i>")
+
+    def test_matches_for_loop_with_dynamic_component(self):
+        self.create_template("cotton/for_other.html", """<b>{{ label }}</b>""")
+        context = {"items": [{"label": "a", "is": "for-row"}, {"label": "b", "is": "for-other"}]}
+        rendered = self.assert_matches_for_loop(
+            """<c-component :is="item.is" :label="item.label" />""", context
+        )
+        self.assertEqual(rendered, '<li label="a">a (open)</li><b>b</b>')
+
+    def test_nested_loops_and_loop_variable_scope(self):
+        context = {"groups": [["a", "b"], ["c"]], "item": "outer"}
+        rendered = get_rendered(
+            """<c-for each="groups" as="group"><c-for each="group" as="item">"""
+            """<c-for-row :label="item" /></c-for>|</c-for>{{ item }}""",
+            context,
+        )
+        self.assertEqual(
+            rendered,
+            '<li label="a">a (open)</li><li label="b">b (open)</li>|<li label="c">c (open)'
+            "</li>|outer",
+        )
+
+    def test_missing_sequence_renders_nothing(self):
+        self.assertEqual(
+            get_rendered("""<c-for each="nothing" as="item"><c-for-row /></c-for>"""), ""
+        )
+        self.assertEqual(
+            Template(
+                get_compiled("""<c-for each="items" as="item"><c-for-row /></c-for>""")
+            ).render(Context({"items": []})),
+            "",
+        )
+
+    def test_forloop(self):
+        self.create_template("cotton/for_counter.html", """<i>{{ n }}</i>""")
+        context = {"outer": [1, 2], "items": ["a", "b", "c"]}
+        for body in (
+            # render_each() and the plain loop
+            """<c-for-counter :n="forloop.counter" />""",
+            """{{ forloop.counter0 }}{{ forloop.revcounter }}{{ forloop.revcounter0 }}"""
+            """{{ forloop.first|yesno:"F," }}{{ forloop.last|yesno:"L," }}"""
+            """{{ forloop.parentloop.counter }}""",
+        ):
+            with self.subTest(body=body):
+                rendered = get_rendered(
+                    f"""{{% for o in outer %}}<c-for each="items" as="item">{body}</c-for>"""
+                    f"""{{% endfor %}}""",
+                    dict(context),
+                )
+                expected = get_rendered(
+                    f"""{{% for o in outer %}}{{% for item in items %}}{body}{{% endfor %}}"""
+                    f"""{{% endfor %}}""",
+                    dict(context),
+                )
+                self.assertEqual(rendered, expected)
+        self.assertTrue(expected.startswith("032F1"))
+
+    def test_empty(self):
+        template = (
+            """<c-for each="items" as="item"><c-for-row :label="item.label" />"""
+            """{% empty %}None</c-for>"""
+        )
+
+        self.assertEqual(get_rendered(template, {"items": []}), "None")
+        self.assertEqual(get_rendered(template, {}), "None")
+        self.assertEqual(get_rendered(template, self.context).count("<li"), 2)
+
+    def test_generator_sequence(self):
+        rendered = get_rendered(
+            """<c-for each="items" as="item">{{ item }}{{ forloop.revcounter }}</c-for>""",
+            {"items": (letter for letter in "ab")},
+        )
+        self.assertEqual(rendered, "a2b1")
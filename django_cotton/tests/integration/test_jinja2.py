@@ -0,0 +1,111 @@
+import unittest
+
+from django.template.loader import render_to_string
+
+from django_cotton.tests.utils import CottonTestCase
+
+try:
+    import jinja2
+except ImportError:  # pragma: no cover
+    jinja2 = None
+else:
+    from django_cotton.jinja2 import CottonExtension, JinjaCottonCompiler
+
+
+@unittest.skipIf(jinja2 is None, "jinja2 is not installed")
+class Jinja2Tests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(self.temp_dir),
+            autoescape=True,
+            extensions=[CottonExtension],
+        )
+        self.create_template(
+            "cotton/jinja_card.html",
+            """<c-vars title="Untitled" tone="plain" wide />"""
+            """<div {{ attrs }} data-tone="{{ tone }}"><h2>{{ title }}</h2>{{ icon }}|"""
+            """{{ slot }}|{{ count }}</div>""",
+        )
+
+    def render(self, template_name, **context):
+        return self.env.get_template(template_name).render(**context)
+
+    def assert_same_as_django(self, template_name, source, **context):
+        """Render the same source with both engines. It has to be valid in both syntaxes."""
+        self.create_template(template_name, source)
+        rendered = self.render(template_name, **context)
+        self.assertEqual(rendered, render_to_string(template_name, context))
+        return rendered
+
+    def test_attributes_vars_and_slots_match_django(self):
+        rendered = self.assert_same_as_django(
+            "jinja_page.html",
+            """<c-jinja-card class="card" :count="total" title="Hi {{ name }}" wide disabled>"""
+            """<c-slot name="icon"><i>{{ name }}</i></c-slot>body {{ name }}</c-jinja-card>"""
+            """<c-jinja-card tone="loud" />""",
+            total=2,
+            name="<Ann>",
+        )
+
+        self.assertIn(
+            '<div class="card" count="2" disabled data-tone="plain"><h2>Hi &lt;Ann&gt;</h2>'
+            "<i>&lt;Ann&gt;</i>|body &lt;Ann&gt;|2</div>",
+            rendered,
+        )
+        self.assertIn('<div  data-tone="loud"><h2>Untitled</h2>||</div>', rendered)
+
+    def test_attrs_spread_dynamic_components_and_loops_match_django(self):
+        self.create_template("cotton/jinja_badge.html", """<span {{ attrs }}>{{ label }}</span>""")
+
+        rendered = self.assert_same_as_django(
+            "jinja_loop.html",
+            """<c-for each="rows" as="row">"""
+            """<c-component :is="row.kind" :label="row.label" :attrs="extra" /></c-for>""",
+            rows=[{"kind": "jinja-badge", "label": "a"}, {"kind": "jinja-badge", "label": "b"}],
+            extra={"id": "x"},
+        )
+
+        self.assertEqual(rendered, '<span label="a" id="x">a</span><span label="b" id="x">b</span>')
+
+    def test_parent_variables_unless_only(self):
+        self.create_template("cotton/jinja_leak.html", """[{{ page }}]""")
+        self.create_template("jinja_only.html", """<c-jinja-leak /><c-jinja-leak only />""")
+
+        self.assertEqual(self.render("jinja_only.html", page="p"), "[p][]")
+
+    def test_unquoted_and_template_tag_attributes(self):
+        self.create_template("cotton/jinja_value.html", """{{ value }}:{{ other }}""")
+        self.create_template(
+            "jinja_values.html",
+            """<c-jinja-value value=size other=5 /> <c-jinja-value value="{% if flag %}on"""
+            """{% else %}off{% endif %}" />""",
+        )
+
+        self.assertEqual(self.render("jinja_values.html", flag=True), "size:5 on:")
+        self.assertEqual(self.render("jinja_values.html", size="lg"), "lg:5 off:")
+
+    def test_hyphenated_and_path_unquoted_values_are_literal(self):
+        self.create_template("cotton/jinja_link.html", """<a href="{{ href }}">{{ name }}</a>""")
+
+        self.assert_same_as_django(
+            "jinja_literals.html",
+            """<c-jinja-link name=arrow-left href=/home />"""
+            """<c-jinja-link name=user.name href=../up?a=1 />""",
+            user={"name": "Ann"},
+        )
+        self.assertEqual(
+            self.render("jinja_literals.html", user={"name": "Ann"}),
+            '<a href="/home">arrow-left</a><a href="../up?a=1">Ann</a>',
+        )
+
+    def test_compiles_to_jinja_syntax(self):
+        compiled = JinjaCottonCompiler().process(
+            """<c-button :count="3">{% raw %}<c-skip />{% endraw %}</c-button>"""
+        )
+
+        self.assertEqual(
+            compiled,
+            "{% call(_cotton_slots) cotton_component('button', (('count', (3)),), False) %}"
+            "{% raw %}<c-skip />{% endraw %}{% endcall %}",
+        )
@@ -0,0 +1,190 @@
+import json
+import threading
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.test import RequestFactory, override_settings
+
+from django_cotton import profiling
+from django_cotton.profiling import (
+    LatencyHistogram,
+    ProfilingMiddleware,
+    latency_stats,
+    latency_stats_view,
+    profile,
+    reset_latency_stats,
+    sample,
+)
+from django_cotton.tests.utils import CottonTestCase
+
+
+class ProfilingTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_template("cotton/profile_icon.html", """<i>{{ name }}</i>""")
+        self.create_template(
+            "cotton/profile_card.html",
+            """<c-vars title="card" /><div>{{ title }}{{ slot }}<c-profile-icon name="x" />"""
+            """</div>""",
+        )
+        self.create_template(
+            "profile_page.html",
+            """<c-profile-card><c-profile-icon :name="label" /></c-profile-card>"""
+            """<c-for each="items" as="item"><c-profile-icon :name="item" /></c-for>""",
+        )
+        self.context = {"label": "a", "items": [1, 2]}
+
+    def test_records_component_tree(self):
+        with profile() as render_profile:
+            render_to_string("profile_page.html", self.context)
+
+        tree = render_profile.tree()
+        self.assertEqual(
+            [node["name"] for node in tree], ["profile-card", "profile-icon", "profile-icon"]
+        )
+
+        card = tree[0]
+        self.assertTrue(card["template"].endswith("cotton/profile_card.html"))
+        self.assertEqual(set(card["phases"]), {"attrs", "slots", "vars", "render"})
+        # The icon in the slot, then the one in the card's template
+        self.assertEqual(
+            [child["name"] for child in card["children"]], ["profile-icon", "profile-icon"]
+        )
+        self.assertGreaterEqual(
+            card["wall_ms"], sum(child["wall_ms"] for child in card["children"])
+        )
+        self.assertGreaterEqual(card["self_ms"], 0)
+
+    def test_output_is_unchanged(self):
+        expected = render_to_string("profile_page.html", self.context)
+        with profile():
+            self.assertEqual(render_to_string("profile_page.html", self.context), expected)
+
+    def test_nothing_is_recorded_outside_profile(self):
+        with profile() as render_profile:
+            pass
+        render_to_string("profile_page.html", self.context)
+
+        self.assertEqual(render_profile.tree(), [])
+        self.assertFalse(profiling.instrumented("profile-icon"))
+
+    def test_profile_in_another_thread_is_not_recorded_into(self):
+        started, done = threading.Event(), threading.Event()
+        profiles = []
+
+        def record_elsewhere():
+            with profile() as render_profile:
+                profiles.append(render_profile)
+                started.set()
+                done.wait()
+
+        thread = threading.Thread(target=record_elsewhere)
+        thread.start()
+        started.wait()
+        try:
+            self.assertFalse(profiling.instrumented("profile-icon"))
+            render_to_string("profile_page.html", self.context)
+        finally:
+            done.set()
+            thread.join()
+
+        self.assertEqual(profiles[0].tree(), [])
+
+    def test_speedscope_export(self):
+        with profile() as render_profile:
+            render_to_string("profile_page.html", self.context)
+
+        data = json.loads(render_profile.to_speedscope())
+        frames = data["shared"]["frames"]
+        events = data["profiles"][0]["events"]
+
+        self.assertEqual({frame["name"] for frame in frames}, {"profile-card", "profile-icon"})
+        self.assertEqual(len(events), 10)
+        self.assertEqual([event["type"] for event in events[:4]], ["O", "O", "C", "O"])
+        self.assertEqual(sorted(event["at"] for event in events), [event["at"] for event in events])
+        self.assertEqual(json.loads(render_profile.to_json()), render_profile.tree())
+
+    def test_middleware_exposes_profile_on_request(self):
+        def view(request):
+            return HttpResponse(render_to_string("profile_page.html", self.context))
+
+        request = RequestFactory().get("/")
+        with override_settings(COTTON_PROFILING=True):
+            ProfilingMiddleware(view)(request)
+
+        self.assertEqual(len(request.cotton_profile.tree()), 3)
+
+        request = RequestFactory().get("/")
+        ProfilingMiddleware(view)(request)
+        self.assertFalse(hasattr(request, "cotton_profile"))
+
+
+class SamplingTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        reset_latency_stats()
+        self.addCleanup(reset_latency_stats)
+        self.create_template("cotton/sampled_icon.html", """<i>{{ name }}</i>""")
+        self.create_template(
+            "cotton/sampled_card.html",
+            """<div><c-sampled-icon name="a" /><c-sampled-icon name="b" /></div>""",
+        )
+        self.create_template("sampled_page.html", """<c-sampled-card />""")
+
+    def view(self, request):
+        return HttpResponse(render_to_string("sampled_page.html"))
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for milliseconds in range(1, 101):
+            histogram.add(milliseconds / 1000)
+
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["mean_ms"], 50.5)
+        self.assertAlmostEqual(summary["max_ms"], 100)
+        for key, expected in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99)):
+            self.assertGreaterEqual(summary[key], expected)
+            self.assertLessEqual(summary[key], expected * 1.05)
+
+    def test_sampled_requests_are_aggregated(self):
+        with override_settings(COTTON_PROFILING_SAMPLE_RATE=1):
+            middleware = ProfilingMiddleware(self.view)
+        for _ in range(3):
+            middleware(RequestFactory().get("/"))
+
+        stats = latency_stats()
+        self.assertEqual(set(stats), {"sampled-card", "sampled-icon"})
+        self.assertEqual(stats["sampled-card"]["count"], 3)
+        self.assertEqual(stats["sampled-icon"]["count"], 6)
+        self.assertGreater(stats["sampled-card"]["p99_ms"], 0)
+
+    def test_unsampled_calls_record_nothing(self):
+        ProfilingMiddleware(self.view)(RequestFactory().get("/"))
+        with sample(0) as render_profile:
+            render_to_string("sampled_page.html")
+
+        self.assertIsNone(render_profile)
+        self.assertEqual(latency_stats(), {})
+
+    def test_sample_outside_requests(self):
+        with sample(1) as render_profile:
+            render_to_string("sampled_page.html")
+
+        self.assertEqual(len(render_profile.roots), 1)
+        self.assertEqual(latency_stats()["sampled-icon"]["count"], 2)
+
+    def test_stats_view_is_staff_only(self):
+        with sample(1):
+            render_to_string("sampled_page.html")
+
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        with self.assertRaises(PermissionDenied):
+            latency_stats_view(request)
+
+        request.user = User(is_staff=True)
+        response = latency_stats_view(request)
+        self.assertEqual(json.loads(response.content)["sampled-card"]["count"], 1)
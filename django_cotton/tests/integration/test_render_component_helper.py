@@ -183,3 +183,155 @@ class TestRenderComponentHelper(CottonTestCase):
         self.assertIn('id="email"', rendered)
         self.assertIn("Email Address", rendered)
         self.assertIn('value="test@example.com"', rendered)
+
+    def test_render_component_reuses_wrapper_template(self):
+        """The wrapper template is parsed once per component name, not on every call"""
+        from django.template import Engine
+        from django_cotton.utils import _get_component_wrapper_template
+
+        self.create_template("cotton/reused_badge.html", "<span>{{ label }}</span>")
+
+        first = render_component(self.request, "reused_badge", label="One")
+        second = render_component(self.request, "reused_badge", label="Two")
+
+        self.assertIn("<span>One</span>", first)
+        self.assertIn("<span>Two</span>", second)
+        self.assertIs(
+            _get_component_wrapper_template(Engine.get_default(), "reused_badge"),
+            _get_component_wrapper_template(Engine.get_default(), "reused_badge"),
+        )
+
+    def test_render_components_renders_one_output_per_context(self):
+        from django_cotton import render_components
+
+        self.create_template(
+            "cotton/batch_row.html",
+            """<c-vars status="active" /><tr {{ attrs }}><td>{{ name }}</td><td>{{ status }}"""
+            """</td></tr>""",
+        )
+
+        contexts = [{"name": "Ann"}, {"name": "Bob", "status": "away"}]
+        rendered = render_components(self.request, "batch_row", contexts, **{"class": "row"})
+
+        self.assertEqual(
+            rendered,
+            [
+                render_component(self.request, "batch_row", context, **{"class": "row"})
+                for context in contexts
+            ],
+        )
+        self.assertIn("<td>Ann</td><td>active</td>", rendered[0])
+        self.assertIn("<td>Bob</td><td>away</td>", rendered[1])
+        self.assertIn('class="row"', rendered[1])
+        self.assertEqual(contexts[0], {"name": "Ann"})
+
+    def test_render_components_runs_context_processors_once(self):
+        from django_cotton import render_components
+        from example_project.context_processors import ProcessorCallCounter
+
+        self.create_template("cotton/batch_logo.html", "[{{ from_context_processor }}:{{ n }}]")
+
+        ProcessorCallCounter.count = 0
+        rendered = render_components(self.request, "batch_logo", ({"n": n} for n in range(5)))
+
+        self.assertEqual(rendered, [f"[logo.png:{n}]" for n in range(5)])
+        self.assertEqual(ProcessorCallCounter.count, 1)
+
+    def test_render_components_keeps_render_state_per_item(self):
+        from django_cotton import render_components
+
+        self.create_template(
+            "cotton/batch_cycle.html",
+            """{% for n in "12" %}{% cycle "odd" "even" %}{% endfor %}{% ifchanged %}{{ group }}"""
+            """{% endifchanged %}""",
+        )
+
+        contexts = [{"group": "a"}, {"group": "a"}, {"group": "b"}]
+        rendered = render_components(self.request, "batch_cycle", contexts)
+
+        self.assertEqual(
+            rendered,
+            [render_component(self.request, "batch_cycle", context) for context in contexts],
+        )
+        self.assertEqual(rendered, ["oddevena", "oddevena", "oddevenb"])
+
+    def test_render_components_keeps_cotton_data_per_item(self):
+        from django_cotton import render_components
+        from django_cotton.dataloader import DataLoader
+
+        batches = []
+
+        class EchoLoader(DataLoader):
+            def batch_load(self, keys):
+                batches.append(keys)
+                return keys
+
+        self.create_template(
+            "cotton/batch_loaded.html", """{% cotton:load "echo" key as value %}{{ value }}"""
+        )
+
+        with self.settings(COTTON_DATA_LOADERS={"echo": EchoLoader}):
+            rendered = render_components(self.request, "batch_loaded", [{"key": "x"}, {"key": "x"}])
+
+        # Loaded values aren't shared between items, as with separate render_component() calls
+        self.assertEqual(rendered, ["x", "x"])
+        self.assertEqual(batches, [["x"], ["x"]])
+
+    async def test_arender_component_resolves_async_values(self):
+        from django_cotton import arender_component
+
+        self.create_template(
+            "cotton/async_list.html",
+            """<c-vars title items />{{ title }}:{% for item in items %}[{{ item }}]"""
+            """{% endfor %}:{{ size }}""",
+        )
+
+        async def title():
+            return "Recent"
+
+        async def items():
+            for item in ("a", "b"):
+                yield item
+
+        rendered = await arender_component(
+            self.request, "async_list", {"title": title(), "items": items()}, size="sm"
+        )
+
+        self.assertEqual(rendered, "Recent:[a][b]:sm")
+
+    async def test_arender_component_matches_render_component(self):
+        from asgiref.sync import sync_to_async
+        from django_cotton import arender_component
+
+        self.create_template("cotton/async_badge.html", """<span {{ attrs }}>{{ label }}</span>""")
+
+        expected = await sync_to_async(render_component)(
+            self.request, "async_badge", {"label": "New"}, **{"class": "badge"}
+        )
+        rendered = await arender_component(
+            self.request, "async_badge", {"label": "New"}, **{"class": "badge"}
+        )
+
+        self.assertEqual(rendered, expected)
+
+    async def test_arender_component_in_worker_pool(self):
+        from unittest import mock
+
+        from django_cotton import arender_component, utils
+
+        self.create_template("cotton/pool_badge.html", """<span>{{ label }}</span>""")
+
+        with self.settings(COTTON_ASYNC_RENDER_WORKERS=2):
+            executor = utils._get_render_executor()
+            self.assertEqual(executor._max_workers, 2)
+            with mock.patch("django.db.close_old_connections") as close_old_connections:
+                rendered = await arender_component(self.request, "pool_badge", label="New")
+
+            self.assertEqual(rendered, "<span>New</span>")
+            # Before and after the render, in the pool thread
+            self.assertEqual(close_old_connections.call_count, 2)
+
+            with self.settings(COTTON_ASYNC_RENDER_WORKERS=3):
+                self.assertEqual(utils._get_render_executor()._max_workers, 3)
+
+        self.assertIsNone(utils._get_render_executor())
@@ -0,0 +1,130 @@
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from django_cotton import (
+    render_component,
+    render_component_iter,
+    render_components,
+    render_components_iter,
+)
+from django_cotton.profiling import profile
+from django_cotton.streaming import stream_template
+from django_cotton.tests.utils import CottonTestCase
+
+
+class StreamingTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = RequestFactory().get("/")
+
+    def create_page(self):
+        self.create_template(
+            "cotton/stream_row.html",
+            """<c-vars status="open" /><li {{ attrs }}>{{ label }} ({{ status }}){{ slot }}</li>""",
+        )
+        self.create_template(
+            "cotton/stream_list.html",
+            """<ul>{% for item in items %}<c-stream-row :label="item" />{% empty %}<li>none</li>"""
+            """{% endfor %}</ul>""",
+        )
+        self.create_template(
+            "stream_base.html",
+            """<html>{% block header %}<h1>Base</h1>{% endblock %}{% block content %}"""
+            """{% endblock %}</html>""",
+        )
+        self.create_template(
+            "stream_page.html",
+            """{% extends "stream_base.html" %}
+            {% block content %}
+                {% for n, label in rows %}
+                    {% if n|divisibleby:2 %}
+                        <c-stream-row class="even" :label="label" status="done">!</c-stream-row>
+                    {% else %}
+                        <c-stream-row class="odd" :label="label" />
+                    {% endif %}
+                    {{ forloop.counter }}/{{ forloop.revcounter }}
+                    {% for ch in label reversed %}{{ forloop.parentloop.counter }}{{ ch }}{% endfor %}
+                {% endfor %}
+                <c-stream-list :items="names" />
+                {{ block.super }}
+            {% endblock %}""",
+        )
+
+    def test_stream_template_matches_render_to_string(self):
+        self.create_page()
+        context = {"rows": [(n, f"row {n}") for n in range(5)], "names": ["a", "b"]}
+
+        chunks = list(stream_template("stream_page.html", context, self.request))
+
+        self.assertEqual(
+            "".join(chunks), render_to_string("stream_page.html", context, self.request)
+        )
+        self.assertIn('<li class="even" label="row 0">row 0 (done)!</li>', "".join(chunks))
+        self.assertIn('<li class="odd" label="row 1">row 1 (open)</li>', "".join(chunks))
+        # Loop iterations and components are yielded separately
+        self.assertGreater(len(chunks), 10)
+
+    def test_stream_template_empty_loop(self):
+        self.create_page()
+        context = {"rows": [], "names": []}
+
+        chunks = list(stream_template("stream_page.html", context, self.request))
+
+        self.assertEqual(
+            "".join(chunks), render_to_string("stream_page.html", context, self.request)
+        )
+        self.assertIn("<ul><li>none</li></ul>", "".join(chunks))
+
+    def test_streamed_templates_are_reported_as_used(self):
+        self.create_page()
+        context = {"rows": [(1, "a")], "names": []}
+
+        with self.assertTemplateUsed("stream_page.html"), self.assertTemplateUsed(
+            "cotton/stream_row.html"
+        ):
+            list(stream_template("stream_page.html", context, self.request))
+
+    def test_streamed_components_are_profiled(self):
+        self.create_page()
+        context = {"rows": [(0, "a"), (1, "b")], "names": ["c"]}
+
+        with profile() as render_profile:
+            chunks = list(stream_template("stream_page.html", context, self.request))
+
+        self.assertEqual(
+            "".join(chunks), render_to_string("stream_page.html", context, self.request)
+        )
+        tree = render_profile.tree()
+        self.assertEqual(
+            [node["name"] for node in tree], ["stream-row", "stream-row", "stream-list"]
+        )
+        self.assertEqual([node["name"] for node in tree[2]["children"]], ["stream-row"])
+
+    def test_render_component_iter_matches_render_component(self):
+        self.create_page()
+        context = {"items": ["x", "y", "z"]}
+
+        chunks = list(render_component_iter(self.request, "stream_list", context))
+
+        self.assertEqual("".join(chunks), render_component(self.request, "stream_list", context))
+        self.assertIn('<li label="x">x (open)</li>', "".join(chunks))
+        self.assertGreater(len(chunks), 3)
+
+    def test_render_components_iter_is_lazy(self):
+        self.create_page()
+        consumed = []
+
+        def contexts():
+            for label in ("a", "b", "c"):
+                consumed.append(label)
+                yield {"label": label}
+
+        rows = render_components_iter(self.request, "stream_row", contexts())
+        self.assertEqual(consumed, [])
+
+        self.assertEqual(next(rows), '<li label="a">a (open)</li>')
+        self.assertEqual(consumed, ["a"])
+        self.assertEqual(
+            [next(rows), *rows],
+            render_components(self.request, "stream_row", [{"label": "b"}, {"label": "c"}]),
+        )
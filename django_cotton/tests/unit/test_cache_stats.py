@@ -0,0 +1,95 @@
+import functools
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.template.loader import render_to_string
+
+import django_cotton
+from django_cotton.cache_stats import _lru_stats, estimate_size
+from django_cotton.tests.utils import CottonTestCase
+
+FIELDS = {"size", "maxsize", "hits", "misses", "evictions", "memory_bytes"}
+
+
+class CacheStatsTests(CottonTestCase):
+    def test_reports_every_cache(self):
+        stats = django_cotton.stats()
+
+        for name in (
+            "compiled_templates",
+            "vars_nodes",
+            "component_paths",
+            "known_component_paths",
+            "loader_dirs",
+            "parsed_tags",
+            "tag_libraries",
+            "merge_specs",
+            "merged_attrs",
+            "component_wrappers",
+            "codegen_paths",
+            "data_loader_classes",
+        ):
+            self.assertEqual(set(stats[name]), FIELDS, name)
+
+    def test_counts_follow_renders(self):
+        self.create_template("cotton/stats_badge.html", """<c-vars tone="x" /><b>{{ tone }}</b>""")
+        self.create_template("stats_page.html", """<c-stats-badge /><c-stats-badge tone="y" />""")
+        before = django_cotton.stats()
+
+        render_to_string("stats_page.html")
+        render_to_string("stats_page.html")
+        after = django_cotton.stats()
+
+        self.assertGreater(
+            after["compiled_templates"]["misses"], before["compiled_templates"]["misses"]
+        )
+        self.assertGreater(after["compiled_templates"]["memory_bytes"], 0)
+        self.assertEqual(after["vars_nodes"]["hits"] - before["vars_nodes"]["hits"], 3)
+        self.assertEqual(after["vars_nodes"]["misses"] - before["vars_nodes"]["misses"], 1)
+        self.assertIsNone(after["vars_nodes"]["evictions"])
+        self.assertGreater(
+            after["component_paths"]["hits"] + after["known_component_paths"]["hits"],
+            before["component_paths"]["hits"] + before["known_component_paths"]["hits"],
+        )
+        self.assertGreater(after["parsed_tags"]["memory_bytes"], 0)
+
+    def test_estimate_size(self):
+        self.assertEqual(estimate_size([]), 0)
+        self.assertGreater(estimate_size([{"key": "x" * 1000}]), 1000)
+
+    def test_lru_evictions(self):
+        @functools.lru_cache(maxsize=3)
+        def cached(value):
+            if value is None:
+                raise ValueError
+            return value
+
+        for value in (1, None, 2):
+            try:
+                cached(value)
+            except ValueError:
+                pass
+        # Three misses and two entries, so not full and nothing evicted
+        self.assertEqual(_lru_stats(cached)["evictions"], 0)
+
+        cached(3)
+        self.assertIsNone(_lru_stats(cached)["evictions"])
+        self.assertEqual(_lru_stats(functools.lru_cache(maxsize=None)(str))["evictions"], 0)
+
+    def test_management_command(self):
+        out = StringIO()
+        call_command("cotton_cache_stats", "--json", stdout=out)
+        self.assertEqual(
+            set(json.loads(out.getvalue())["component_paths"]), {"size", "maxsize", "memory_bytes"}
+        )
+
+        out = StringIO()
+        call_command("cotton_cache_stats", "--json", "--load-templates", stdout=out)
+        self.assertEqual(set(json.loads(out.getvalue())["component_paths"]), FIELDS)
+
+        out = StringIO()
+        call_command("cotton_cache_stats", "--load-templates", stdout=out)
+        self.assertIn("component_paths", out.getvalue())
+        self.assertIn("Loaded", out.getvalue())
+        self.assertIn("hits", out.getvalue())
@@ -154,3 +154,18 @@ class CompilerUnitTests(unittest.TestCase):
         self.assertIn('count=42', compiled)
         self.assertNotIn('enabled="True"', compiled)
         self.assertNotIn('count="42"', compiled)
+
+    def test_compile_for_tag(self):
+        source = '<c-for each="items" as="item"><c-row :item="item" /></c-for>'
+        result = self.compiler.process(source)
+        expected = (
+            '{% cotton:for item in items %}{% cotton row :item="item" %}{% endcotton %}'
+            "{% endcotton:for %}"
+        )
+        self.assertEqual(result, expected)
+
+    def test_raises_on_for_without_each_or_as(self):
+        with self.assertRaises(ValueError) as cm:
+            get_compiled('<c-for each="items"></c-for>')
+
+        self.assertIn("c-for tag must have 'each' and 'as' attributes:", str(cm.exception))
@@ -0,0 +1,60 @@
+from django.template.loader import render_to_string
+from django.test import override_settings
+
+from django_cotton.component_paths import component_paths
+from django_cotton.tests.utils import CottonTestCase
+
+
+class ComponentPathCacheTests(CottonTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(component_paths.reset)
+
+    def test_known_components_are_scanned(self):
+        self.create_template("cotton/paths/user_row.html", "row")
+        self.create_template("cotton/paths/card/index.html", "card")
+        component_paths.reset()
+
+        self.assertEqual(component_paths.get("paths.user-row"), "cotton/paths/user_row.html")
+        self.assertEqual(component_paths.get("paths.user_row"), "cotton/paths/user_row.html")
+        self.assertEqual(component_paths.get("paths.card"), "cotton/paths/card.html")
+        self.assertEqual(component_paths.known_hits, 3)
+        self.assertEqual(component_paths.misses, 0)
+
+    def test_other_names_use_the_lru_cache(self):
+        with override_settings(COTTON_COMPONENT_PATH_CACHE_SIZE=2):
+            for name in ("a", "b", "a", "c", "d"):
+                component_paths.get(f"paths.dynamic-{name}")
+
+            recent, known = component_paths.stats()
+            self.assertEqual(recent["maxsize"], 2)
+            self.assertEqual(recent["size"], 2)
+            self.assertEqual((recent["hits"], recent["misses"], recent["evictions"]), (1, 4, 2))
+            self.assertEqual(component_paths.get("paths.dynamic-d"), "cotton/paths/dynamic_d.html")
+
+    def test_unbounded_and_disabled_lru_cache(self):
+        with override_settings(COTTON_COMPONENT_PATH_CACHE_SIZE=None):
+            for n in range(1000):
+                component_paths.get(f"paths.n{n}")
+            self.assertEqual(component_paths.stats()[0]["size"], 1000)
+            self.assertEqual(component_paths.evictions, 0)
+
+        with override_settings(COTTON_COMPONENT_PATH_CACHE_SIZE=0):
+            component_paths.get("paths.x")
+            component_paths.get("paths.x")
+            self.assertEqual((component_paths.misses, component_paths.stats()[0]["size"]), (2, 0))
+
+    def test_settings_changes_reset_the_cache(self):
+        self.assertEqual(component_paths.get("paths.some-thing"), "cotton/paths/some_thing.html")
+        with override_settings(COTTON_SNAKE_CASED_NAMES=False, COTTON_DIR="components"):
+            self.assertEqual(
+                component_paths.get("paths.some-thing"), "components/paths/some-thing.html"
+            )
+        self.assertEqual(component_paths.get("paths.some-thing"), "cotton/paths/some_thing.html")
+
+    def test_templates_added_after_the_scan_render(self):
+        component_paths.get("anything")
+        self.create_template("cotton/paths/late.html", "late")
+        self.create_template("paths_page.html", "<c-paths.late />")
+
+        self.assertEqual(render_to_string("paths_page.html"), "late")
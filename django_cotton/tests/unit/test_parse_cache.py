@@ -0,0 +1,105 @@
+import copy
+
+from django.conf import settings
+from django.template import Context, Engine, Template
+from django.template.base import Parser
+
+from django_cotton.templatetags import parser_library_fingerprint
+
+from django_cotton.templatetags._component import CottonComponentNode
+from django_cotton.templatetags._vars import CottonVarsNode
+from django_cotton.tests.template_libraries.url_override import register as url_override
+from django_cotton.tests.utils import CottonTestCase, get_compiled
+
+
+def component_nodes(template):
+    return [node for node in template.nodelist if isinstance(node, CottonComponentNode)]
+
+
+class ParseCacheTests(CottonTestCase):
+    def test_identical_tags_share_prepared_attrs(self):
+        compiled = get_compiled(
+            """<c-cache-icon name="check" :size="2" />|<c-cache-icon name="check" :size="2" />"""
+        )
+        first, second = component_nodes(Template(compiled))
+        other_first, _ = component_nodes(Template(compiled))
+
+        self.assertIsNot(first, second)
+        self.assertIs(first._prepared_attrs, second._prepared_attrs)
+        self.assertIs(first._prepared_attrs, other_first._prepared_attrs)
+        self.assertIs(first.active_library, second.active_library)
+
+    def test_different_tags_do_not_share_prepared_attrs(self):
+        compiled = get_compiled("""<c-cache-icon name="check" /><c-cache-icon name="cross" />""")
+        first, second = component_nodes(Template(compiled))
+
+        self.assertIsNot(first._prepared_attrs, second._prepared_attrs)
+        self.assertEqual(first._prepared_attrs[0].value, "check")
+        self.assertEqual(second._prepared_attrs[0].value, "cross")
+
+    def test_loaded_libraries_are_part_of_the_cache_key(self):
+        tag = """<c-cache-icon name="{{ 'x'|upper }}" />"""
+        without_load = component_nodes(Template(get_compiled(tag)))[0]
+        with_load = component_nodes(Template(get_compiled("{% load static %}" + tag)))[0]
+
+        self.assertIsNot(without_load._prepared_attrs, with_load._prepared_attrs)
+        self.assertIn("static", with_load.active_library.tags)
+        self.assertNotIn("static", without_load.active_library.tags)
+
+    def test_shared_nodes_render_independently(self):
+        self.create_template("cotton/cache_icon.html", "<i {{ attrs }}></i>")
+        compiled = get_compiled("""{% for n in items %}<c-cache-icon :size="n" />{% endfor %}""")
+
+        rendered = Template(compiled).render(Context({"items": [1, 2]}))
+
+        self.assertEqual(rendered, '<i size="1"></i><i size="2"></i>')
+
+    def test_shared_attrs_are_read_only(self):
+        first, second = component_nodes(
+            Template(get_compiled("""<c-cache-icon name="a" /><c-cache-icon name="a" />"""))
+        )
+
+        self.assertIs(first.attrs, second.attrs)
+        with self.assertRaises(TypeError):
+            first.attrs["name"] = '"b"'
+
+    def test_fingerprint_is_kept_until_a_load_adds_tags(self):
+        engine = Engine.get_default()
+        parser = Parser([], builtins=engine.template_builtins, libraries=engine.template_libraries)
+
+        fingerprint = parser_library_fingerprint(parser)
+        self.assertIs(parser_library_fingerprint(parser), fingerprint)
+
+        parser.add_library(engine.template_libraries["static"])
+        loaded = parser_library_fingerprint(parser)
+        self.assertIsNot(loaded, fingerprint)
+        self.assertIn("static", dict(loaded[0]))
+
+    def test_fingerprint_changes_when_a_load_only_overrides_tags(self):
+        engine = Engine.get_default()
+        parser = Parser([], builtins=engine.template_builtins, libraries=engine.template_libraries)
+
+        fingerprint = parser_library_fingerprint(parser)
+        parser.add_library(url_override)
+        overridden = parser_library_fingerprint(parser)
+
+        self.assertIsNot(overridden, fingerprint)
+        self.assertIs(dict(overridden[0])["url"], url_override.tags["url"])
+
+    def test_mid_template_load_of_an_overriding_library(self):
+        templates = copy.deepcopy(settings.TEMPLATES)
+        libraries = templates[0].setdefault("OPTIONS", {}).setdefault("libraries", {})
+        libraries["hosts_override"] = "django_cotton.tests.template_libraries.url_override"
+        compiled = get_compiled(
+            """<c-vars href="{% url 'x' %}" /><c-lnk href="{% url 'x' %}" />"""
+            """{% load hosts_override %}<c-lnk href="{% url 'x' %}" />"""
+        )
+
+        with self.settings(TEMPLATES=templates):
+            template = Template(compiled)
+            before, after = component_nodes(template)
+            (vars_node,) = template.nodelist.get_nodes_by_type(CottonVarsNode)
+
+            self.assertIsNot(before.active_library.tags["url"], url_override.tags["url"])
+            self.assertIsNot(vars_node.active_library.tags["url"], url_override.tags["url"])
+            self.assertIs(after.active_library.tags["url"], url_override.tags["url"])
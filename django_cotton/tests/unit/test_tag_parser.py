@@ -141,3 +141,20 @@ class TagParserTests(unittest.TestCase):
         self.assertEqual(result.attrs["label"], '"Hello"')  # Quoted
         self.assertEqual(result.attrs["enabled"], 'True')  # Unquoted
 
+    def test_parse_quoted_value_escapes_and_unclosed(self):
+        """Escaped quotes don't close the value; an unclosed value runs to the end"""
+        val, idx = _parse_quoted_value('a \\" b" rest', 0, '"')
+        self.assertEqual(val, '"a \\" b"')
+        self.assertEqual(idx, 7)
+
+        val, idx = _parse_quoted_value("never closed {{ x }}", 0, "'")
+        self.assertEqual(val, "'never closed {{ x }}")
+        self.assertEqual(idx, 20)
+
+    def test_parse_component_tag_long_nested_value(self):
+        """Long Alpine.js style values keep nested quotes inside {{ }} and {% %}"""
+        entry = "name: '{{ item|default:\"Guest\" }}', label: '{% trans \"Open\" %}', "
+        x_data = "{ " + entry * 200 + "}"
+        result = parse_component_tag(f'cotton dropdown x-data="{x_data}" disabled')
+        self.assertEqual(result.attrs["x-data"], f'"{x_data}"')
+        self.assertIs(result.attrs["disabled"], True)
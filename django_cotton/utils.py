@@ -1,5 +1,9 @@
 import ast
+import asyncio
+import functools
+import inspect
 
+from django.core.signals import setting_changed
 from django.utils.html import escape
 
 
@@ -41,6 +45,18 @@ def get_cotton_data(context):
     return context["cotton_data"]
 
 
+@functools.lru_cache(maxsize=256)
+def _get_component_wrapper_template(engine, component_name):
+    """Return the minimal template that renders component_name, compiled once per engine."""
+    from django.template import Template
+
+    # Build minimal template using :attrs to pass all attributes at once
+    # Note: Keep dots in component_name for folder nesting (e.g., "ui.button" -> cotton/ui/)
+    # Cotton's template tag handles the path resolution correctly
+    template_str = f'{{% cotton {component_name} :attrs="cotton_component_attrs" / %}}'
+    return Template(template_str, engine=engine)
+
+
 def render_component(request, component_name, context=None, **kwargs):
     """
     Render a Cotton component from a view with context values passed as attributes.
@@ -76,26 +92,209 @@ def render_component(request, component_name, context=None, **kwargs):
         # Mix dict and kwargs
         render_component(request, "user-card", {"user": user}, extra_class="highlight")
     """
-    from django.template import RequestContext, Template
+    template, ctx = _get_component_template_and_context(request, component_name, context, kwargs)
+    return template.render(ctx)
+
+
+def render_component_iter(request, component_name, context=None, **kwargs):
+    """
+    Render a Cotton component like render_component(), yielding the HTML in chunks.
+
+    Output is yielded at nested component boundaries and per {% for %} iteration as it is rendered,
+    so large components can be sent with StreamingHttpResponse without building the whole string in
+    memory first.
+
+    Example:
+        rows = render_component_iter(request, "reports.table", {"rows": rows})
+        return StreamingHttpResponse(rows)
+    """
+    from django_cotton.streaming import iter_template
+
+    template, ctx = _get_component_template_and_context(request, component_name, context, kwargs)
+    return iter_template(template, ctx)
+
+
+async def arender_component(request, component_name, context=None, **kwargs):
+    """
+    Async version of render_component() for ASGI views.
+
+    Awaitable attribute values (e.g. coroutines) are awaited and async iterables are collected into
+    lists, concurrently, before rendering. The template render itself, including loading the
+    component template, runs in a worker thread so it doesn't block the event loop: by default the
+    thread sync_to_async() picks (per request under Django's ASGI handler), or a bounded pool of
+    COTTON_ASYNC_RENDER_WORKERS threads if that setting is set.
+
+    Example:
+        async def user_card(request, id):
+            html = await arender_component(request, "user-card", user=User.objects.aget(id=id))
+            return HttpResponse(html)
+    """
+    context = await aresolve_values(_merge_component_context(context, kwargs))
+    return await render_in_thread(render_component)(request, component_name, context)
+
+
+def render_in_thread(func):
+    """Wrap a sync render function with sync_to_async, in the COTTON_ASYNC_RENDER_WORKERS pool."""
+    from asgiref.sync import sync_to_async
+
+    executor = _get_render_executor()
+    if executor is None:
+        return sync_to_async(func)
+    return sync_to_async(_closing_old_connections(func), thread_sensitive=False, executor=executor)
+
+
+def _closing_old_connections(func):
+    """Run func between close_old_connections() calls, as the request cycle does for its thread.
+
+    Components rendered in the pool can query the database from any of its threads. Without this,
+    each thread would keep its connection open, as Django only cleans them up at the end of requests
+    in their own thread.
+    """
+    from django.db import close_old_connections
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return wrapper
+
+
+async def aresolve_values(values):
+    """Return a copy of the dict with awaitables awaited and async iterables collected."""
+    pending = [
+        key
+        for key, value in values.items()
+        if inspect.isawaitable(value) or hasattr(value, "__aiter__")
+    ]
+    if not pending:
+        return values
+
+    resolved = await asyncio.gather(*(_aresolve_value(values[key]) for key in pending))
+    return {**values, **dict(zip(pending, resolved))}
+
+
+async def _aresolve_value(value):
+    if inspect.isawaitable(value):
+        return await value
+    return [item async for item in value]
+
 
+# Created on first use and kept for the life of the process, as threads are expensive to start. It's
+# replaced when COTTON_ASYNC_RENDER_WORKERS changes, see _reset_render_executor().
+_render_executor = None
+
+
+def _get_render_executor():
+    """Return the shared render thread pool, or None if COTTON_ASYNC_RENDER_WORKERS isn't set."""
+    global _render_executor
+    if _render_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        from django.conf import settings
+
+        max_workers = getattr(settings, "COTTON_ASYNC_RENDER_WORKERS", None)
+        if not max_workers:
+            return None
+        _render_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cotton-render"
+        )
+    return _render_executor
+
+
+def _reset_render_executor(setting, **kwargs):
+    global _render_executor
+    if setting == "COTTON_ASYNC_RENDER_WORKERS" and _render_executor is not None:
+        # Renders already submitted finish in the old pool
+        _render_executor.shutdown(wait=False)
+        _render_executor = None
+
+
+setting_changed.connect(_reset_render_executor)
+
+
+def _merge_component_context(context, kwargs):
     # Merge context dict and kwargs
     if context is None:
-        context = kwargs
+        return kwargs
     elif kwargs:
-        context = {**context, **kwargs}
-    else:
-        context = dict(context)  # Make a copy to avoid mutating original
+        return {**context, **kwargs}
+    return dict(context)  # Make a copy to avoid mutating original
 
-    # Build minimal template using :attrs to pass all attributes at once
-    # Note: Keep dots in component_name for folder nesting (e.g., "ui.button" -> cotton/ui/)
-    # Cotton's template tag handles the path resolution correctly
-    template_str = f'{{% cotton {component_name} :attrs="cotton_component_attrs" / %}}'
-    template = Template(template_str)
+
+def _get_component_template_and_context(request, component_name, context, kwargs):
+    from django.template import Engine, RequestContext
+
+    context = _merge_component_context(context, kwargs)
+
+    # The wrapper template is parsed once and reused, rather than lexed and parsed on every call
+    template = _get_component_wrapper_template(Engine.get_default(), component_name)
 
     # Prepare render context (keep original context plus our attrs dict)
     render_context = {**context, "cotton_component_attrs": context}
 
     # Create RequestContext (request is now always provided)
-    ctx = RequestContext(request, render_context)
+    return template, RequestContext(request, render_context)
 
-    return template.render(ctx)
+
+def render_components(request, component_name, contexts, **kwargs):
+    """
+    Render the same Cotton component once per context, e.g. for table rows in infinite scroll.
+
+    Equivalent to calling render_component() for each context, but the component template is
+    resolved and context processors are run once for the whole batch instead of once per item.
+
+    Args:
+        request: HttpRequest object
+        component_name: Component name, as for render_component()
+        contexts: Iterable of dictionaries, each passed to one component render as attributes
+        **kwargs: Attributes shared by every render, merged into each context
+
+    Returns:
+        List of rendered HTML strings, one per context
+
+    Example:
+        rows = render_components(request, "settings.user-row", ({"user": user} for user in users))
+        return HttpResponse("".join(rows))
+    """
+    return list(render_components_iter(request, component_name, contexts, **kwargs))
+
+
+def render_components_iter(request, component_name, contexts, **kwargs):
+    """
+    Like render_components(), but yields each rendered component as soon as it is ready.
+
+    Combined with StreamingHttpResponse, the first rows of a long list reach the client before the
+    rest are rendered, and only one row is held in memory at a time.
+
+    Example:
+        contexts = ({"user": user} for user in users)
+        rows = render_components_iter(request, "settings.user-row", contexts)
+        return StreamingHttpResponse(rows)
+    """
+    from django.template import Engine, RequestContext
+
+    template = _get_component_wrapper_template(Engine.get_default(), component_name)
+
+    ctx = RequestContext(request)
+    # The wrapper's component node caches its resolved template in the render context, for all items
+    node = template.nodelist[0]
+    template_cache = {}
+
+    # Binding the template runs the context processors once for the whole batch. Each item gets its
+    # own render_context state and cotton data, as with render_component(), so {% cycle %} and other
+    # render state doesn't carry over from one item to the next.
+    with ctx.bind_template(template):
+        ctx.template_name = template.name
+        for context in contexts:
+            context = {**context, **kwargs} if kwargs else dict(context)
+            item_context = {
+                **context,
+                "cotton_component_attrs": context,
+                "cotton_data": {"stack": [], "vars": {}},
+            }
+            with ctx.render_context.push_state(template), ctx.push(item_context):
+                ctx.render_context[node] = template_cache
+                yield template.nodelist.render(ctx)